@@ -0,0 +1,303 @@
+"""
+AssetExpl - Read-only JSON API
+Index list, compositions and risk profiles per language for other tools,
+served next to the Streamlit app (see server.py). Every response is
+serialized once and kept with its ETag, a hash of the body: a poll that sends
+the ETag back in If-None-Match gets a 304 without rebuilding or re-encoding
+anything. Entries are rebuilt only when their source data change.
+
+Endpoints (relative to /api/v1):
+    GET /languages
+    GET /{lang}/indices
+    GET /{lang}/indices/{index}/composition
+    GET /{lang}/indices/{index}/risk
+"""
+
+import hashlib
+import itertools
+import json
+import math
+import threading
+from typing import NamedTuple
+
+from composition_store import COMPOSITION_STORE, DIMENSIONS
+from holdings import HOLDINGS_STORE
+from locales import available_languages, language_name, load_locale
+from market_data import INDEX_TICKERS
+from prices import PRICE_STORE
+
+API_PREFIX = "/api/v1"
+# I client devono sempre rivalidare con If-None-Match: i dati cambiano con
+# prezzi e costituenti importati, e la risposta 304 non costa quasi nulla
+CACHE_CONTROL = "no-cache"
+
+
+class ApiResponse(NamedTuple):
+    """Risposta HTTP già serializzata"""
+    status: int
+    headers: dict
+    body: bytes
+
+
+class Entry(NamedTuple):
+    """Risposta 200 e relativa 304, create insieme alla serializzazione"""
+    ok: ApiResponse
+    not_modified: ApiResponse
+    etag: str
+
+
+def _json_default(value):
+    """Scalari e date numpy nei payload"""
+    if hasattr(value, "item"):
+        value = value.item()
+    return value if isinstance(value, (int, float)) else str(value)
+
+
+def _finite(value):
+    """NaN e infiniti non sono JSON valido: diventano null"""
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+def serialize(payload, status=200):
+    """Codifica il payload una volta sola e calcola l'ETag dal contenuto"""
+    body = json.dumps(
+        payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"),
+        default=_json_default
+    ).encode("utf-8")
+    etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+    common = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    return Entry(
+        ok=ApiResponse(status, {
+            **common,
+            "Content-Type": "application/json; charset=utf-8",
+            "Content-Length": str(len(body)),
+        }, body),
+        not_modified=ApiResponse(304, common, b""),
+        etag=etag,
+    )
+
+
+def etag_matches(if_none_match, etag):
+    """Confronto debole di If-None-Match (RFC 9110): elenco di tag o "*" """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+# ============================================================================
+# PAYLOAD
+# ============================================================================
+
+def languages_payload(languages):
+    return {
+        "languages": [{"code": lang, "name": language_name(lang)} for lang in languages]
+    }
+
+
+def indices_payload(lang):
+    content = load_locale(lang)
+    return {
+        "language": lang,
+        "indices": [
+            {
+                "id": key,
+                "name": content["indices"][key]["name"],
+                "ticker": INDEX_TICKERS.get(key),
+                "composition": f"{API_PREFIX}/{lang}/indices/{key}/composition",
+                "risk": f"{API_PREFIX}/{lang}/indices/{key}/risk",
+            }
+            for key in COMPOSITION_STORE.index_ids
+        ],
+    }
+
+
+def composition_payload(lang, index_key):
+    """Pesi percentuali per dimensione, dai costituenti importati se presenti
+    (come nei grafici dell'app), altrimenti dalla composizione pre-aggregata"""
+    content = load_locale(lang)
+    holdings = index_key in HOLDINGS_STORE.available()
+    payload = {
+        "language": lang,
+        "id": index_key,
+        "name": content["indices"][index_key]["name"],
+        "source": "holdings" if holdings else "composition",
+    }
+    for dimension in DIMENSIONS:
+        categories = COMPOSITION_STORE.categories(dimension)
+        names = dict(zip(categories, COMPOSITION_STORE.labels(lang, dimension)))
+        if holdings:
+            codes, weights = HOLDINGS_STORE.breakdown(index_key, dimension)
+        else:
+            positions, weights = COMPOSITION_STORE.entries(index_key, dimension)
+            codes = [categories[position] for position in positions]
+        payload[dimension] = [
+            {"category": code, "label": names.get(code, code), "weight": round(float(weight), 4)}
+            for code, weight in zip(codes, weights)
+        ]
+    return payload
+
+
+def risk_payload(lang, index_key):
+    """Profilo di rischio indicativo del bundle e, se c'è la serie storica,
+    le metriche calcolate dai prezzi"""
+    from risk_metrics import RISK_FREE_RATE, get_risk_engine
+
+    index_data = load_locale(lang)["indices"][index_key]
+    risk_engine = get_risk_engine()
+    metrics = risk_engine.metrics(index_key) if risk_engine else None
+    computed = None
+    if metrics is not None:
+        computed = {
+            name: _finite(metrics[name])
+            for name in ("volatility", "cagr", "max_drawdown", "sharpe", "sortino")
+        }
+        computed.update(
+            start=str(metrics["start"]), end=str(metrics["end"]), risk_free_rate=RISK_FREE_RATE
+        )
+    return {
+        "language": lang,
+        "id": index_key,
+        "name": index_data["name"],
+        "risk_profile": index_data["risk_profile"],
+        "computed": computed,
+    }
+
+
+# ============================================================================
+# API
+# ============================================================================
+
+class JsonApi:
+    """Risposte serializzate condivise da tutte le richieste del processo.
+
+    Ogni voce è salvata con le impronte dei dati da cui deriva (testi del
+    bundle, costituenti, serie storiche) e ricostruita solo se cambiano.
+    `get` è anche il client locale: non serve un server né la rete.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        # Ordine di arrivo delle costruzioni, per non sovrascrivere una voce
+        # più recente con una costruita da impronte lette prima
+        self._tickets = itertools.count()
+        self._not_found = serialize({"error": "not found"}, status=404)
+        # I bundle di lingua cambiano solo con un deploy: elencarli a ogni
+        # richiesta costerebbe più di tutto il resto di una risposta 304
+        self._languages = None
+        self.hits = 0
+        self.builds = 0
+        self.not_modified = 0
+
+    def _cached(self, key, sources, build):
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == sources:
+                self.hits += 1
+                return cached[2]
+            ticket = next(self._tickets)
+        # Costruzione fuori dal lock: nel frattempo una richiesta concorrente
+        # può aver salvato la stessa voce (stesse impronte, si riusa la sua)
+        # o una costruita da impronte lette dopo le nostre, che resta
+        entry = serialize(build())
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == sources:
+                return cached[2]
+            if cached is None or cached[1] < ticket:
+                self._entries[key] = (sources, ticket, entry)
+            self.builds += 1
+        return entry
+
+    def languages(self):
+        """Lingue disponibili, lette dal disco alla prima richiesta"""
+        if self._languages is None:
+            self._languages = tuple(available_languages())
+        return self._languages
+
+    def resource(self, path):
+        """Voce della risorsa indicata dal percorso relativo a API_PREFIX, o None"""
+        parts = [part for part in path.split("/") if part]
+        if parts == ["languages"]:
+            return self._cached(("languages",), (), lambda: languages_payload(self.languages()))
+        if len(parts) < 2 or parts[0] not in self.languages() or parts[1] != "indices":
+            return None
+
+        lang = parts[0]
+        content = load_locale(lang)
+        if len(parts) == 2:
+            names = tuple(content["indices"][key]["name"] for key in COMPOSITION_STORE.index_ids)
+            return self._cached(("indices", lang), names, lambda: indices_payload(lang))
+
+        if len(parts) != 4 or parts[2] not in COMPOSITION_STORE.index_ids:
+            return None
+        index_key, kind = parts[2], parts[3]
+        name = content["indices"][index_key]["name"]
+        if kind == "composition":
+            return self._cached(
+                ("composition", lang, index_key),
+                (name, HOLDINGS_STORE.fingerprint(index_key)),
+                lambda: composition_payload(lang, index_key)
+            )
+        if kind == "risk":
+            risk_profile = content["indices"][index_key]["risk_profile"]
+            return self._cached(
+                ("risk", lang, index_key),
+                (name, tuple(risk_profile.items()), PRICE_STORE.fingerprint([index_key])),
+                lambda: risk_payload(lang, index_key)
+            )
+        return None
+
+    def get(self, path, if_none_match=None):
+        """Risposta a una GET: 200 col corpo, 304 se l'ETag coincide, 404"""
+        entry = self.resource(path)
+        if entry is None:
+            return self._not_found.ok
+        if etag_matches(if_none_match, entry.etag):
+            with self._lock:
+                self.not_modified += 1
+            return entry.not_modified
+        return entry.ok
+
+    def warm_up(self, languages=None, index_keys=None):
+        """Serializza in anticipo tutte le risposte"""
+        self.resource("languages")
+        for lang in languages or self.languages():
+            self.resource(f"{lang}/indices")
+            for index_key in index_keys or COMPOSITION_STORE.index_ids:
+                for kind in ("composition", "risk"):
+                    self.resource(f"{lang}/indices/{index_key}/{kind}")
+
+    def stats(self):
+        """Voci, hit, costruzioni e risposte 304 del processo"""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "builds": self.builds,
+                "not_modified": self.not_modified,
+            }
+
+    def routes(self):
+        """Route Starlette da passare a st.App (vedi server.py)"""
+        from starlette.responses import Response
+        from starlette.routing import Route
+
+        # Endpoint sincrono: Starlette lo esegue nel suo pool di thread, così
+        # la prima costruzione di una voce non blocca l'event loop del server
+        def endpoint(request):
+            response = self.get(
+                request.path_params["path"], request.headers.get("if-none-match")
+            )
+            return Response(response.body, response.status, response.headers)
+
+        return [Route(API_PREFIX + "/{path:path}", endpoint, methods=["GET"])]
+
+
+# Istanza unica per processo
+API = JsonApi()
@@ -4,10 +4,29 @@ Educational app for exploring ETF indices with multilingual support
 Version 2.0 - Extended with 8 major indices
 """
 
+import os
+
+import numpy as np
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
+
+from comparator import subset_overlap
+from composition_store import COMPOSITION_STORE, PIE_COLORS
+from figure_cache import FIGURE_CACHE, HISTORY_CACHE, graph_objects
+from holdings import HOLDINGS_STORE
+from locales import (
+    DEFAULT_LANGUAGE, available_languages, language_name, load_locale
+)
+from markdown_cache import MARKDOWN_CACHE
+from market_data import INDEX_TICKERS, MARKET_DATA
+from model_portfolios import get_model_backtest, model_portfolios, precompute
+from monte_carlo import DEFAULT_PATHS, horizon_years, iter_projection
+from optimizer import get_optimizer
+from pac import DEFAULT_CONTRIBUTION, DEFAULT_YEARS, backtest_all
+from portfolio import exposure_breakdown
+from prices import PRICE_STORE
+from rebalancing import DEFAULT_COST, grid_search
+from risk_metrics import get_risk_engine, risk_metric_rows, risk_metrics_caption
+from session_memory import process_rss, session_report, shared_report
 
 # ============================================================================
 # CONFIGURAZIONE PAGINA
@@ -20,1305 +39,41 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# ============================================================================
-# CONTENUTI MULTILINGUA
-# ============================================================================
+# Con le tab lazy viene eseguito solo il contenuto della tab visibile;
+# ASSETEXPL_LAZY_TABS=0 ripristina l'esecuzione di tutte le tab a ogni rerun
+LAZY_TABS = os.environ.get("ASSETEXPL_LAZY_TABS", "1") != "0"
 
-CONTENT = {
-    "it": {
-        "app_title": "📊 AssetExpl - Esploratore ETF",
-        "app_subtitle": "Esplora i principali indici ETF globali con dati interattivi",
-        "sidebar_title": "⚙️ Impostazioni",
-        "language_label": "Lingua",
-        "select_index": "Seleziona Indice",
-        "tabs": {
-            "description": "📄 Descrizione",
-            "statistics": "📈 Statistiche",
-            "strategy": "🎯 Strategia d'Uso"
-        },
-        "indices": {
-            "msci_world": {
-                "name": "MSCI World",
-                "description": """
-                ### MSCI World Index
-                
-                L'**MSCI World Index** è un indice azionario globale che rappresenta le large e mid-cap 
-                di 23 paesi sviluppati. Copre circa l'85% del mercato azionario capitalizzato in ciascun paese.
-                
-                #### Caratteristiche Principali:
-                - **Copertura**: 23 mercati sviluppati
-                - **Numero titoli**: ~1,500 azioni
-                - **Capitalizzazione**: Large e Mid-cap
-                - **Benchmark**: Standard per portafogli globali diversificati
-                
-                #### Perché sceglierlo:
-                L'MSCI World è ideale per investitori che cercano un'esposizione diversificata ai mercati 
-                sviluppati globali, con una forte presenza del mercato statunitense (~70%) ma anche 
-                significativa esposizione a Europa e Asia-Pacifico.
-                """,
-                "risk_profile": {
-                    "risk_level": "Medio-Alto",
-                    "volatility": "15-20% annua",
-                    "time_horizon": "7-10+ anni",
-                    "return_potential": "7-9% annuo storico"
-                },
-                "composition": {
-                    "geographic": {
-                        "USA": 70.5,
-                        "Giappone": 6.2,
-                        "Regno Unito": 4.1,
-                        "Francia": 3.4,
-                        "Canada": 3.2,
-                        "Svizzera": 2.8,
-                        "Germania": 2.5,
-                        "Australia": 2.1,
-                        "Altri": 5.2
-                    },
-                    "sectors": {
-                        "Tecnologia": 23.5,
-                        "Finanza": 14.8,
-                        "Salute": 12.3,
-                        "Beni Ciclici": 11.2,
-                        "Industria": 10.5,
-                        "Beni di Consumo": 7.8,
-                        "Energia": 4.9,
-                        "Utilities": 3.2,
-                        "Materiali": 4.1,
-                        "Altri": 7.7
-                    }
-                },
-                "strategy": """
-                ### Come Utilizzare MSCI World nel tuo Portfolio
-                
-                #### 🎯 Strategia Core
-                - **Portafoglio Base**: Usa MSCI World come asset principale (50-70% del portfolio)
-                - **Ribilanciamento**: Annuale o semestrale
-                - **Accumulo**: Piano di accumulo mensile (PAC) per ridurre il rischio timing
-                
-                #### ⚖️ Combinazioni Efficaci
-                - **MSCI World (70%) + Obbligazioni (30%)**: Portfolio bilanciato moderato
-                - **MSCI World (60%) + Emerging Markets (20%) + Obbligazioni (20%)**: Crescita con diversificazione
-                - **MSCI World (80%) + Small Cap (20%)**: Aggressivo orientato all'equity
-                
-                #### ⚠️ Considerazioni
-                - Alta esposizione USA (~70%) - considera diversificazione geografica aggiuntiva
-                - Non include mercati emergenti - valuta integrazione con MSCI EM
-                - Esclude small-cap - opportunità di rendimenti superiori escluse
-                """
-            },
-            "sp500": {
-                "name": "S&P 500",
-                "description": """
-                ### S&P 500 Index
-                
-                Lo **S&P 500** è l'indice più seguito al mondo, rappresentando le 500 maggiori aziende 
-                quotate negli Stati Uniti. È considerato il miglior indicatore della performance 
-                del mercato azionario americano.
-                
-                #### Caratteristiche Principali:
-                - **Copertura**: Mercato USA
-                - **Numero titoli**: 500 azioni
-                - **Capitalizzazione**: Large-cap
-                - **Benchmark**: Standard per il mercato azionario USA
-                
-                #### Perché sceglierlo:
-                L'S&P 500 offre esposizione alle più grandi e consolidate aziende americane, 
-                inclusi giganti tecnologici come Apple, Microsoft, Amazon. Storicamente ha 
-                fornito rendimenti medi del 10% annuo nel lungo periodo.
-                """,
-                "risk_profile": {
-                    "risk_level": "Medio-Alto",
-                    "volatility": "15-18% annua",
-                    "time_horizon": "5-10+ anni",
-                    "return_potential": "9-11% annuo storico"
-                },
-                "composition": {
-                    "geographic": {
-                        "USA": 100.0
-                    },
-                    "sectors": {
-                        "Tecnologia": 29.3,
-                        "Salute": 13.2,
-                        "Finanza": 12.8,
-                        "Beni Ciclici": 10.9,
-                        "Servizi Comunicazione": 8.7,
-                        "Industria": 8.4,
-                        "Beni di Consumo": 6.1,
-                        "Energia": 3.8,
-                        "Utilities": 2.5,
-                        "Materiali": 2.4,
-                        "Immobiliare": 2.0
-                    }
-                },
-                "strategy": """
-                ### Come Utilizzare S&P 500 nel tuo Portfolio
-                
-                #### 🎯 Strategia Core USA
-                - **Esposizione USA**: Ideale per chi crede nel mercato americano
-                - **Investimento Long-Term**: Buy and hold per 10+ anni
-                - **Dollar Cost Averaging**: Investimenti mensili per mediare i prezzi
-                
-                #### ⚖️ Combinazioni Efficaci
-                - **S&P 500 (60%) + International (30%) + Bonds (10%)**: Globale con focus USA
-                - **S&P 500 (50%) + Nasdaq 100 (20%) + Bonds (30%)**: Tech-heavy moderato
-                - **S&P 500 (70%) + REIT (15%) + Gold (15%)**: Diversificazione asset class
-                
-                #### ⚠️ Considerazioni
-                - Concentrazione geografica al 100% USA - rischio paese
-                - Alta esposizione tech (~30%) - volatile ma ad alto potenziale
-                - Dominanza di mega-cap - poche opportunità small/mid cap
-                - Sensibile a tassi Fed e politiche USA
-                """
-            },
-            "msci_em": {
-                "name": "MSCI Emerging Markets",
-                "description": """
-                ### MSCI Emerging Markets Index
-                
-                L'**MSCI Emerging Markets Index** cattura le large e mid-cap di 24 paesi emergenti, 
-                rappresentando circa l'85% della capitalizzazione di mercato in ciascun paese.
-                
-                #### Caratteristiche Principali:
-                - **Copertura**: 24 mercati emergenti
-                - **Numero titoli**: ~1,400 azioni
-                - **Capitalizzazione**: Large e Mid-cap
-                - **Benchmark**: Standard per mercati emergenti
-                
-                #### Perché sceglierlo:
-                Offre esposizione a economie in rapida crescita come Cina, India, Taiwan, Brasile. 
-                Maggiore potenziale di crescita rispetto ai mercati sviluppati ma con volatilità 
-                più elevata. Essenziale per diversificazione geografica.
-                """,
-                "risk_profile": {
-                    "risk_level": "Alto",
-                    "volatility": "20-25% annua",
-                    "time_horizon": "10+ anni",
-                    "return_potential": "8-12% annuo storico (alta variabilità)"
-                },
-                "composition": {
-                    "geographic": {
-                        "Cina": 28.5,
-                        "Taiwan": 16.8,
-                        "India": 18.2,
-                        "Corea del Sud": 11.4,
-                        "Brasile": 5.1,
-                        "Arabia Saudita": 3.8,
-                        "Sud Africa": 3.2,
-                        "Messico": 2.4,
-                        "Tailandia": 2.1,
-                        "Altri": 8.5
-                    },
-                    "sectors": {
-                        "Tecnologia": 21.4,
-                        "Finanza": 20.3,
-                        "Beni Ciclici": 13.8,
-                        "Servizi Comunicazione": 9.7,
-                        "Materiali": 8.2,
-                        "Energia": 6.8,
-                        "Industria": 6.1,
-                        "Beni di Consumo": 5.9,
-                        "Salute": 4.2,
-                        "Utilities": 2.4,
-                        "Altri": 1.2
-                    }
-                },
-                "strategy": """
-                ### Come Utilizzare MSCI EM nel tuo Portfolio
-                
-                #### 🎯 Strategia Satellite
-                - **Allocazione**: 10-30% del portfolio equity
-                - **Complemento**: Affianca MSCI World o S&P 500
-                - **Pazienza**: Richiede orizzonte temporale lungo (10+ anni)
-                
-                #### ⚖️ Combinazioni Efficaci
-                - **MSCI World (70%) + MSCI EM (20%) + Bonds (10%)**: Globale completo
-                - **S&P 500 (60%) + MSCI EM (30%) + REIT (10%)**: Crescita aggressiva
-                - **MSCI World (50%) + MSCI EM (25%) + Bonds (25%)**: Bilanciato globale
-                
-                #### ⚠️ Considerazioni
-                - **Alta volatilità**: Oscillazioni anche >30% annue
-                - **Rischio politico**: Instabilità in alcuni paesi emergenti
-                - **Rischio valutario**: Esposizione a monete volatili
-                - **Concentrazione Asia**: ~75% in mercati asiatici
-                - **Opportunità**: Crescita demografica e espansione classe media
-                """
-            },
-            "msci_acwi": {
-                "name": "MSCI ACWI",
-                "description": """
-                ### MSCI All Country World Index (ACWI)
-                
-                L'**MSCI ACWI** è l'indice più completo per l'equity globale, combinando mercati 
-                sviluppati ed emergenti. Rappresenta il 99% dell'opportunità di investimento 
-                azionario globale.
-                
-                #### Caratteristiche Principali:
-                - **Copertura**: 23 mercati sviluppati + 24 mercati emergenti
-                - **Numero titoli**: ~3,000 azioni
-                - **Capitalizzazione**: Large e Mid-cap
-                - **Benchmark**: Il più completo indice azionario globale
-                
-                #### Perché sceglierlo:
-                L'MSCI ACWI è la soluzione "one-stop-shop" per l'equity globale. Con una singola 
-                posizione ottieni esposizione bilanciata a mercati sviluppati (~85%) ed emergenti 
-                (~15%), eliminando la necessità di combinare più indici.
-                """,
-                "risk_profile": {
-                    "risk_level": "Medio-Alto",
-                    "volatility": "16-21% annua",
-                    "time_horizon": "7-10+ anni",
-                    "return_potential": "7-10% annuo storico"
-                },
-                "composition": {
-                    "geographic": {
-                        "USA": 62.3,
-                        "Giappone": 5.4,
-                        "Regno Unito": 3.6,
-                        "Cina": 3.2,
-                        "Francia": 3.0,
-                        "Canada": 2.8,
-                        "India": 2.1,
-                        "Taiwan": 1.9,
-                        "Svizzera": 2.4,
-                        "Altri": 13.3
-                    },
-                    "sectors": {
-                        "Tecnologia": 23.8,
-                        "Finanza": 15.6,
-                        "Salute": 11.9,
-                        "Beni Ciclici": 11.5,
-                        "Industria": 10.2,
-                        "Beni di Consumo": 7.4,
-                        "Servizi Comunicazione": 7.1,
-                        "Energia": 4.7,
-                        "Materiali": 4.3,
-                        "Altri": 3.5
-                    }
-                },
-                "strategy": """
-                ### Come Utilizzare MSCI ACWI nel tuo Portfolio
-                
-                #### 🎯 Strategia "All-in-One"
-                - **Portafoglio Semplificato**: MSCI ACWI come unico ETF equity (60-100%)
-                - **Gestione Passiva**: Perfetto per approccio "set and forget"
-                - **Ribilanciamento Automatico**: L'indice si aggiusta automaticamente tra DM e EM
-                
-                #### ⚖️ Combinazioni Efficaci
-                - **MSCI ACWI (80%) + Obbligazioni (20%)**: Portfolio globale semplice
-                - **MSCI ACWI (70%) + Obbligazioni (25%) + Oro (5%)**: Protezione inflazione
-                - **MSCI ACWI (90%) + Small Cap (10%)**: Massima equity exposure
-                
-                #### ⚠️ Considerazioni
-                - **Vantaggio principale**: Massima diversificazione in un solo ETF
-                - **Esposizione USA**: Ancora dominante (~62%)
-                - **EM inclusi**: Non serve combinare con MSCI EM
-                - **TER leggermente superiore**: Rispetto a MSCI World per via degli EM
-                - **Ideale per principianti**: Semplicità gestionale massima
-                """
-            },
-            "ftse_all_world": {
-                "name": "FTSE All-World",
-                "description": """
-                ### FTSE All-World Index
-                
-                Il **FTSE All-World Index** è l'alternativa di FTSE all'MSCI ACWI, offrendo 
-                esposizione completa a mercati sviluppati ed emergenti con una copertura ancora 
-                più ampia.
-                
-                #### Caratteristiche Principali:
-                - **Copertura**: 49 paesi (25 sviluppati + 24 emergenti)
-                - **Numero titoli**: ~4,000 azioni
-                - **Capitalizzazione**: Large, Mid e Small-cap
-                - **Benchmark**: Alternativa completa all'MSCI ACWI
-                
-                #### Perché sceglierlo:
-                FTSE All-World include anche le small-cap, offrendo una copertura del 98% del 
-                mercato azionario globale investibile. È la scelta preferita per chi cerca la 
-                massima diversificazione possibile in un singolo strumento.
-                """,
-                "risk_profile": {
-                    "risk_level": "Medio-Alto",
-                    "volatility": "16-22% annua",
-                    "time_horizon": "7-10+ anni",
-                    "return_potential": "7-10% annuo storico"
-                },
-                "composition": {
-                    "geographic": {
-                        "USA": 61.8,
-                        "Giappone": 5.6,
-                        "Regno Unito": 3.8,
-                        "Cina": 3.4,
-                        "Canada": 3.1,
-                        "Francia": 2.9,
-                        "Svizzera": 2.5,
-                        "Germania": 2.3,
-                        "India": 2.2,
-                        "Taiwan": 1.9,
-                        "Altri": 10.5
-                    },
-                    "sectors": {
-                        "Tecnologia": 24.1,
-                        "Finanza": 15.3,
-                        "Beni Ciclici": 11.8,
-                        "Salute": 11.6,
-                        "Industria": 10.4,
-                        "Beni di Consumo": 7.2,
-                        "Servizi Comunicazione": 6.9,
-                        "Energia": 4.6,
-                        "Materiali": 4.2,
-                        "Altri": 3.9
-                    }
-                },
-                "strategy": """
-                ### Come Utilizzare FTSE All-World nel tuo Portfolio
-                
-                #### 🎯 Strategia Massima Diversificazione
-                - **Portfolio Completo**: FTSE All-World come unico ETF equity necessario
-                - **Inclusione Small-Cap**: Cattura opportunità anche in aziende più piccole
-                - **Buy & Hold**: Ideale per investitori passivi a lungo termine
-                
-                #### ⚖️ Combinazioni Efficaci
-                - **FTSE All-World (80%) + Obbligazioni Globali (20%)**: Semplicità massima
-                - **FTSE All-World (70%) + Bonds (20%) + Oro (10%)**: Portfolio resiliente
-                - **FTSE All-World (100%)**: Opzione 100% equity per profili aggressivi
-                
-                #### ⚠️ Considerazioni
-                - **Copertura superiore**: Include small-cap (vs MSCI ACWI)
-                - **4,000+ titoli**: Massima diversificazione disponibile
-                - **Alternativa MSCI**: Metodologia leggermente diversa ma risultati simili
-                - **Liquidità ETF**: Verificare gli spread bid-ask
-                - **Perfetto per "Lazy Portfolio"**: Soluzione completa in un solo ETF
-                """
-            },
-            "solactive_str": {
-                "name": "Solactive €STR +8.5bp Daily",
-                "description": """
-                ### Solactive €STR +8.5 basis points Daily Index
-                
-                Il **Solactive €STR +8.5bp Daily** è un indice benchmark per ETF monetari che 
-                replicano il tasso overnight dell'Eurozona (€STR) con un piccolo spread positivo. 
-                Utilizzato in ETF come **Xtrackers EUR Overnight Rate Swap (XEON)**.
-                
-                #### Caratteristiche Principali:
-                - **Benchmark**: €STR + 8.5 basis points (0.085%)
-                - **Tipo**: Indice money market overnight
-                - **Uso**: ETF monetari per cash management
-                - **Liquidità**: Giornaliera (T+2)
-                
-                #### Perché sceglierlo:
-                Ideale per parcheggiare liquidità a breve termine con rendimenti superiori al 
-                conto corrente tradizionale. Gli ETF che seguono questo indice (come XEON) offrono 
-                un'alternativa efficiente ai conti deposito con maggiore flessibilità e costi 
-                contenuti (TER tipico: 0.10-0.15%).
-                
-                #### ETF Popolari:
-                - **XEON** - Xtrackers EUR Overnight Rate Swap UCITS ETF
-                - Ideale per tesoreria aziendale e gestione liquidità personale
-                """,
-                "risk_profile": {
-                    "risk_level": "Molto Basso",
-                    "volatility": "Quasi nulla (<0.5% annua)",
-                    "time_horizon": "Breve termine (giorni/mesi)",
-                    "return_potential": "€STR + 0.085% (≈3.2-3.3% con €STR ≈3.15%)"
-                },
-                "composition": {
-                    "geographic": {
-                        "Eurozona": 100.0
-                    },
-                    "sectors": {
-                        "Overnight Rate Swaps": 70.0,
-                        "Money Market": 20.0,
-                        "Cash Collateral": 10.0
-                    }
-                },
-                "strategy": """
-                ### Come Utilizzare ETF €STR nel Portfolio
-                
-                #### 🎯 Cash Management Efficiente
-                - **Parcheggio liquidità**: Alternativa a conti correnti/deposito
-                - **Flessibilità**: Liquidabile in T+2 (vs vincoli depositi)
-                - **Rendimento**: €STR + spread (attualmente ≈3.2-3.3%)
-                
-                #### 💰 Confronto con Alternative (Dicembre 2024)
-                
-                **ETF Overnight (es. XEON)**:
-                - Rendimento: ≈3.2-3.3% lordo
-                - TER: 0.10-0.15%
-                - Liquidità: T+2
-                - Flessibilità: Alta
-                
-                **Conto Deposito Vincolato**:
-                - Rendimento: 3.0-3.8% lordo
-                - Costi: 0%
-                - Liquidità: Vincolato (3-12 mesi)
-                - Flessibilità: Bassa
-                
-                **Conto Corrente**:
-                - Rendimento: 0-0.5%
-                - Costi: Spesso canone mensile
-                - Liquidità: Immediata
-                - Flessibilità: Massima
-                
-                #### ⚖️ Quando Usare ETF €STR
-                
-                ✅ **IDEALE per**:
-                - Liquidità operativa (3-12 mesi) che vuoi remunerare
-                - Tesoreria aziendale
-                - Emergency fund con rendimento
-                - Transizione tra investimenti
-                - Alternativa a depositi non vincolati
-                
-                ❌ **NON ideale per**:
-                - Investimenti long-term (usa equity/obbligazioni)
-                - Liquidità <1 mese (troppo breve)
-                - Chi cerca massimo rendimento (vincolato rende di più)
-                
-                #### 📊 Strategia Pratica
-                
-                **Portfolio Bilanciato con Cash Buffer**:
-                - 60% MSCI World
-                - 30% Obbligazioni
-                - **10% ETF €STR** (liquidità di emergenza remunerata)
-                
-                **Gestione Liquidità Personale**:
-                - Spese correnti (1-2 mesi): Conto corrente
-                - **Emergency fund (3-6 mesi): ETF €STR**
-                - Investimenti LT: Equity/Bond ETF
-                
-                #### 💡 Vantaggi vs Svantaggi
-                
-                **Vantaggi**:
-                - ✅ Rendimento competitivo vs conti correnti
-                - ✅ Flessibilità (no vincoli temporali)
-                - ✅ Costi bassi (TER 0.10-0.15%)
-                - ✅ Liquidità alta (T+2)
-                - ✅ Segue automaticamente i tassi BCE
-                
-                **Svantaggi**:
-                - ⚠️ Rendimento inferiore a depositi vincolati lunghi
-                - ⚠️ Non immediato come conto corrente (T+2)
-                - ⚠️ Richiede broker/conto titoli
-                - ⚠️ Tassazione 26% su capital gains
-                
-                #### 🎓 Conclusione
-                
-                Gli ETF overnight €STR sono strumenti **legittimi ed efficienti** per cash 
-                management. Con TER dello 0.10-0.15%, offrono un buon compromesso tra 
-                rendimento, flessibilità e costi per chi vuole remunerare la liquidità 
-                senza vincoli temporali rigidi.
-                """
-            },
-            "msci_europe": {
-                "name": "MSCI Europe",
-                "description": """
-                ### MSCI Europe Index
-                
-                L'**MSCI Europe Index** rappresenta le large e mid-cap di 15 paesi europei 
-                sviluppati, offrendo esposizione concentrata al mercato azionario europeo.
-                
-                #### Caratteristiche Principali:
-                - **Copertura**: 15 paesi europei sviluppati
-                - **Numero titoli**: ~430 azioni
-                - **Capitalizzazione**: Large e Mid-cap
-                - **Benchmark**: Standard per equity europea
-                
-                #### Perché sceglierlo:
-                MSCI Europe è ideale per chi vuole esposizione all'Europa sviluppata, includendo 
-                sia paesi dell'Eurozona che UK, Svizzera, e paesi nordici. Offre accesso a 
-                leader globali in settori come lusso, farmaceutico, automotive e finanziario.
-                """,
-                "risk_profile": {
-                    "risk_level": "Medio",
-                    "volatility": "14-19% annua",
-                    "time_horizon": "7-10+ anni",
-                    "return_potential": "6-8% annuo storico"
-                },
-                "composition": {
-                    "geographic": {
-                        "Regno Unito": 23.5,
-                        "Francia": 19.2,
-                        "Svizzera": 16.8,
-                        "Germania": 14.3,
-                        "Paesi Bassi": 7.2,
-                        "Svezia": 5.8,
-                        "Danimarca": 4.1,
-                        "Spagna": 3.9,
-                        "Italia": 3.2,
-                        "Altri": 2.0
-                    },
-                    "sectors": {
-                        "Finanza": 18.4,
-                        "Salute": 16.2,
-                        "Industria": 14.8,
-                        "Beni Ciclici": 12.1,
-                        "Beni di Consumo": 10.9,
-                        "Tecnologia": 8.3,
-                        "Energia": 6.7,
-                        "Materiali": 5.9,
-                        "Utilities": 4.2,
-                        "Altri": 2.5
-                    }
-                },
-                "strategy": """
-                ### Come Utilizzare MSCI Europe nel tuo Portfolio
-                
-                #### 🎯 Strategia Regional Focus
-                - **Esposizione Europa**: Ideale per ridurre dipendenza USA
-                - **Diversificazione Geografica**: Complementa S&P 500 o Nasdaq
-                - **Valutazioni Attraenti**: Storicamente più economico rispetto a USA
-                
-                #### ⚖️ Combinazioni Efficaci
-                - **S&P 500 (50%) + MSCI Europe (30%) + MSCI EM (20%)**: Globale bilanciato
-                - **MSCI Europe (60%) + MSCI USA (30%) + Bonds (10%)**: Riduzione home bias USA
-                - **MSCI Europe (40%) + MSCI World (40%) + Bonds (20%)**: Tilt europeo
-                
-                #### ⚠️ Considerazioni
-                - **Crescita inferiore a USA**: Storicamente rendimenti più bassi
-                - **Include UK**: Circa 24% in aziende britanniche
-                - **Focus Value**: Meno tech, più finanza e industria
-                - **Diversificazione valutaria**: Esposizione GBP, CHF, EUR
-                - **Opportunità**: Valutazioni più basse possono offrire potenziale upside
-                """
-            },
-            "msci_emu": {
-                "name": "MSCI EMU",
-                "description": """
-                ### MSCI EMU Index (European Monetary Union)
-                
-                L'**MSCI EMU Index** rappresenta le large e mid-cap dei paesi dell'Eurozona, 
-                offrendo esposizione pura ai mercati che utilizzano l'Euro come valuta.
-                
-                #### Caratteristiche Principali:
-                - **Copertura**: 10 paesi dell'Eurozona
-                - **Numero titoli**: ~240 azioni
-                - **Capitalizzazione**: Large e Mid-cap
-                - **Benchmark**: Standard per equity Eurozona
-                
-                #### Perché sceglierlo:
-                MSCI EMU elimina il rischio valutario per investitori europei, concentrandosi 
-                esclusivamente su paesi che usano l'Euro. Ideale per chi vuole esposizione 
-                all'Eurozona senza l'influenza di UK e Svizzera.
-                """,
-                "risk_profile": {
-                    "risk_level": "Medio",
-                    "volatility": "15-20% annua",
-                    "time_horizon": "7-10+ anni",
-                    "return_potential": "5-8% annuo storico"
-                },
-                "composition": {
-                    "geographic": {
-                        "Francia": 35.8,
-                        "Germania": 27.2,
-                        "Paesi Bassi": 13.4,
-                        "Spagna": 8.9,
-                        "Italia": 7.6,
-                        "Irlanda": 3.2,
-                        "Belgio": 2.1,
-                        "Finlandia": 1.2,
-                        "Altri": 0.6
-                    },
-                    "sectors": {
-                        "Finanza": 17.8,
-                        "Industria": 16.4,
-                        "Salute": 14.2,
-                        "Beni Ciclici": 13.6,
-                        "Beni di Consumo": 11.8,
-                        "Tecnologia": 9.3,
-                        "Energia": 5.9,
-                        "Materiali": 5.7,
-                        "Utilities": 3.8,
-                        "Altri": 1.5
-                    }
-                },
-                "strategy": """
-                ### Come Utilizzare MSCI EMU nel tuo Portfolio
-                
-                #### 🎯 Strategia Eurozona
-                - **No Rischio Cambio**: Ideale per investitori italiani/europei
-                - **Home Region Bias**: Investire nella propria area geografica
-                - **Accumulo EUR**: Esposizione 100% in Euro
-                
-                #### ⚖️ Combinazioni Efficaci
-                - **MSCI EMU (40%) + S&P 500 (40%) + Bonds EUR (20%)**: Bilanciato EUR-USA
-                - **MSCI EMU (60%) + MSCI World ex-EMU (30%) + Bonds (10%)**: Tilt Eurozona
-                - **MSCI EMU (50%) + MSCI EM (20%) + Bonds (30%)**: Diversificazione completa
-                
-                #### ⚠️ Considerazioni
-                - **Esclude UK e Svizzera**: Elimina 2 dei maggiori mercati europei
-                - **Concentrazione Francia-Germania**: ~63% del peso totale
-                - **Meno tech**: Sottopesato in tecnologia rispetto a indici globali
-                - **Rischio politico UE**: Esposto a dinamiche politiche dell'Eurozona
-                - **Per investitori EUR**: Elimina rischio cambio ma riduce diversificazione
-                - **Valutazioni**: Generalmente più convenienti rispetto a mercati USA
-                """
-            }
-        },
-        "metrics_labels": {
-            "risk": "Livello di Rischio",
-            "volatility": "Volatilità",
-            "horizon": "Orizzonte Temporale",
-            "returns": "Rendimento Atteso"
-        },
-        "chart_titles": {
-            "geographic": "Composizione Geografica",
-            "sectors": "Composizione Settoriale"
-        }
-    },
-    "en": {
-        "app_title": "📊 AssetExpl - ETF Explorer",
-        "app_subtitle": "Explore major global ETF indices with interactive data",
-        "sidebar_title": "⚙️ Settings",
-        "language_label": "Language",
-        "select_index": "Select Index",
-        "tabs": {
-            "description": "📄 Description",
-            "statistics": "📈 Statistics",
-            "strategy": "🎯 Usage Strategy"
-        },
-        "indices": {
-            "msci_world": {
-                "name": "MSCI World",
-                "description": """
-                ### MSCI World Index
-                
-                The **MSCI World Index** is a global equity index representing large and mid-cap 
-                stocks from 23 developed countries. It covers approximately 85% of the free 
-                float-adjusted market capitalization in each country.
-                
-                #### Key Features:
-                - **Coverage**: 23 developed markets
-                - **Number of stocks**: ~1,500 companies
-                - **Capitalization**: Large and Mid-cap
-                - **Benchmark**: Standard for global diversified portfolios
-                
-                #### Why choose it:
-                MSCI World is ideal for investors seeking diversified exposure to global developed 
-                markets, with strong US market presence (~70%) but also significant exposure to 
-                Europe and Asia-Pacific.
-                """,
-                "risk_profile": {
-                    "risk_level": "Medium-High",
-                    "volatility": "15-20% annual",
-                    "time_horizon": "7-10+ years",
-                    "return_potential": "7-9% historical annual"
-                },
-                "composition": {
-                    "geographic": {
-                        "USA": 70.5,
-                        "Japan": 6.2,
-                        "United Kingdom": 4.1,
-                        "France": 3.4,
-                        "Canada": 3.2,
-                        "Switzerland": 2.8,
-                        "Germany": 2.5,
-                        "Australia": 2.1,
-                        "Others": 5.2
-                    },
-                    "sectors": {
-                        "Technology": 23.5,
-                        "Finance": 14.8,
-                        "Healthcare": 12.3,
-                        "Consumer Cyclical": 11.2,
-                        "Industrials": 10.5,
-                        "Consumer Staples": 7.8,
-                        "Energy": 4.9,
-                        "Utilities": 3.2,
-                        "Materials": 4.1,
-                        "Others": 7.7
-                    }
-                },
-                "strategy": """
-                ### How to Use MSCI World in Your Portfolio
-                
-                #### 🎯 Core Strategy
-                - **Base Portfolio**: Use MSCI World as main asset (50-70% of portfolio)
-                - **Rebalancing**: Annual or semi-annual
-                - **Accumulation**: Monthly investment plan (DCA) to reduce timing risk
-                
-                #### ⚖️ Effective Combinations
-                - **MSCI World (70%) + Bonds (30%)**: Moderate balanced portfolio
-                - **MSCI World (60%) + Emerging Markets (20%) + Bonds (20%)**: Growth with diversification
-                - **MSCI World (80%) + Small Cap (20%)**: Aggressive equity-oriented
-                
-                #### ⚠️ Considerations
-                - High US exposure (~70%) - consider additional geographic diversification
-                - Excludes emerging markets - evaluate integration with MSCI EM
-                - Excludes small-cap - superior return opportunities excluded
-                """
-            },
-            "sp500": {
-                "name": "S&P 500",
-                "description": """
-                ### S&P 500 Index
-                
-                The **S&P 500** is the world's most followed index, representing the 500 largest 
-                publicly traded companies in the United States. It's considered the best indicator 
-                of US stock market performance.
-                
-                #### Key Features:
-                - **Coverage**: US Market
-                - **Number of stocks**: 500 companies
-                - **Capitalization**: Large-cap
-                - **Benchmark**: Standard for US equity market
-                
-                #### Why choose it:
-                The S&P 500 offers exposure to the largest and most established American companies, 
-                including tech giants like Apple, Microsoft, Amazon. Historically has provided 
-                average returns of 10% annually over the long term.
-                """,
-                "risk_profile": {
-                    "risk_level": "Medium-High",
-                    "volatility": "15-18% annual",
-                    "time_horizon": "5-10+ years",
-                    "return_potential": "9-11% historical annual"
-                },
-                "composition": {
-                    "geographic": {
-                        "USA": 100.0
-                    },
-                    "sectors": {
-                        "Technology": 29.3,
-                        "Healthcare": 13.2,
-                        "Finance": 12.8,
-                        "Consumer Cyclical": 10.9,
-                        "Communication Services": 8.7,
-                        "Industrials": 8.4,
-                        "Consumer Staples": 6.1,
-                        "Energy": 3.8,
-                        "Utilities": 2.5,
-                        "Materials": 2.4,
-                        "Real Estate": 2.0
-                    }
-                },
-                "strategy": """
-                ### How to Use S&P 500 in Your Portfolio
-                
-                #### 🎯 Core USA Strategy
-                - **US Exposure**: Ideal for those bullish on American market
-                - **Long-Term Investment**: Buy and hold for 10+ years
-                - **Dollar Cost Averaging**: Monthly investments to average prices
-                
-                #### ⚖️ Effective Combinations
-                - **S&P 500 (60%) + International (30%) + Bonds (10%)**: Global with US focus
-                - **S&P 500 (50%) + Nasdaq 100 (20%) + Bonds (30%)**: Moderate tech-heavy
-                - **S&P 500 (70%) + REIT (15%) + Gold (15%)**: Asset class diversification
-                
-                #### ⚠️ Considerations
-                - 100% US geographic concentration - country risk
-                - High tech exposure (~30%) - volatile but high potential
-                - Mega-cap dominance - few small/mid cap opportunities
-                - Sensitive to Fed rates and US policies
-                """
-            },
-            "msci_em": {
-                "name": "MSCI Emerging Markets",
-                "description": """
-                ### MSCI Emerging Markets Index
-                
-                The **MSCI Emerging Markets Index** captures large and mid-cap representation 
-                across 24 emerging market countries, representing approximately 85% of the 
-                free float-adjusted market capitalization in each country.
-                
-                #### Key Features:
-                - **Coverage**: 24 emerging markets
-                - **Number of stocks**: ~1,400 companies
-                - **Capitalization**: Large and Mid-cap
-                - **Benchmark**: Standard for emerging markets
-                
-                #### Why choose it:
-                Offers exposure to rapidly growing economies like China, India, Taiwan, Brazil. 
-                Higher growth potential than developed markets but with higher volatility. 
-                Essential for geographic diversification.
-                """,
-                "risk_profile": {
-                    "risk_level": "High",
-                    "volatility": "20-25% annual",
-                    "time_horizon": "10+ years",
-                    "return_potential": "8-12% historical annual (high variability)"
-                },
-                "composition": {
-                    "geographic": {
-                        "China": 28.5,
-                        "Taiwan": 16.8,
-                        "India": 18.2,
-                        "South Korea": 11.4,
-                        "Brazil": 5.1,
-                        "Saudi Arabia": 3.8,
-                        "South Africa": 3.2,
-                        "Mexico": 2.4,
-                        "Thailand": 2.1,
-                        "Others": 8.5
-                    },
-                    "sectors": {
-                        "Technology": 21.4,
-                        "Finance": 20.3,
-                        "Consumer Cyclical": 13.8,
-                        "Communication Services": 9.7,
-                        "Materials": 8.2,
-                        "Energy": 6.8,
-                        "Industrials": 6.1,
-                        "Consumer Staples": 5.9,
-                        "Healthcare": 4.2,
-                        "Utilities": 2.4,
-                        "Others": 1.2
-                    }
-                },
-                "strategy": """
-                ### How to Use MSCI EM in Your Portfolio
-                
-                #### 🎯 Satellite Strategy
-                - **Allocation**: 10-30% of equity portfolio
-                - **Complement**: Pair with MSCI World or S&P 500
-                - **Patience**: Requires long time horizon (10+ years)
-                
-                #### ⚖️ Effective Combinations
-                - **MSCI World (70%) + MSCI EM (20%) + Bonds (10%)**: Complete global
-                - **S&P 500 (60%) + MSCI EM (30%) + REIT (10%)**: Aggressive growth
-                - **MSCI World (50%) + MSCI EM (25%) + Bonds (25%)**: Balanced global
-                
-                #### ⚠️ Considerations
-                - **High volatility**: Swings can exceed 30% annually
-                - **Political risk**: Instability in some emerging countries
-                - **Currency risk**: Exposure to volatile currencies
-                - **Asia concentration**: ~75% in Asian markets
-                - **Opportunities**: Demographic growth and middle class expansion
-                """
-            },
-            "msci_acwi": {
-                "name": "MSCI ACWI",
-                "description": """
-                ### MSCI All Country World Index (ACWI)
-                
-                The **MSCI ACWI** is the most comprehensive global equity index, combining developed 
-                and emerging markets. It represents 99% of the global investable equity opportunity.
-                
-                #### Key Features:
-                - **Coverage**: 23 developed + 24 emerging markets
-                - **Number of stocks**: ~3,000 companies
-                - **Capitalization**: Large and Mid-cap
-                - **Benchmark**: Most complete global equity index
-                
-                #### Why choose it:
-                MSCI ACWI is the "one-stop-shop" solution for global equity. With a single position 
-                you get balanced exposure to developed (~85%) and emerging (~15%) markets, 
-                eliminating the need to combine multiple indices.
-                """,
-                "risk_profile": {
-                    "risk_level": "Medium-High",
-                    "volatility": "16-21% annual",
-                    "time_horizon": "7-10+ years",
-                    "return_potential": "7-10% historical annual"
-                },
-                "composition": {
-                    "geographic": {
-                        "USA": 62.3,
-                        "Japan": 5.4,
-                        "United Kingdom": 3.6,
-                        "China": 3.2,
-                        "France": 3.0,
-                        "Canada": 2.8,
-                        "India": 2.1,
-                        "Taiwan": 1.9,
-                        "Switzerland": 2.4,
-                        "Others": 13.3
-                    },
-                    "sectors": {
-                        "Technology": 23.8,
-                        "Finance": 15.6,
-                        "Healthcare": 11.9,
-                        "Consumer Cyclical": 11.5,
-                        "Industrials": 10.2,
-                        "Consumer Staples": 7.4,
-                        "Communication Services": 7.1,
-                        "Energy": 4.7,
-                        "Materials": 4.3,
-                        "Others": 3.5
-                    }
-                },
-                "strategy": """
-                ### How to Use MSCI ACWI in Your Portfolio
-                
-                #### 🎯 "All-in-One" Strategy
-                - **Simplified Portfolio**: MSCI ACWI as single equity ETF (60-100%)
-                - **Passive Management**: Perfect for "set and forget" approach
-                - **Automatic Rebalancing**: Index auto-adjusts between DM and EM
-                
-                #### ⚖️ Effective Combinations
-                - **MSCI ACWI (80%) + Bonds (20%)**: Simple global portfolio
-                - **MSCI ACWI (70%) + Bonds (25%) + Gold (5%)**: Inflation protection
-                - **MSCI ACWI (90%) + Small Cap (10%)**: Maximum equity exposure
-                
-                #### ⚠️ Considerations
-                - **Main advantage**: Maximum diversification in one ETF
-                - **US exposure**: Still dominant (~62%)
-                - **EM included**: No need to combine with MSCI EM
-                - **Slightly higher TER**: Compared to MSCI World due to EM inclusion
-                - **Ideal for beginners**: Maximum management simplicity
-                """
-            },
-            "ftse_all_world": {
-                "name": "FTSE All-World",
-                "description": """
-                ### FTSE All-World Index
-                
-                The **FTSE All-World Index** is FTSE's alternative to MSCI ACWI, offering 
-                comprehensive exposure to developed and emerging markets with even broader coverage.
-                
-                #### Key Features:
-                - **Coverage**: 49 countries (25 developed + 24 emerging)
-                - **Number of stocks**: ~4,000 companies
-                - **Capitalization**: Large, Mid and Small-cap
-                - **Benchmark**: Comprehensive alternative to MSCI ACWI
-                
-                #### Why choose it:
-                FTSE All-World also includes small-caps, providing coverage of 98% of the global 
-                investable equity market. The preferred choice for those seeking maximum 
-                diversification in a single instrument.
-                """,
-                "risk_profile": {
-                    "risk_level": "Medium-High",
-                    "volatility": "16-22% annual",
-                    "time_horizon": "7-10+ years",
-                    "return_potential": "7-10% historical annual"
-                },
-                "composition": {
-                    "geographic": {
-                        "USA": 61.8,
-                        "Japan": 5.6,
-                        "United Kingdom": 3.8,
-                        "China": 3.4,
-                        "Canada": 3.1,
-                        "France": 2.9,
-                        "Switzerland": 2.5,
-                        "Germany": 2.3,
-                        "India": 2.2,
-                        "Taiwan": 1.9,
-                        "Others": 10.5
-                    },
-                    "sectors": {
-                        "Technology": 24.1,
-                        "Finance": 15.3,
-                        "Consumer Cyclical": 11.8,
-                        "Healthcare": 11.6,
-                        "Industrials": 10.4,
-                        "Consumer Staples": 7.2,
-                        "Communication Services": 6.9,
-                        "Energy": 4.6,
-                        "Materials": 4.2,
-                        "Others": 3.9
-                    }
-                },
-                "strategy": """
-                ### How to Use FTSE All-World in Your Portfolio
-                
-                #### 🎯 Maximum Diversification Strategy
-                - **Complete Portfolio**: FTSE All-World as only equity ETF needed
-                - **Small-Cap Inclusion**: Captures opportunities in smaller companies too
-                - **Buy & Hold**: Ideal for long-term passive investors
-                
-                #### ⚖️ Effective Combinations
-                - **FTSE All-World (80%) + Global Bonds (20%)**: Maximum simplicity
-                - **FTSE All-World (70%) + Bonds (20%) + Gold (10%)**: Resilient portfolio
-                - **FTSE All-World (100%)**: 100% equity option for aggressive profiles
-                
-                #### ⚠️ Considerations
-                - **Superior coverage**: Includes small-cap (vs MSCI ACWI)
-                - **4,000+ holdings**: Maximum available diversification
-                - **MSCI alternative**: Slightly different methodology but similar results
-                - **ETF liquidity**: Check bid-ask spreads
-                - **Perfect for "Lazy Portfolio"**: Complete solution in one ETF
-                """
-            },
-            "solactive_str": {
-                "name": "Solactive €STR +8.5bp Daily",
-                "description": """
-                ### Solactive €STR +8.5 basis points Daily Index
-                
-                The **Solactive €STR +8.5bp Daily** is a benchmark index for money market ETFs 
-                that replicate the Eurozone overnight rate (€STR) with a small positive spread. 
-                Used in ETFs like **Xtrackers EUR Overnight Rate Swap (XEON)**.
-                
-                #### Key Features:
-                - **Benchmark**: €STR + 8.5 basis points (0.085%)
-                - **Type**: Overnight money market index
-                - **Use**: Money market ETFs for cash management
-                - **Liquidity**: Daily (T+2)
-                
-                #### Why choose it:
-                Ideal for parking short-term liquidity with returns higher than traditional 
-                current accounts. ETFs tracking this index (like XEON) offer an efficient 
-                alternative to deposit accounts with greater flexibility and low costs 
-                (typical TER: 0.10-0.15%).
-                
-                #### Popular ETFs:
-                - **XEON** - Xtrackers EUR Overnight Rate Swap UCITS ETF
-                - Ideal for corporate treasury and personal cash management
-                """,
-                "risk_profile": {
-                    "risk_level": "Very Low",
-                    "volatility": "Almost none (<0.5% annual)",
-                    "time_horizon": "Short term (days/months)",
-                    "return_potential": "€STR + 0.085% (≈3.2-3.3% with €STR ≈3.15%)"
-                },
-                "composition": {
-                    "geographic": {
-                        "Eurozone": 100.0
-                    },
-                    "sectors": {
-                        "Overnight Rate Swaps": 70.0,
-                        "Money Market": 20.0,
-                        "Cash Collateral": 10.0
-                    }
-                },
-                "strategy": """
-                ### How to Use €STR ETFs in Your Portfolio
-                
-                #### 🎯 Efficient Cash Management
-                - **Parking liquidity**: Alternative to current/deposit accounts
-                - **Flexibility**: Liquidatable in T+2 (vs deposit lock-ins)
-                - **Return**: €STR + spread (currently ≈3.2-3.3%)
-                
-                #### 💰 Comparison with Alternatives (December 2024)
-                
-                **Overnight ETFs (e.g. XEON)**:
-                - Return: ≈3.2-3.3% gross
-                - TER: 0.10-0.15%
-                - Liquidity: T+2
-                - Flexibility: High
-                
-                **Term Deposit Account**:
-                - Return: 3.0-3.8% gross
-                - Costs: 0%
-                - Liquidity: Locked (3-12 months)
-                - Flexibility: Low
-                
-                **Current Account**:
-                - Return: 0-0.5%
-                - Costs: Often monthly fees
-                - Liquidity: Immediate
-                - Flexibility: Maximum
-                
-                #### ⚖️ When to Use €STR ETFs
-                
-                ✅ **IDEAL for**:
-                - Operating liquidity (3-12 months) you want to remunerate
-                - Corporate treasury
-                - Emergency fund with return
-                - Transition between investments
-                - Alternative to non-term deposits
-                
-                ❌ **NOT ideal for**:
-                - Long-term investments (use equity/bonds)
-                - Liquidity <1 month (too short)
-                - Maximum return seekers (term deposits yield more)
-                
-                #### 📊 Practical Strategy
-                
-                **Balanced Portfolio with Cash Buffer**:
-                - 60% MSCI World
-                - 30% Bonds
-                - **10% €STR ETF** (remunerated emergency liquidity)
-                
-                **Personal Liquidity Management**:
-                - Current expenses (1-2 months): Current account
-                - **Emergency fund (3-6 months): €STR ETF**
-                - LT investments: Equity/Bond ETFs
-                
-                #### 💡 Advantages vs Disadvantages
-                
-                **Advantages**:
-                - ✅ Competitive return vs current accounts
-                - ✅ Flexibility (no time constraints)
-                - ✅ Low costs (TER 0.10-0.15%)
-                - ✅ High liquidity (T+2)
-                - ✅ Automatically follows ECB rates
-                
-                **Disadvantages**:
-                - ⚠️ Lower return than long-term deposits
-                - ⚠️ Not immediate like current account (T+2)
-                - ⚠️ Requires broker/securities account
-                - ⚠️ 26% capital gains tax
-                
-                #### 🎓 Conclusion
-                
-                Overnight €STR ETFs are **legitimate and efficient** cash management tools. 
-                With TER of 0.10-0.15%, they offer a good compromise between return, 
-                flexibility and costs for those wanting to remunerate liquidity without 
-                rigid time constraints.
-                """
-            },
-            "msci_europe": {
-                "name": "MSCI Europe",
-                "description": """
-                ### MSCI Europe Index
-                
-                The **MSCI Europe Index** represents large and mid-cap stocks from 15 developed 
-                European countries, offering concentrated exposure to the European equity market.
-                
-                #### Key Features:
-                - **Coverage**: 15 developed European countries
-                - **Number of stocks**: ~430 companies
-                - **Capitalization**: Large and Mid-cap
-                - **Benchmark**: Standard for European equity
-                
-                #### Why choose it:
-                MSCI Europe is ideal for those seeking exposure to developed Europe, including both 
-                Eurozone countries and UK, Switzerland, and Nordic countries. Provides access to 
-                global leaders in sectors like luxury, pharmaceuticals, automotive, and finance.
-                """,
-                "risk_profile": {
-                    "risk_level": "Medium",
-                    "volatility": "14-19% annual",
-                    "time_horizon": "7-10+ years",
-                    "return_potential": "6-8% historical annual"
-                },
-                "composition": {
-                    "geographic": {
-                        "United Kingdom": 23.5,
-                        "France": 19.2,
-                        "Switzerland": 16.8,
-                        "Germany": 14.3,
-                        "Netherlands": 7.2,
-                        "Sweden": 5.8,
-                        "Denmark": 4.1,
-                        "Spain": 3.9,
-                        "Italy": 3.2,
-                        "Others": 2.0
-                    },
-                    "sectors": {
-                        "Finance": 18.4,
-                        "Healthcare": 16.2,
-                        "Industrials": 14.8,
-                        "Consumer Cyclical": 12.1,
-                        "Consumer Staples": 10.9,
-                        "Technology": 8.3,
-                        "Energy": 6.7,
-                        "Materials": 5.9,
-                        "Utilities": 4.2,
-                        "Others": 2.5
-                    }
-                },
-                "strategy": """
-                ### How to Use MSCI Europe in Your Portfolio
-                
-                #### 🎯 Regional Focus Strategy
-                - **Europe Exposure**: Ideal for reducing US dependency
-                - **Geographic Diversification**: Complements S&P 500 or Nasdaq
-                - **Attractive Valuations**: Historically cheaper than US
-                
-                #### ⚖️ Effective Combinations
-                - **S&P 500 (50%) + MSCI Europe (30%) + MSCI EM (20%)**: Balanced global
-                - **MSCI Europe (60%) + MSCI USA (30%) + Bonds (10%)**: Reduce US home bias
-                - **MSCI Europe (40%) + MSCI World (40%) + Bonds (20%)**: European tilt
-                
-                #### ⚠️ Considerations
-                - **Lower growth than US**: Historically lower returns
-                - **Includes UK**: About 24% in British companies
-                - **Value focus**: Less tech, more finance and industrials
-                - **Currency diversification**: Exposure to GBP, CHF, EUR
-                - **Opportunity**: Lower valuations may offer upside potential
-                """
-            },
-            "msci_emu": {
-                "name": "MSCI EMU",
-                "description": """
-                ### MSCI EMU Index (European Monetary Union)
-                
-                The **MSCI EMU Index** represents large and mid-cap stocks from Eurozone countries, 
-                offering pure exposure to markets using the Euro as currency.
-                
-                #### Key Features:
-                - **Coverage**: 10 Eurozone countries
-                - **Number of stocks**: ~240 companies
-                - **Capitalization**: Large and Mid-cap
-                - **Benchmark**: Standard for Eurozone equity
-                
-                #### Why choose it:
-                MSCI EMU eliminates currency risk for European investors, focusing exclusively on 
-                countries using the Euro. Ideal for those wanting Eurozone exposure without the 
-                influence of UK and Switzerland.
-                """,
-                "risk_profile": {
-                    "risk_level": "Medium",
-                    "volatility": "15-20% annual",
-                    "time_horizon": "7-10+ years",
-                    "return_potential": "5-8% historical annual"
-                },
-                "composition": {
-                    "geographic": {
-                        "France": 35.8,
-                        "Germany": 27.2,
-                        "Netherlands": 13.4,
-                        "Spain": 8.9,
-                        "Italy": 7.6,
-                        "Ireland": 3.2,
-                        "Belgium": 2.1,
-                        "Finland": 1.2,
-                        "Others": 0.6
-                    },
-                    "sectors": {
-                        "Finance": 17.8,
-                        "Industrials": 16.4,
-                        "Healthcare": 14.2,
-                        "Consumer Cyclical": 13.6,
-                        "Consumer Staples": 11.8,
-                        "Technology": 9.3,
-                        "Energy": 5.9,
-                        "Materials": 5.7,
-                        "Utilities": 3.8,
-                        "Others": 1.5
-                    }
-                },
-                "strategy": """
-                ### How to Use MSCI EMU in Your Portfolio
-                
-                #### 🎯 Eurozone Strategy
-                - **No Currency Risk**: Ideal for Italian/European investors
-                - **Home Region Bias**: Invest in your own geographic area
-                - **EUR Accumulation**: 100% Euro exposure
-                
-                #### ⚖️ Effective Combinations
-                - **MSCI EMU (40%) + S&P 500 (40%) + EUR Bonds (20%)**: Balanced EUR-USA
-                - **MSCI EMU (60%) + MSCI World ex-EMU (30%) + Bonds (10%)**: Eurozone tilt
-                - **MSCI EMU (50%) + MSCI EM (20%) + Bonds (30%)**: Complete diversification
-                
-                #### ⚠️ Considerations
-                - **Excludes UK and Switzerland**: Removes 2 of Europe's largest markets
-                - **France-Germany concentration**: ~63% of total weight
-                - **Less tech**: Underweight in technology vs global indices
-                - **EU political risk**: Exposed to Eurozone political dynamics
-                - **For EUR investors**: Eliminates currency risk but reduces diversification
-                - **Valuations**: Generally more attractive than US markets
-                """
-            }
-        },
-        "metrics_labels": {
-            "risk": "Risk Level",
-            "volatility": "Volatility",
-            "horizon": "Time Horizon",
-            "returns": "Expected Returns"
-        },
-        "chart_titles": {
-            "geographic": "Geographic Composition",
-            "sectors": "Sector Composition"
-        }
-    }
-}
+# ASSETEXPL_MEMORY_VIEW=1 mostra nella sidebar la memoria trattenuta da ogni
+# sessione, per dimensionare i worker (il calcolo attraversa tutti gli stati)
+MEMORY_VIEW = os.environ.get("ASSETEXPL_MEMORY_VIEW", "0") == "1"
+
+TAB_IDS = (
+    "description", "statistics", "strategy", "history", "comparison", "portfolio",
+    "projection"
+)
+
+# Portafoglio proposto all'apertura del calcolatore
+DEFAULT_ALLOCATION = {"msci_world": 80.0, "msci_em": 20.0}
+
+# Il backtest dei portafogli modello parte in background al primo avvio
+# (le chiamate successive lo riavviano solo se le serie storiche sono cambiate)
+precompute()
 
 # ============================================================================
 # FUNZIONI HELPER
 # ============================================================================
 
-def create_pie_chart(data, title, lang):
+def create_pie_chart(labels, values, title, lang):
     """Crea un grafico a torta professionale con Plotly"""
-    df = pd.DataFrame(list(data.items()), columns=['Category', 'Percentage'])
+    # Import differito: Plotly si carica solo quando serve un grafico
+    go = graph_objects()
     
     fig = go.Figure(data=[go.Pie(
-        labels=df['Category'],
-        values=df['Percentage'],
+        labels=labels,
+        values=values,
         hole=0.4,
         marker=dict(
-            colors=px.colors.qualitative.Set3,
+            colors=PIE_COLORS,
             line=dict(color='white', width=2)
         ),
         textposition='auto',
@@ -1342,21 +97,24 @@ def create_pie_chart(data, title, lang):
     
     return fig
 
-def create_bar_chart(data, title, lang):
+def create_bar_chart(labels, values, title, lang):
     """Crea un grafico a barre orizzontale con Plotly"""
-    df = pd.DataFrame(list(data.items()), columns=['Category', 'Percentage'])
-    df = df.sort_values('Percentage', ascending=True)
+    go = graph_objects()
+    
+    order = np.argsort(values, kind='stable')
+    labels = np.asarray(labels)[order]
+    values = np.asarray(values)[order]
     
     fig = go.Figure(data=[go.Bar(
-        x=df['Percentage'],
-        y=df['Category'],
+        x=values,
+        y=labels,
         orientation='h',
         marker=dict(
-            color=df['Percentage'],
+            color=values,
             colorscale='Viridis',
             line=dict(color='white', width=1)
         ),
-        text=df['Percentage'].apply(lambda x: f'{x:.1f}%'),
+        text=[f'{x:.1f}%' for x in values],
         textposition='auto',
         hovertemplate='<b>%{y}</b><br>%{x:.1f}%<extra></extra>'
     )])
@@ -1372,37 +130,768 @@ def create_bar_chart(data, title, lang):
     
     return fig
 
-def display_risk_metrics(risk_data, labels, lang):
-    """Visualizza le metriche di rischio in colonne"""
-    col1, col2, col3, col4 = st.columns(4)
+def create_overlap_heatmap(matrix, labels, title, lang):
+    """Crea una heatmap della sovrapposizione tra indici con Plotly"""
+    go = graph_objects()
+    
+    fig = go.Figure(data=[go.Heatmap(
+        z=matrix,
+        x=labels,
+        y=labels,
+        zmin=0,
+        zmax=100,
+        colorscale='Viridis',
+        texttemplate='%{z:.0f}',
+        hovertemplate='<b>%{y}</b> / <b>%{x}</b><br>%{z:.1f}%<extra></extra>'
+    )])
+    
+    fig.update_layout(
+        title=dict(text=title, x=0.5, xanchor='center', font=dict(size=18)),
+        height=max(450, 40 * len(labels) + 150),
+        margin=dict(t=80, b=60, l=150, r=40),
+        yaxis=dict(autorange='reversed'),
+        plot_bgcolor='rgba(0,0,0,0)'
+    )
+    
+    return fig
+
+def create_history_chart(dates, values, title, lang):
+    """Crea un grafico a linee dell'andamento storico con Plotly"""
+    go = graph_objects()
+    
+    fig = go.Figure(data=[go.Scatter(
+        x=dates,
+        y=values,
+        mode='lines',
+        line=dict(width=1.5),
+        hovertemplate='%{x|%Y-%m-%d}<br>%{y:.2f}<extra></extra>'
+    )])
+    
+    fig.update_layout(
+        title=dict(text=title, x=0.5, xanchor='center', font=dict(size=18)),
+        xaxis=dict(showgrid=True, gridcolor='lightgray'),
+        yaxis=dict(showgrid=True, gridcolor='lightgray'),
+        height=450,
+        margin=dict(t=80, b=60, l=60, r=40),
+        plot_bgcolor='rgba(0,0,0,0)'
+    )
+    
+    return fig
+
+def create_fan_chart(percentiles, labels, title, lang):
+    """Crea il fan chart dei percentili 5/25/50/75/95 della proiezione con Plotly"""
+    go = graph_objects()
+    
+    years = np.arange(percentiles.shape[1]) / 12
+    values = 100 * percentiles
+    fig = go.Figure()
+    for low, high, name, opacity in (
+        (0, 4, labels['band_90'], 0.15),
+        (1, 3, labels['band_50'], 0.3),
+    ):
+        fig.add_trace(go.Scatter(
+            x=years, y=values[high], mode='lines', line=dict(width=0),
+            showlegend=False, hoverinfo='skip'
+        ))
+        fig.add_trace(go.Scatter(
+            x=years, y=values[low], mode='lines', line=dict(width=0),
+            fill='tonexty', fillcolor=f'rgba(31,119,180,{opacity})',
+            name=name, hoverinfo='skip'
+        ))
+    fig.add_trace(go.Scatter(
+        x=years, y=values[2], mode='lines', line=dict(width=2, color='rgb(31,119,180)'),
+        name=labels['median'],
+        hovertemplate='%{x:.1f}<br>%{y:.0f}<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title=dict(text=title, x=0.5, xanchor='center', font=dict(size=18)),
+        xaxis=dict(title=labels['axis_years'], showgrid=True, gridcolor='lightgray'),
+        yaxis=dict(title=labels['axis_wealth'], showgrid=True, gridcolor='lightgray'),
+        height=450,
+        margin=dict(t=80, b=60, l=60, r=40),
+        plot_bgcolor='rgba(0,0,0,0)'
+    )
+    
+    return fig
+
+def create_frontier_chart(result, selected, current, labels, index_names, title, lang):
+    """Crea il grafico rischio/rendimento con frontiera efficiente e risk parity"""
+    go = graph_objects()
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=100 * result["frontier_volatility"],
+        y=100 * result["frontier_returns"],
+        mode='lines',
+        line=dict(width=2, color='rgb(31,119,180)'),
+        name=labels['frontier'],
+        hovertemplate='%{x:.1f}% / %{y:.1f}%<extra></extra>'
+    ))
+    fig.add_trace(go.Scatter(
+        x=100 * result["volatility"],
+        y=100 * result["mu"],
+        mode='markers+text',
+        marker=dict(size=9, color='gray'),
+        text=[index_names[key] for key in result["index_keys"]],
+        textposition='top center',
+        showlegend=False,
+        hovertemplate='<b>%{text}</b><br>%{x:.1f}% / %{y:.1f}%<extra></extra>'
+    ))
+    points = [
+        (labels['frontier'], result["frontier_volatility"][selected],
+         result["frontier_returns"][selected], 'rgb(31,119,180)', 'circle'),
+        (labels['risk_parity'], result["risk_parity_volatility"],
+         result["risk_parity_return"], 'rgb(214,39,40)', 'diamond'),
+    ]
+    if current is not None:
+        points.append((labels['your_portfolio'], *current, 'rgb(44,160,44)', 'star'))
+    for name, volatility, expected, color, symbol in points:
+        fig.add_trace(go.Scatter(
+            x=[100 * volatility], y=[100 * expected],
+            mode='markers',
+            marker=dict(size=14, color=color, symbol=symbol, line=dict(color='white', width=1)),
+            name=name,
+            hovertemplate='%{x:.1f}% / %{y:.1f}%<extra></extra>'
+        ))
+    
+    fig.update_layout(
+        title=dict(text=title, x=0.5, xanchor='center', font=dict(size=18)),
+        xaxis=dict(title=labels['axis_volatility'], ticksuffix='%', showgrid=True, gridcolor='lightgray'),
+        yaxis=dict(title=labels['axis_return'], ticksuffix='%', showgrid=True, gridcolor='lightgray'),
+        height=450,
+        margin=dict(t=80, b=60, l=60, r=40),
+        plot_bgcolor='rgba(0,0,0,0)'
+    )
+    
+    return fig
+
+def get_cached_overlap_chart(title, lang, index_keys, index_names, dimension):
+    """Restituisce la heatmap di sovrapposizione dalla cache condivisa"""
+    key = ("create_overlap_heatmap", lang, tuple(index_keys), dimension)
+    
+    def build():
+        matrix = subset_overlap(index_keys, dimension)
+        labels = [index_names[k] for k in index_keys]
+        return create_overlap_heatmap(matrix, labels, title, lang)
+    
+    # Le composizioni sono nel codice, già compreso nelle chiavi su disco
+    return FIGURE_CACHE.get_or_build(key, build, sources=())
+
+def get_cached_chart(chart_builder, title, lang, index_key, dimension):
+    """Restituisce il grafico dalla cache condivisa, costruendolo solo al primo accesso"""
+    key = (chart_builder.__name__, lang, index_key, dimension)
+    
+    def build():
+        # I costituenti importati, se presenti, hanno la precedenza sui
+        # pesi pre-aggregati dello store
+        if index_key in HOLDINGS_STORE.available():
+            labels, values = HOLDINGS_STORE.breakdown(index_key, dimension, lang)
+        else:
+            labels, values = COMPOSITION_STORE.breakdown(index_key, dimension, lang)
+        return chart_builder(labels, values, title, lang)
+    
+    return FIGURE_CACHE.get_or_build(
+        key, build, sources=(HOLDINGS_STORE.fingerprint(index_key),)
+    )
+
+def get_cached_history_chart(content, language, index_key, start, end):
+    """Grafico storico dell'intervallo dalla cache condivisa: (figura, punti mostrati, punti totali)"""
+    key = ("create_history_chart", language, index_key, start, end)
+
+    def build():
+        # Solo l'intervallo scelto viene ridotto al budget di punti; i punti
+        # totali restano nella figura, così un hit non rilegge la serie
+        window_dates, _ = PRICE_STORE.window(index_key, start, end)
+        plot_dates, plot_values = PRICE_STORE.plot_series(index_key, start, end)
+        fig = create_history_chart(
+            plot_dates, plot_values,
+            f"{content['indices'][index_key]['name']} - {content['history']['title']}",
+            language
+        )
+        fig.layout.meta = {"total_points": len(window_dates)}
+        return fig
+
+    fig = HISTORY_CACHE.get_or_build(key, build, sources=PRICE_STORE.fingerprint([index_key]))
+    return fig, len(fig.data[0].x), fig.layout.meta["total_points"]
+
+def get_cached_pac_chart(labels, language, index_key, years, contribution, summary):
+    """Valori finali del PAC per mese di partenza dalla cache condivisa"""
+    # I risultati dipendono solo dai parametri: la figura è condivisa tra le
+    # sessioni (il numero di piani cambia se arrivano nuovi prezzi)
+    key = ("pac", language, index_key, years, contribution, summary["plans"])
+    return FIGURE_CACHE.get_or_build(key, lambda: create_history_chart(
+        summary["start_months"].astype("datetime64[D]"),
+        summary["final_value"],
+        labels["chart_title"],
+        language
+    ), sources=PRICE_STORE.fingerprint())
+
+def projection_key(language, index_key, years, method, n_paths):
+    """Chiave della cache condivisa per il grafico a ventaglio di una proiezione
+    (le impronte della serie storica si passano a parte come `sources`)"""
+    return ("create_fan_chart", language, index_key, years, method, n_paths)
+
+def projection_years(index_data):
+    """Orizzonte proposto per la proiezione, dal profilo di rischio dell'indice"""
+    return horizon_years(index_data["risk_profile"]["time_horizon"])
+
+def display_risk_metrics(risk_data, labels, lang, computed=None):
+    """Visualizza le metriche di rischio in colonne (vedi risk_metric_rows)"""
+    for row in risk_metric_rows(risk_data, labels, computed):
+        for col, (label, value) in zip(st.columns(4), row):
+            with col:
+                st.metric(label=label, value=value, delta=None)
+    
+    if computed:
+        st.caption(risk_metrics_caption(labels, computed))
+
+def display_market_quote(content, selected_index):
+    """Mostra l'ultima quotazione dal provider configurato (cache condivisa)"""
+    ticker = INDEX_TICKERS.get(selected_index)
+    if MARKET_DATA is None or ticker is None:
+        return
+    try:
+        quote = MARKET_DATA.get_quote(ticker)
+    except Exception:
+        quote = None
+    if quote is None:
+        st.caption(content["market_data"]["unavailable"])
+        return
+    st.metric(
+        label=f"{content['market_data']['last_price']} ({ticker})",
+        value=f"{quote.price:,.2f} {quote.currency}".strip()
+    )
+
+def render_text(index_data, language, selected_index, field):
+    """Mostra un testo lungo dall'HTML pre-renderizzato condiviso tra le sessioni"""
+    st.html(MARKDOWN_CACHE.get(language, selected_index, field, index_data[field]))
+
+def render_description(index_data, language, selected_index):
+    """TAB 1: Descrizione"""
+    render_text(index_data, language, selected_index, "description")
+
+def render_statistics(index_data, content, language, selected_index):
+    """TAB 2: Statistiche"""
+    st.subheader("📊 " + content["risk_profile_title"])
+    
+    # Metriche di rischio, calcolate dai prezzi quando disponibili
+    risk_engine = get_risk_engine()
+    display_risk_metrics(
+        index_data["risk_profile"],
+        content["metrics_labels"],
+        language,
+        risk_engine.metrics(selected_index) if risk_engine else None
+    )
+    display_market_quote(content, selected_index)
+    
+    st.divider()
+    
+    # Grafici di composizione
+    col1, col2 = st.columns(2)
     
     with col1:
-        st.metric(
-            label=labels['risk'],
-            value=risk_data['risk_level'],
-            delta=None
+        st.subheader(content["chart_titles"]["geographic"])
+        fig_geo = get_cached_chart(
+            create_pie_chart,
+            content["chart_titles"]["geographic"],
+            language,
+            selected_index,
+            "geographic"
         )
+        st.plotly_chart(fig_geo, width="stretch")
     
     with col2:
-        st.metric(
-            label=labels['volatility'],
-            value=risk_data['volatility'],
-            delta=None
+        st.subheader(content["chart_titles"]["sectors"])
+        fig_sectors = get_cached_chart(
+            create_bar_chart,
+            content["chart_titles"]["sectors"],
+            language,
+            selected_index,
+            "sectors"
         )
+        st.plotly_chart(fig_sectors, width="stretch")
+
+def render_strategy(index_data, content, language, selected_index):
+    """TAB 3: Strategia"""
+    col1, col2 = st.columns([3, 2])
+    with col1:
+        render_text(index_data, language, selected_index, "strategy")
+    with col2:
+        render_model_portfolios(content, language, selected_index)
+    
+    st.divider()
+    render_pac_backtest(content, language, selected_index)
+
+def render_model_portfolios(content, language, selected_index):
+    """Metriche dei portafogli modello proposti nella strategia dell'indice"""
+    labels = content["model_portfolios"]
+    portfolios = [
+        portfolio for portfolio in model_portfolios(language)
+        if portfolio.source_index == selected_index
+    ]
+    if not portfolios:
+        return
+    
+    st.subheader(labels["title"])
+    results = get_model_backtest()
+    computed = [p for p in portfolios if p.portfolio_id in results]
+    if computed:
+        columns = labels["columns"]
+        metrics = [results[p.portfolio_id] for p in computed]
+        st.dataframe(
+            {
+                columns["portfolio"]: [p.title for p in computed],
+                columns["cagr"]: [100 * m["cagr"] for m in metrics],
+                columns["volatility"]: [100 * m["volatility"] for m in metrics],
+                columns["max_drawdown"]: [100 * m["max_drawdown"] for m in metrics],
+                columns["sharpe"]: [m["sharpe"] for m in metrics],
+            },
+            column_config={
+                columns[name]: st.column_config.NumberColumn(format="%.1f%%")
+                for name in ("cagr", "volatility", "max_drawdown")
+            } | {columns["sharpe"]: st.column_config.NumberColumn(format="%.2f")},
+            hide_index=True,
+            width="stretch"
+        )
+        st.caption(labels["period"].format(start=metrics[0]["start"], end=metrics[0]["end"]))
+        proxies = sorted({
+            f"{c.label} → {content['indices'][c.index_id]['name']}"
+            for p in computed for c in p.components if c.proxy
+        })
+        if proxies:
+            st.caption(labels["proxy"].format(components=", ".join(proxies)))
+    else:
+        st.info(labels["missing"])
+    
+    unlinked = sorted({
+        c.label for p in portfolios for c in p.components if c.index_id is None
+    })
+    if unlinked:
+        st.caption(labels["unlinked"].format(components=", ".join(unlinked)))
+
+def render_pac_backtest(content, language, selected_index):
+    """Backtest del PAC per ogni mese di partenza della serie storica"""
+    labels = content["pac"]
+    st.subheader(labels["title"])
+    if selected_index not in PRICE_STORE.available():
+        st.info(labels["missing"])
+        return
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        years = st.slider(
+            labels["years"], min_value=1, max_value=30, value=DEFAULT_YEARS, key="pac_years"
+        )
+    with col2:
+        contribution = st.number_input(
+            labels["contribution"],
+            min_value=10.0,
+            value=DEFAULT_CONTRIBUTION,
+            step=50.0,
+            key="pac_contribution"
+        )
+    
+    summary = backtest_all(years, contribution).get(selected_index)
+    if summary is None:
+        st.info(labels["missing"])
+        return
+    
+    col1, col2, col3, col4, col5 = st.columns(5)
+    col1.metric(labels["invested"], f"{summary['invested']:,.0f}")
+    col2.metric(labels["median"], f"{summary['final_percentiles'][50]:,.0f}")
+    col3.metric(labels["p5"], f"{summary['final_percentiles'][5]:,.0f}")
+    col4.metric(labels["median_irr"], f"{summary['median_irr']:.1%}")
+    col5.metric(labels["loss_share"], f"{summary['loss_share']:.0%}")
+    st.caption(labels["worst"].format(
+        start=summary["worst_start"],
+        value=summary["worst_value"],
+        irr=summary["worst_irr"]
+    ))
+    
+    fig = get_cached_pac_chart(labels, language, selected_index, years, contribution, summary)
+    st.plotly_chart(fig, width="stretch")
+    st.caption(labels["plans"].format(plans=summary["plans"]))
+
+def render_history(content, language, selected_index):
+    """TAB 4: Andamento storico"""
+    labels = content["history"]
+    if selected_index not in PRICE_STORE.available():
+        st.info(labels["missing"])
+        return
+    
+    dates, _ = PRICE_STORE.get(selected_index)
+    first, last = dates[0].item(), dates[-1].item()
+    start, end = st.slider(
+        labels["range"],
+        min_value=first,
+        max_value=last,
+        value=(first, last),
+        format="YYYY-MM-DD",
+        key=f"history_range_{selected_index}"
+    )
+    
+    fig, shown, total = get_cached_history_chart(content, language, selected_index, start, end)
+    st.plotly_chart(fig, width="stretch")
+    st.caption(labels["points"].format(shown=shown, total=total))
+
+def render_comparison(content, language, index_options):
+    """TAB 5: Confronto multi-indice"""
+    labels = content["comparison"]
+    selected = st.multiselect(
+        labels["select"],
+        options=list(index_options.keys()),
+        default=list(index_options.keys()),
+        format_func=lambda x: index_options[x],
+        key="compare_indices"
+    )
+    st.caption(labels["help"])
+    
+    if len(selected) < 2:
+        st.info(labels["min_selection"])
+        return
+    
+    col1, col2 = st.columns(2)
+    for col, dimension in ((col1, "geographic"), (col2, "sectors")):
+        with col:
+            fig = get_cached_overlap_chart(
+                labels["titles"][dimension],
+                language,
+                selected,
+                index_options,
+                dimension
+            )
+            st.plotly_chart(fig, width="stretch")
+
+def render_portfolio(content, language, index_options):
+    """TAB 6: Calcolatore allocazione portfolio"""
+    labels = content["portfolio"]
+    st.subheader(labels["weights"])
     
+    allocation = {}
+    columns = st.columns(4)
+    for position, (index_key, name) in enumerate(index_options.items()):
+        with columns[position % 4]:
+            # Valore iniziale tramite session_state, che anche i pulsanti
+            # delle allocazioni suggerite aggiornano
+            key = f"weight_{index_key}"
+            st.session_state.setdefault(key, DEFAULT_ALLOCATION.get(index_key, 0.0))
+            allocation[index_key] = st.number_input(
+                name,
+                min_value=0.0,
+                max_value=100.0,
+                step=5.0,
+                key=key
+            )
+    
+    total = sum(allocation.values())
+    st.caption(f"{labels['total']}: {total:.1f}% — {labels['help']}")
+    if total == 0:
+        st.info(labels["empty"])
+        return
+    
+    st.divider()
+    
+    col1, col2 = st.columns(2)
+    for col, dimension, chart_builder in (
+        (col1, "geographic", create_pie_chart),
+        (col2, "sectors", create_bar_chart),
+    ):
+        with col:
+            exposure_labels, exposure = exposure_breakdown(allocation, dimension, language)
+            fig = chart_builder(
+                exposure_labels, exposure, labels["titles"][dimension], language
+            )
+            st.plotly_chart(fig, width="stretch")
+    
+    st.divider()
+    render_optimizer(content, language, index_options, allocation)
+    
+    st.divider()
+    render_rebalancing(content, language, index_options, allocation)
+
+def apply_weights(index_keys, weights):
+    """Copia pesi suggeriti nei campi del calcolatore (callback dei pulsanti)"""
+    for index_key in COMPOSITION_STORE.index_ids:
+        st.session_state[f"weight_{index_key}"] = 0.0
+    for index_key, weight in zip(index_keys, weights):
+        st.session_state[f"weight_{index_key}"] = round(100 * float(weight), 1)
+
+def render_optimizer(content, language, index_options, allocation):
+    """Frontiera efficiente e risk parity, condivise tra le sessioni"""
+    labels = content["optimizer"]
+    st.subheader(labels["title"])
+    optimizer = get_optimizer()
+    if optimizer is None:
+        st.info(labels["missing"])
+        return
+    
+    result = optimizer.result()
+    index_keys = result["index_keys"]
+    volatility = result["frontier_volatility"]
+    selected = st.select_slider(
+        labels["point"],
+        options=list(range(len(volatility))),
+        value=len(volatility) // 2,
+        format_func=lambda i: f"{volatility[i]:.1%}",
+        key="frontier_point"
+    )
+    
+    current = None
+    total = sum(allocation.values())
+    if total > 0 and all(
+        weight == 0 or key in index_keys for key, weight in allocation.items()
+    ):
+        weights = np.array([allocation.get(key, 0.0) for key in index_keys]) / total
+        current = (float(np.sqrt(weights @ optimizer.model.covariance() @ weights)),
+                   float(weights @ result["mu"]))
+    
+    col1, col2 = st.columns([3, 2])
+    with col1:
+        fig = create_frontier_chart(
+            result, selected, current, labels, index_options, labels["chart_title"], language
+        )
+        st.plotly_chart(fig, width="stretch")
+    with col2:
+        columns = labels["columns"]
+        st.dataframe(
+            {
+                columns["index"]: [index_options[key] for key in index_keys],
+                columns["frontier"]: 100 * result["frontier_weights"][selected],
+                columns["risk_parity"]: 100 * result["risk_parity"],
+            },
+            column_config={
+                columns[name]: st.column_config.NumberColumn(format="%.1f")
+                for name in ("frontier", "risk_parity")
+            },
+            hide_index=True,
+            width="stretch"
+        )
+        st.button(
+            labels["apply_frontier"],
+            on_click=apply_weights,
+            args=(index_keys, result["frontier_weights"][selected]),
+            key="apply_frontier"
+        )
+        st.button(
+            labels["apply_parity"],
+            on_click=apply_weights,
+            args=(index_keys, result["risk_parity"]),
+            key="apply_parity"
+        )
+    st.caption(labels["help"])
+
+def portfolio_name(allocation, index_options):
+    """Nome leggibile di un portafoglio ("MSCI World 70% + ...")"""
+    total = sum(allocation.values())
+    return " + ".join(
+        f"{index_options[key]} {100 * weight / total:.0f}%"
+        for key, weight in allocation.items() if weight > 0
+    )
+
+def render_rebalancing(content, language, index_options, allocation):
+    """Classifica delle politiche di ribilanciamento sui portafogli modello"""
+    labels = content["rebalancing"]
+    st.subheader(labels["title"])
+    cost = st.number_input(
+        labels["cost"],
+        min_value=0.0,
+        max_value=2.0,
+        value=100 * DEFAULT_COST,
+        step=0.05,
+        format="%.2f",
+        key="rebalancing_cost"
+    )
+    
+    models = {
+        p.portfolio_id: p for p in model_portfolios(language) if p.allocation is not None
+    }
+    portfolios = {
+        portfolio_id: p.allocation for portfolio_id, p in models.items()
+    }
+    portfolios["custom"] = allocation
+    table = grid_search(portfolios, cost=cost / 100)
+    if not table:
+        st.info(labels["missing"])
+        return
+    
+    names = {portfolio_id: p.title for portfolio_id, p in models.items()}
+    names["custom"] = f"{labels['custom']}: {portfolio_name(allocation, index_options)}"
+    columns = labels["columns"]
+    st.dataframe(
+        {
+            columns["portfolio"]: [names[row["portfolio"]] for row in table],
+            columns["policy"]: [labels["policies"][row["policy"]] for row in table],
+            columns["return"]: [100 * row["return"] for row in table],
+            columns["volatility"]: [100 * row["volatility"] for row in table],
+            columns["turnover"]: [100 * row["turnover"] for row in table],
+            columns["tracking_error"]: [100 * row["tracking_error"] for row in table],
+            columns["rebalances"]: [row["rebalances"] for row in table],
+        },
+        column_config={
+            columns[name]: st.column_config.NumberColumn(format="%.2f%%")
+            for name in ("return", "volatility", "turnover", "tracking_error")
+        } | {columns["rebalances"]: st.column_config.NumberColumn(format="%.1f")},
+        hide_index=True,
+        width="stretch"
+    )
+    st.caption(labels["help"])
+
+def render_projection(index_data, content, language, selected_index):
+    """TAB 7: Proiezione Monte Carlo"""
+    labels = content["projection"]
+    methods = ["parametric"]
+    if selected_index in PRICE_STORE.available():
+        methods.append("bootstrap")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        years = st.slider(
+            labels["horizon"],
+            min_value=1,
+            max_value=40,
+            value=projection_years(index_data),
+            key=f"projection_years_{selected_index}"
+        )
+    with col2:
+        method = st.radio(
+            labels["method"],
+            options=methods,
+            format_func=lambda x: labels["methods"][x],
+            key="projection_method"
+        )
     with col3:
-        st.metric(
-            label=labels['horizon'],
-            value=risk_data['time_horizon'],
-            delta=None
+        n_paths = st.select_slider(
+            labels["paths"],
+            options=[10_000, DEFAULT_PATHS, 1_000_000],
+            value=DEFAULT_PATHS,
+            format_func=lambda x: f"{x:,}",
+            key="projection_paths"
+        )
+    st.caption(labels["help"])
+    
+    title = f"{index_data['name']} - {labels['title']}"
+    key = projection_key(language, selected_index, years, method, n_paths)
+    sources = PRICE_STORE.fingerprint([selected_index])
+    fig = FIGURE_CACHE.get(key, sources)
+    if fig is None:
+        # Il grafico si aggiorna a ogni batch completato; solo la figura
+        # finale entra nella cache condivisa
+        chart = st.empty()
+        progress = st.progress(0.0)
+        for done, percentiles in iter_projection(selected_index, years, n_paths, method):
+            fig = create_fan_chart(percentiles, labels, title, language)
+            chart.plotly_chart(fig, width="stretch")
+            progress.progress(done / n_paths, labels["progress"].format(done=done, total=n_paths))
+        progress.empty()
+        FIGURE_CACHE.put(key, fig, sources)
+    else:
+        st.plotly_chart(fig, width="stretch")
+
+def render_memory_view(content):
+    """Memoria trattenuta da ogni sessione al netto delle strutture condivise"""
+    labels = content["memory"]
+    with st.expander(labels["title"]):
+        rows = session_report()
+        shared = shared_report()
+        rss = process_rss()
+        if rss is not None:
+            st.metric(labels["process"], f"{rss / 2**20:,.0f} MiB")
+        col1, col2 = st.columns(2)
+        col1.metric(labels["sessions"], len(rows))
+        if rows:
+            average = sum(row["bytes"] for row in rows) / len(rows)
+            col2.metric(labels["average"], f"{average / 2**10:,.0f} KiB")
+        columns = labels["columns"]
+        st.dataframe(
+            [
+                {
+                    columns["session"]: row["session"][:8],
+                    columns["size"]: round(row["bytes"] / 2**10, 1),
+                    columns["keys"]: ", ".join(key for key, _ in row["keys"]),
+                }
+                for row in rows
+            ],
+            hide_index=True,
+            width="stretch"
+        )
+        st.caption(labels["shared"] + ": " + " · ".join(
+            f"{labels['shared_names'][name]} {size / 2**20:.1f} MiB"
+            for name, size in shared.items()
+        ))
+        st.caption(labels["figure_caches"] + ": " + " · ".join(
+            labels["cache_stats"].format(name=labels["cache_names"][name], **cache.stats())
+            for name, cache in (("figures", FIGURE_CACHE), ("history", HISTORY_CACHE))
+        ))
+
+# ============================================================================
+# PRE-RISCALDAMENTO
+# ============================================================================
+
+def warm_up_shared():
+    """Calcoli condivisi da tutte le pagine: backtest dei portafogli modello,
+    ottimizzatore, motore di rischio e classifica di ribilanciamento iniziale.
+    Importa anche Plotly prima che una sessione costruisca un grafico."""
+    graph_objects()
+    get_model_backtest()
+    optimizer = get_optimizer()
+    if optimizer is not None:
+        optimizer.result()
+    get_risk_engine()
+    # Stessi input del calcolatore all'apertura: i portafogli modello (uguali in
+    # ogni lingua) più l'allocazione proposta
+    portfolios = {
+        p.portfolio_id: p.allocation
+        for p in model_portfolios(DEFAULT_LANGUAGE) if p.allocation is not None
+    }
+    portfolios["custom"] = DEFAULT_ALLOCATION
+    grid_search(portfolios, cost=DEFAULT_COST)
+
+def warm_up_page(language, index_key, projection=None):
+    """Costruisce testi e figure condivisi di una pagina (lingua, indice) con i
+    valori iniziali dei widget, come li chiederebbe il primo visitatore.
+
+    `projection` sono i percentili Monte Carlo con i parametri predefiniti,
+    calcolati una volta per indice (None per non preparare la proiezione).
+    """
+    content = load_locale(language)
+    index_data = content["indices"][index_key]
+    index_names = {key: content["indices"][key]["name"] for key in COMPOSITION_STORE.index_ids}
+    
+    for field in ("description", "strategy"):
+        MARKDOWN_CACHE.get(language, index_key, field, index_data[field])
+    for dimension, chart_builder in (("geographic", create_pie_chart), ("sectors", create_bar_chart)):
+        get_cached_chart(
+            chart_builder, content["chart_titles"][dimension], language, index_key, dimension
+        )
+        # Il confronto parte con tutti gli indici selezionati
+        get_cached_overlap_chart(
+            content["comparison"]["titles"][dimension],
+            language,
+            list(index_names),
+            index_names,
+            dimension
         )
     
-    with col4:
-        st.metric(
-            label=labels['returns'],
-            value=risk_data['return_potential'],
-            delta=None
+    if index_key in PRICE_STORE.available():
+        dates, _ = PRICE_STORE.get(index_key)
+        get_cached_history_chart(content, language, index_key, dates[0].item(), dates[-1].item())
+        summary = backtest_all(DEFAULT_YEARS, DEFAULT_CONTRIBUTION).get(index_key)
+        if summary is not None:
+            get_cached_pac_chart(
+                content["pac"], language, index_key, DEFAULT_YEARS, DEFAULT_CONTRIBUTION, summary
+            )
+    
+    if projection is not None:
+        labels = content["projection"]
+        key = projection_key(
+            language, index_key, projection_years(index_data), "parametric", DEFAULT_PATHS
         )
+        sources = PRICE_STORE.fingerprint([index_key])
+        if FIGURE_CACHE.get(key, sources) is None:
+            FIGURE_CACHE.put(key, create_fan_chart(
+                projection, labels, f"{index_data['name']} - {labels['title']}", language
+            ), sources)
 
 # ============================================================================
 # INTERFACCIA PRINCIPALE
@@ -1411,35 +900,32 @@ def display_risk_metrics(risk_data, labels, lang):
 def main():
     # Sidebar - Impostazioni
     with st.sidebar:
-        st.title(CONTENT["it"]["sidebar_title"])
+        default_content = load_locale(DEFAULT_LANGUAGE)
+        st.title(default_content["sidebar_title"])
         
-        # Selezione Lingua
+        # Selezione Lingua (i bundle vengono solo elencati, non caricati)
         language = st.selectbox(
-            "🌐 " + CONTENT["it"]["language_label"],
-            options=["it", "en"],
-            format_func=lambda x: "🇮🇹 Italiano" if x == "it" else "🇬🇧 English",
-            index=0
+            "🌐 " + default_content["language_label"],
+            options=available_languages(),
+            format_func=language_name,
+            index=0,
+            key="language"
         )
         
         st.divider()
         
         # Selezione Indice
-        content = CONTENT[language]
+        content = load_locale(language)
         index_options = {
-            "msci_world": content["indices"]["msci_world"]["name"],
-            "sp500": content["indices"]["sp500"]["name"],
-            "msci_em": content["indices"]["msci_em"]["name"],
-            "msci_acwi": content["indices"]["msci_acwi"]["name"],
-            "ftse_all_world": content["indices"]["ftse_all_world"]["name"],
-            "solactive_str": content["indices"]["solactive_str"]["name"],
-            "msci_europe": content["indices"]["msci_europe"]["name"],
-            "msci_emu": content["indices"]["msci_emu"]["name"]
+            key: content["indices"][key]["name"]
+            for key in COMPOSITION_STORE.index_ids
         }
         
         selected_index = st.selectbox(
             "📊 " + content["select_index"],
             options=list(index_options.keys()),
-            format_func=lambda x: index_options[x]
+            format_func=lambda x: index_options[x],
+            key="selected_index"
         )
         
         st.divider()
@@ -1456,6 +942,9 @@ def main():
             Developed with Streamlit
             """
         )
+        
+        if MEMORY_VIEW:
+            render_memory_view(content)
     
     # Header
     st.title(content["app_title"])
@@ -1465,66 +954,48 @@ def main():
     # Dati indice selezionato
     index_data = content["indices"][selected_index]
     
-    # Tabs
-    tab1, tab2, tab3 = st.tabs([
-        content["tabs"]["description"],
-        content["tabs"]["statistics"],
-        content["tabs"]["strategy"]
-    ])
-    
-    # TAB 1: Descrizione
-    with tab1:
-        st.markdown(index_data["description"])
-    
-    # TAB 2: Statistiche
-    with tab2:
-        st.subheader("📊 " + (
-            "Profilo Rischio/Rendimento" if language == "it" else "Risk/Return Profile"
-        ))
-        
-        # Metriche di rischio
-        display_risk_metrics(
-            index_data["risk_profile"],
-            content["metrics_labels"],
-            language
+    # Tabs: in modalità lazy l'etichetta attiva è ricordata tramite un id
+    # indipendente dalla lingua, così il cambio lingua non riporta alla prima tab
+    tab_labels = [content["tabs"][tab_id] for tab_id in TAB_IDS]
+    if LAZY_TABS:
+        active_tab = st.session_state.get("active_tab", TAB_IDS[0])
+        tabs = st.tabs(
+            tab_labels,
+            default=content["tabs"][active_tab],
+            on_change="rerun",
+            key="tab"
         )
-        
-        st.divider()
-        
-        # Grafici di composizione
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.subheader(content["chart_titles"]["geographic"])
-            fig_geo = create_pie_chart(
-                index_data["composition"]["geographic"],
-                content["chart_titles"]["geographic"],
-                language
-            )
-            st.plotly_chart(fig_geo, use_container_width=True)
-        
-        with col2:
-            st.subheader(content["chart_titles"]["sectors"])
-            fig_sectors = create_bar_chart(
-                index_data["composition"]["sectors"],
-                content["chart_titles"]["sectors"],
-                language
-            )
-            st.plotly_chart(fig_sectors, use_container_width=True)
+        for tab_id, tab in zip(TAB_IDS, tabs):
+            if tab.open:
+                st.session_state["active_tab"] = tab_id
+    else:
+        tabs = st.tabs(tab_labels)
     
-    # TAB 3: Strategia
-    with tab3:
-        st.markdown(index_data["strategy"])
+    renderers = {
+        "description": lambda: render_description(index_data, language, selected_index),
+        "statistics": lambda: render_statistics(
+            index_data, content, language, selected_index
+        ),
+        "strategy": lambda: render_strategy(
+            index_data, content, language, selected_index
+        ),
+        "history": lambda: render_history(content, language, selected_index),
+        "comparison": lambda: render_comparison(content, language, index_options),
+        "portfolio": lambda: render_portfolio(content, language, index_options),
+        "projection": lambda: render_projection(
+            index_data, content, language, selected_index
+        ),
+    }
+    for tab_id, tab in zip(TAB_IDS, tabs):
+        # tab.open è None quando le tab non sono lazy: si esegue tutto
+        if tab.open is False:
+            continue
+        with tab:
+            renderers[tab_id]()
     
     # Footer
     st.divider()
-    st.caption(
-        "💡 " + (
-            "I dati mostrati sono a scopo puramente didattico. Per investimenti reali, consulta un consulente finanziario."
-            if language == "it"
-            else "The data shown is for educational purposes only. For real investments, consult a financial advisor."
-        )
-    )
+    st.caption("💡 " + content["disclaimer"])
 
 if __name__ == "__main__":
     main()
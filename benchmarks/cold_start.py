@@ -0,0 +1,104 @@
+"""
+AssetExpl - Cold-start budget
+Measures, in fresh interpreters, how long importing app.py and rendering the
+first page take, and fails when the budget is exceeded.
+
+Usage:
+    python benchmarks/cold_start.py [--runs 5] [--output cold_start.json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "app.py")
+
+# Budget in secondi (mediana sulle esecuzioni). L'import di Streamlit è
+# misurato a parte perché non dipende dal codice dell'app.
+BUDGET = {
+    "app_import_s": 0.25,
+    "first_render_s": 1.0,
+}
+
+# Moduli pesanti che non devono essere caricati dall'import di app.py.
+# Il pacchetto `plotly` di primo livello è già importato da Streamlit, ma
+# plotly.express e le classi delle figure vengono caricati solo su richiesta.
+DEFERRED_MODULES = ("plotly.express", "plotly.graph_objs._figure", "pandas")
+
+# Codice eseguito in un interprete nuovo per ogni misura
+PROBE = r"""
+import json, sys, time
+sys.path.insert(0, {root!r})
+t0 = time.perf_counter()
+import streamlit
+t1 = time.perf_counter()
+import app
+t2 = time.perf_counter()
+heavy_at_import = [name for name in {deferred!r} if name in sys.modules]
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app_path!r}, default_timeout=120)
+t3 = time.perf_counter()
+at.run()
+t4 = time.perf_counter()
+if at.exception:
+    raise SystemExit("first render failed: %s" % at.exception)
+print(json.dumps({{
+    "streamlit_import_s": t1 - t0,
+    "app_import_s": t2 - t1,
+    "first_render_s": t4 - t3,
+    "loaded_at_import": heavy_at_import,
+}}))
+"""
+
+
+def measure_once():
+    """Esegue una misura in un processo Python separato"""
+    code = PROBE.format(root=ROOT, app_path=APP_PATH, deferred=DEFERRED_MODULES)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, cwd=ROOT, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure(runs):
+    """Restituisce le mediane delle misure e il confronto con il budget"""
+    samples = [measure_once() for _ in range(runs)]
+    report = {
+        key: statistics.median(sample[key] for sample in samples)
+        for key in ("streamlit_import_s", "app_import_s", "first_render_s")
+    }
+    report["loaded_at_import"] = sorted({
+        name for sample in samples for name in sample["loaded_at_import"]
+    })
+    report["runs"] = runs
+    report["budget"] = BUDGET
+    report["over_budget"] = sorted(
+        key for key, limit in BUDGET.items() if report[key] > limit
+    )
+    if report["loaded_at_import"]:
+        report["over_budget"].append("loaded_at_import")
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", help="scrive il report JSON anche su file")
+    args = parser.parse_args()
+
+    report = measure(args.runs)
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    return 1 if report["over_budget"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,450 @@
+"""
+AssetExpl - Concurrent-session load test
+Starts app.py in a local Streamlit server and drives hundreds of concurrent
+websocket sessions that change language, index and tab like a browser does,
+recording rerun latency percentiles, server CPU and server RSS. Runs offline
+(localhost only); CPU and RSS are read from /proc, so the server side needs
+Linux.
+
+Every rerun is timed from the message sent by the client to the server's
+"script finished" message, which is what a user waits for after a click.
+
+Usage:
+    python benchmarks/load_test.py [--sessions 200] [--duration 60]
+                                   [--think-time 2.0] [--ramp-up 10]
+                                   [--output report.json]
+                                   [--baseline baseline.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+
+import numpy as np
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "app.py")
+
+# Azioni di un utente simulato e loro frequenza relativa
+ACTIONS = {"language": 1, "index": 3, "tab": 6}
+PERCENTILES = (50, 90, 95, 99)
+# Intervallo di campionamento di CPU e RSS del server
+SAMPLE_INTERVAL = 0.5
+# Regressione segnalata se una metrica supera il baseline di questa frazione
+DEFAULT_TOLERANCE = 0.25
+RERUN_TIMEOUT = 120
+
+
+# ============================================================================
+# SERVER
+# ============================================================================
+
+def free_port():
+    """Porta TCP libera su localhost"""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port, log):
+    """Avvia `streamlit run app.py` in un processo separato (ambiente ereditato).
+
+    Lo stderr va nel file `log` e non in una pipe: nessuno la leggerebbe
+    durante il test, e un server che scrive molto si bloccherebbe a pipe piena.
+    """
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", APP_PATH,
+            "--server.headless", "true",
+            "--server.address", "127.0.0.1",
+            "--server.port", str(port),
+            "--server.fileWatcherType", "none",
+            "--browser.gatherUsageStats", "false",
+        ],
+        cwd=ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=log,
+    )
+
+
+def wait_healthy(server, port, log, timeout=60):
+    """Attende che l'endpoint di health del server risponda"""
+    deadline = time.monotonic() + timeout
+    url = f"http://127.0.0.1:{port}/_stcore/health"
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            log.seek(0)
+            raise RuntimeError(f"server terminato: {log.read().decode(errors='replace')}")
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    return
+        except OSError:
+            time.sleep(0.2)
+    raise TimeoutError(f"server non pronto entro {timeout} s")
+
+
+class ProcessSampler(threading.Thread):
+    """Campiona CPU (% di un core) e RSS di un processo da /proc"""
+
+    def __init__(self, pid, interval=SAMPLE_INTERVAL):
+        super().__init__(name="load-test-sampler", daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.samples = []
+        self._done = threading.Event()
+        self._ticks = os.sysconf("SC_CLK_TCK")
+        self._page = os.sysconf("SC_PAGE_SIZE")
+
+    def read(self):
+        """(secondi di CPU consumati, RSS in byte) del processo"""
+        with open(f"/proc/{self.pid}/stat") as f:
+            # Il nome del comando può contenere spazi: i campi seguono l'ultima ")"
+            fields = f.read().rsplit(")", 1)[1].split()
+        with open(f"/proc/{self.pid}/statm") as f:
+            rss_pages = int(f.read().split()[1])
+        return (int(fields[11]) + int(fields[12])) / self._ticks, rss_pages * self._page
+
+    def run(self):
+        start = time.monotonic()
+        last_time, (last_cpu, _) = start, self.read()
+        while not self._done.wait(self.interval):
+            try:
+                cpu, rss = self.read()
+            except (OSError, IndexError, ValueError):
+                break
+            now = time.monotonic()
+            self.samples.append({
+                "t_s": round(now - start, 3),
+                "cpu_percent": 100 * (cpu - last_cpu) / (now - last_time),
+                "rss_bytes": rss,
+            })
+            last_time, last_cpu = now, cpu
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+
+# ============================================================================
+# SESSIONI SIMULATE
+# ============================================================================
+
+class Session:
+    """Una sessione websocket che si comporta come il frontend di Streamlit.
+
+    Lo stato dell'utente è tenuto per posizione (lingua, indice, tab) e
+    convertito a ogni rerun nei valori mostrati dall'ultimo rendering, perché
+    le etichette e l'id del widget delle tab cambiano con la lingua.
+    """
+
+    def __init__(self, websocket, rng):
+        self.websocket = websocket
+        self.rng = rng
+        self.selectboxes = {}   # chiave del widget -> (id, opzioni)
+        self.tabs = None        # (id, etichette)
+        self.choice = {"language": 0, "selected_index": 0}
+        self.tab = None
+        self.exceptions = []    # "Tipo: messaggio" di ogni eccezione mostrata dall'app
+
+    def widget_states(self):
+        """Stato dei widget da inviare, come farebbe il browser"""
+        states = {}
+        for key, position in self.choice.items():
+            if key in self.selectboxes:
+                widget_id, options = self.selectboxes[key]
+                states[widget_id] = options[position % len(options)]
+        if self.tab is not None and self.tabs is not None:
+            tab_id, labels = self.tabs
+            states[tab_id] = labels[self.tab % len(labels)]
+        return states
+
+    async def rerun(self):
+        """Chiede un rerun e attende la fine dello script; restituisce i secondi trascorsi"""
+        message = BackMsg()
+        message.rerun_script.query_string = ""
+        for widget_id, value in self.widget_states().items():
+            widget = message.rerun_script.widget_states.widgets.add()
+            widget.id = widget_id
+            widget.string_value = value
+
+        start = time.perf_counter()
+        await self.websocket.send(message.SerializeToString())
+        tab_id, labels = None, []
+        while True:
+            forward = ForwardMsg()
+            forward.ParseFromString(await asyncio.wait_for(self.websocket.recv(), RERUN_TIMEOUT))
+            kind = forward.WhichOneof("type")
+            if kind == "script_finished":
+                break
+            if kind != "delta":
+                continue
+            delta = forward.delta
+            if delta.WhichOneof("type") == "new_element":
+                element = delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type == "selectbox":
+                    widget_id = element.selectbox.id
+                    self.selectboxes[widget_id.rsplit("-", 1)[-1]] = (
+                        widget_id, list(element.selectbox.options)
+                    )
+                elif element_type == "exception":
+                    self.exceptions.append(
+                        f"{element.exception.type}: {element.exception.message}"
+                    )
+            elif delta.WhichOneof("type") == "add_block":
+                block = delta.add_block
+                if block.WhichOneof("type") == "tab_container":
+                    tab_id = block.tab_container.id
+                elif block.WhichOneof("type") == "tab":
+                    labels.append(block.tab.label)
+        elapsed = time.perf_counter() - start
+        if tab_id:
+            self.tabs = (tab_id, labels)
+        return elapsed
+
+    def act(self):
+        """Sceglie e applica un'azione casuale; restituisce il suo nome"""
+        action = self.rng.choices(list(ACTIONS), weights=list(ACTIONS.values()))[0]
+        if action == "language":
+            self.choice["language"] += 1
+        elif action == "index":
+            options = self.selectboxes.get("selected_index", (None, [None]))[1]
+            self.choice["selected_index"] = self.rng.randrange(len(options))
+        else:
+            labels = self.tabs[1] if self.tabs else [None]
+            self.tab = self.rng.randrange(len(labels))
+        return action
+
+
+async def session_loop(url, seed, delay, deadline, think_time, latencies, errors):
+    """Apre una sessione, poi esegue azioni con pause casuali fino alla scadenza"""
+    from websockets.asyncio.client import connect
+
+    rng = random.Random(seed)
+    await asyncio.sleep(delay)
+    session = None
+    try:
+        async with connect(url, subprotocols=["streamlit"], max_size=None,
+                           open_timeout=RERUN_TIMEOUT) as websocket:
+            session = Session(websocket, rng)
+            latencies.setdefault("connect", []).append(await session.rerun())
+            while time.monotonic() < deadline:
+                await asyncio.sleep(rng.expovariate(1 / think_time))
+                if time.monotonic() >= deadline:
+                    break
+                action = session.act()
+                latencies.setdefault(action, []).append(await session.rerun())
+    except (OSError, asyncio.TimeoutError) as e:
+        errors["connection"] += 1
+        errors.setdefault("messages", []).append(repr(e))
+    except Exception as e:  # noqa: BLE001 - chiusure del websocket e simili
+        errors["connection"] += 1
+        errors.setdefault("messages", []).append(repr(e))
+    finally:
+        # Anche le eccezioni viste prima di un errore di connessione
+        if session is not None:
+            errors["exceptions"] += len(session.exceptions)
+            errors["exception_messages"].extend(session.exceptions)
+
+
+async def drive(url, sessions, duration, think_time, ramp_up, seed):
+    """Esegue tutte le sessioni in parallelo e raccoglie latenze ed errori"""
+    latencies = {}
+    errors = {"connection": 0, "exceptions": 0, "exception_messages": []}
+    deadline = time.monotonic() + ramp_up + duration
+    await asyncio.gather(*(
+        session_loop(
+            url, seed + n, ramp_up * n / max(sessions, 1), deadline,
+            think_time, latencies, errors
+        )
+        for n in range(sessions)
+    ))
+    messages = errors.pop("messages", [])
+    errors["sample_messages"] = sorted(set(messages))[:5]
+    # Le prime eccezioni distinte, nell'ordine in cui sono comparse
+    errors["exception_messages"] = list(dict.fromkeys(errors["exception_messages"]))[:5]
+    return latencies, errors
+
+
+# ============================================================================
+# REPORT
+# ============================================================================
+
+def latency_summary(values):
+    """Numero di rerun, percentili e massimo in millisecondi"""
+    values = np.asarray(values) * 1000
+    summary = {"count": int(values.size)}
+    if values.size:
+        for p, v in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+            summary[f"p{p}_ms"] = float(v)
+        summary["max_ms"] = float(values.max())
+    return summary
+
+
+def server_summary(samples):
+    """CPU media e massima, RSS iniziale, di picco e finale del server"""
+    if not samples:
+        return {}
+    cpu = [s["cpu_percent"] for s in samples]
+    rss = [s["rss_bytes"] for s in samples]
+    return {
+        "cpu_mean_percent": float(np.mean(cpu)),
+        "cpu_max_percent": float(np.max(cpu)),
+        "rss_start_bytes": rss[0],
+        "rss_peak_bytes": max(rss),
+        "rss_end_bytes": rss[-1],
+    }
+
+
+def run_load_test(sessions, duration, think_time, ramp_up, seed, port=None):
+    """Avvia il server, esegue il carico e restituisce il report"""
+    port = port or free_port()
+    log = tempfile.TemporaryFile()
+    server = start_server(port, log)
+    try:
+        wait_healthy(server, port, log)
+        sampler = ProcessSampler(server.pid)
+        sampler.start()
+        client_start = resource.getrusage(resource.RUSAGE_SELF)
+        start = time.monotonic()
+        latencies, errors = asyncio.run(drive(
+            f"ws://127.0.0.1:{port}/_stcore/stream",
+            sessions, duration, think_time, ramp_up, seed
+        ))
+        elapsed = time.monotonic() - start
+        client_end = resource.getrusage(resource.RUSAGE_SELF)
+        sampler.stop()
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+        log.close()
+
+    reruns = [value for action, values in latencies.items() if action != "connect"
+              for value in values]
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "config": {
+            "sessions": sessions,
+            "duration_s": duration,
+            "think_time_s": think_time,
+            "ramp_up_s": ramp_up,
+            "seed": seed,
+            "env": {k: v for k, v in os.environ.items() if k.startswith("ASSETEXPL_")},
+        },
+        "elapsed_s": elapsed,
+        "throughput_reruns_s": len(reruns) / elapsed,
+        # Il client gira sulla stessa macchina: se satura la CPU, le latenze
+        # misurate includono anche la sua coda
+        "client_cpu_s": (client_end.ru_utime + client_end.ru_stime)
+                        - (client_start.ru_utime + client_start.ru_stime),
+        "errors": errors,
+        "latency": {
+            "all": latency_summary(reruns),
+            **{action: latency_summary(values) for action, values in sorted(latencies.items())},
+        },
+        "server": server_summary(sampler.samples),
+        "samples": sampler.samples,
+    }
+
+
+def compare(report, baseline, tolerance):
+    """Confronta percentili di latenza, CPU e RSS con un report precedente"""
+    metrics = [("latency", "all", name) for name in ("p50_ms", "p95_ms", "p99_ms")]
+    metrics += [("server", None, name) for name in ("cpu_mean_percent", "rss_peak_bytes")]
+    regressions = []
+    for section, group, name in metrics:
+        old = baseline.get(section, {})
+        new = report.get(section, {})
+        if group is not None:
+            old, new = old.get(group, {}), new.get(group, {})
+        if old.get(name) and new.get(name, 0) > old[name] * (1 + tolerance):
+            regressions.append({
+                "metric": ".".join(filter(None, (section, group, name))),
+                "baseline": old[name],
+                "current": new[name],
+            })
+    return regressions
+
+
+def main():
+    try:
+        import websockets  # noqa: F401
+    except ImportError:
+        sys.exit("Il load test richiede websockets: pip install websockets")
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=60, help="secondi a regime")
+    parser.add_argument("--think-time", type=float, default=2.0,
+                        help="pausa media tra due azioni di una sessione (secondi)")
+    parser.add_argument("--ramp-up", type=float, default=10,
+                        help="secondi in cui vengono aperte tutte le sessioni")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--port", type=int, help="porta del server (libera se omessa)")
+    parser.add_argument("--output", help="file JSON del report")
+    parser.add_argument("--baseline", help="file JSON di un'esecuzione precedente")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    report = run_load_test(
+        args.sessions, args.duration, args.think_time, args.ramp_up, args.seed, args.port
+    )
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            report["regressions"] = compare(report, json.load(f), args.tolerance)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    for action, summary in report["latency"].items():
+        if summary["count"]:
+            print(
+                f"{action:<10}{summary['count']:7d} rerun"
+                + "".join(f"{summary[f'p{p}_ms']:9.0f}" for p in PERCENTILES) + " ms"
+                f" (p{'/p'.join(map(str, PERCENTILES))})",
+                file=sys.stderr
+            )
+    server = report["server"]
+    if server:
+        print(
+            f"server: CPU media {server['cpu_mean_percent']:.0f}% "
+            f"(max {server['cpu_max_percent']:.0f}%), "
+            f"RSS {server['rss_start_bytes'] / 2**20:.0f} -> "
+            f"{server['rss_peak_bytes'] / 2**20:.0f} MiB di picco",
+            file=sys.stderr
+        )
+    print(f"throughput: {report['throughput_reruns_s']:.1f} rerun/s, "
+          f"errori: {report['errors']['connection']} connessioni, "
+          f"{report['errors']['exceptions']} eccezioni", file=sys.stderr)
+    for message in report["errors"]["exception_messages"]:
+        print(f"  {message}", file=sys.stderr)
+    failed = report["errors"]["connection"] or report["errors"]["exceptions"]
+    return 1 if report.get("regressions") or failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""
+AssetExpl - Rerun latency benchmark
+Drives main() headlessly through Streamlit's AppTest for every language
+bundle, every index and every tab, and records wall time, peak Python memory
+and Plotly payload bytes per rerun. Runs offline.
+
+In "lazy" mode only the visible tab runs, so each tab is measured on its own;
+in "eager" mode (ASSETEXPL_LAZY_TABS=0) every rerun executes all tabs.
+
+Usage:
+    python benchmarks/rerun_latency.py [--repeats 5] [--mode both]
+                                       [--output results.json]
+                                       [--baseline baseline.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, "app.py")
+sys.path.insert(0, ROOT)
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from composition_store import COMPOSITION_STORE  # noqa: E402
+from figure_cache import FIGURE_CACHE, HISTORY_CACHE  # noqa: E402
+from locales import available_languages, load_locale  # noqa: E402
+
+MODES = ("lazy", "eager")
+
+# Regressione segnalata se la mediana supera il baseline di questa frazione
+DEFAULT_TOLERANCE = 0.25
+
+
+def plotly_payload_bytes(at):
+    """Byte delle specifiche Plotly inviate al browser nell'ultimo rerun"""
+    return sum(len(chart.proto.spec.encode("utf-8")) for chart in at.get("plotly_chart"))
+
+
+def timed_run(at):
+    """Esegue un rerun e ne restituisce la durata in secondi"""
+    start = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"rerun fallito: {at.exception}")
+    return elapsed
+
+
+def select(at, language, index_key, tab_id):
+    """Imposta lingua, indice e tab visibile, senza rieseguire"""
+    at.selectbox(key="language").set_value(language)
+    at.selectbox(key="selected_index").set_value(index_key)
+    if tab_id != "all":
+        # Anche l'id neutro: al cambio lingua la tab viene ricreata da quello
+        at.session_state["active_tab"] = tab_id
+        at.session_state["tab"] = load_locale(language)["tabs"][tab_id]
+
+
+def bench_page(at, mode, language, index_key, tab_id, repeats):
+    """Misura i rerun di una pagina (lingua, indice, tab)"""
+    select(at, language, index_key, tab_id)
+    first = timed_run(at)
+    if tab_id != "all" and at.session_state["active_tab"] != tab_id:
+        raise RuntimeError(f"tab {tab_id!r} non selezionata")
+    walls = [timed_run(at) for _ in range(repeats)]
+
+    # Passata separata con tracemalloc, che rallenta l'esecuzione
+    tracemalloc.start()
+    try:
+        at.run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "mode": mode,
+        "language": language,
+        "index": index_key,
+        "tab": tab_id,
+        "first_wall_s": first,
+        "wall_median_s": statistics.median(walls),
+        "wall_min_s": min(walls),
+        "peak_memory_bytes": peak,
+        "plotly_payload_bytes": plotly_payload_bytes(at),
+    }
+
+
+def run_mode(mode, repeats):
+    """Misura tutte le combinazioni (lingua, indice, tab) in una modalità"""
+    os.environ["ASSETEXPL_LAZY_TABS"] = "1" if mode == "lazy" else "0"
+    at = AppTest.from_file(APP_PATH, default_timeout=120)
+    at.run()
+    return [
+        bench_page(at, mode, language, index_key, tab_id, repeats)
+        for language in available_languages()
+        for index_key in COMPOSITION_STORE.index_ids
+        for tab_id in (load_locale(language)["tabs"] if mode == "lazy" else ("all",))
+    ]
+
+
+def summarize(results):
+    """Media della latenza mediana per modalità e risparmio delle tab lazy.
+
+    La media sulle tab lazy equivale a un utente che visita ogni tab con la
+    stessa frequenza; il confronto è con il rerun eager che le esegue tutte.
+    """
+    summary = {}
+    for mode in MODES:
+        walls = [r["wall_median_s"] for r in results if r["mode"] == mode]
+        if walls:
+            summary[f"{mode}_mean_wall_s"] = statistics.mean(walls)
+    if len(summary) == len(MODES):
+        summary["lazy_saving"] = 1 - summary["lazy_mean_wall_s"] / summary["eager_mean_wall_s"]
+    return summary
+
+
+def run_suite(repeats, modes):
+    """Misura tutte le pagine nelle modalità richieste"""
+    results = [result for mode in modes for result in run_mode(mode, repeats)]
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "repeats": repeats,
+        "summary": summarize(results),
+        # AppTest esegue app.py in questo processo: le cache sono le stesse
+        "figure_caches": {"figures": FIGURE_CACHE.stats(), "history": HISTORY_CACHE.stats()},
+        "results": results,
+    }
+
+
+def compare(report, baseline, tolerance):
+    """Confronta le mediane con un baseline salvato e restituisce le regressioni"""
+    def page(r):
+        return r.get("mode", "eager"), r["language"], r["index"], r["tab"]
+
+    reference = {page(r): r for r in baseline["results"]}
+    regressions = []
+    for result in report["results"]:
+        old = reference.get(page(result))
+        if old is None:
+            continue
+        for metric in ("wall_median_s", "peak_memory_bytes", "plotly_payload_bytes"):
+            if old[metric] and result[metric] > old[metric] * (1 + tolerance):
+                regressions.append({
+                    "mode": result["mode"],
+                    "language": result["language"],
+                    "index": result["index"],
+                    "tab": result["tab"],
+                    "metric": metric,
+                    "baseline": old[metric],
+                    "current": result[metric],
+                })
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--mode", choices=MODES + ("both",), default="both")
+    parser.add_argument("--output", help="file JSON dei risultati")
+    parser.add_argument("--baseline", help="file JSON di un'esecuzione precedente")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    modes = MODES if args.mode == "both" else (args.mode,)
+    report = run_suite(args.repeats, modes)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            report["regressions"] = compare(report, json.load(f), args.tolerance)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    for result in report["results"]:
+        print(
+            f"{result['mode']:<6}{result['language']:>3} {result['index']:<16} {result['tab']:<12}"
+            f"{result['wall_median_s'] * 1000:8.1f} ms"
+            f"{result['peak_memory_bytes'] / 1024:10.0f} KiB"
+            f"{result['plotly_payload_bytes']:10d} B",
+            file=sys.stderr
+        )
+    for key, value in report["summary"].items():
+        print(f"{key}: {value:.4f}", file=sys.stderr)
+    for name, stats in report["figure_caches"].items():
+        print(
+            f"cache {name}: {stats['hits']} hit, {stats['misses']} miss"
+            f" ({stats['hit_rate']:.1%}), {stats['size']}/{stats['maxsize']} figure",
+            file=sys.stderr
+        )
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+"""
+AssetExpl - Multi-index comparator
+Pairwise composition overlap between indices, computed with array operations
+over the (indices x categories) weight matrix of the composition store
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from composition_store import COMPOSITION_STORE
+
+# Righe elaborate per blocco: limita la memoria temporanea a
+# block_rows x indici x categorie valori, anche con migliaia di indici
+DEFAULT_BLOCK_ROWS = 256
+
+
+def overlap_matrix(weights, block_rows=DEFAULT_BLOCK_ROWS):
+    """Sovrapposizione a coppie tra le righe di una matrice di pesi percentuali.
+
+    La sovrapposizione tra due indici è la somma, categoria per categoria, del
+    peso minore dei due: 100 per composizioni identiche, 0 se disgiunte.
+    """
+    weights = np.asarray(weights, dtype=np.float32)
+    n = weights.shape[0]
+    result = np.empty((n, n), dtype=np.float32)
+    for start in range(0, n, block_rows):
+        block = weights[start:start + block_rows]
+        np.minimum(block[:, None, :], weights[None, :, :]).sum(
+            axis=2, out=result[start:start + block_rows]
+        )
+    return result
+
+
+@lru_cache(maxsize=None)
+def catalog_overlap(dimension):
+    """Matrice di sovrapposizione dell'intero catalogo, calcolata una volta per processo"""
+    matrix = overlap_matrix(COMPOSITION_STORE.matrix(dimension))
+    matrix.flags.writeable = False
+    return matrix
+
+
+def subset_overlap(index_keys, dimension):
+    """Sovrapposizione tra gli indici scelti, estratta dalla matrice del catalogo"""
+    positions = [COMPOSITION_STORE.position(key) for key in index_keys]
+    return catalog_overlap(dimension)[np.ix_(positions, positions)]
@@ -0,0 +1,319 @@
+"""
+AssetExpl - Composition store
+Language-neutral, columnar storage of index compositions, built once at import
+"""
+
+import sys
+import threading
+
+import numpy as np
+
+from locales import load_locale
+
+DIMENSIONS = ("geographic", "sectors")
+
+# Colori delle categorie nei grafici di composizione (app e report): palette
+# qualitativa Set3 di Plotly, copiata qui per non importare plotly.express
+# solo per leggerla
+PIE_COLORS = [
+    'rgb(141,211,199)', 'rgb(255,255,179)', 'rgb(190,186,218)',
+    'rgb(251,128,114)', 'rgb(128,177,211)', 'rgb(253,180,98)',
+    'rgb(179,222,105)', 'rgb(252,205,229)', 'rgb(217,217,217)',
+    'rgb(188,128,189)', 'rgb(204,235,197)', 'rgb(255,237,111)'
+]
+
+# ============================================================================
+# DATI DI COMPOSIZIONE (indipendenti dalla lingua)
+# ============================================================================
+
+# Pesi percentuali per indice e dimensione, espressi con codici di categoria.
+# L'ordine delle voci è quello di visualizzazione nei grafici.
+COMPOSITIONS = {
+    "msci_world": {
+        "geographic": (
+            ("usa", 70.5),
+            ("japan", 6.2),
+            ("united_kingdom", 4.1),
+            ("france", 3.4),
+            ("canada", 3.2),
+            ("switzerland", 2.8),
+            ("germany", 2.5),
+            ("australia", 2.1),
+            ("others", 5.2),
+        ),
+        "sectors": (
+            ("technology", 23.5),
+            ("finance", 14.8),
+            ("healthcare", 12.3),
+            ("consumer_cyclical", 11.2),
+            ("industrials", 10.5),
+            ("consumer_staples", 7.8),
+            ("energy", 4.9),
+            ("utilities", 3.2),
+            ("materials", 4.1),
+            ("others", 7.7),
+        ),
+    },
+    "sp500": {
+        "geographic": (
+            ("usa", 100.0),
+        ),
+        "sectors": (
+            ("technology", 29.3),
+            ("healthcare", 13.2),
+            ("finance", 12.8),
+            ("consumer_cyclical", 10.9),
+            ("communication_services", 8.7),
+            ("industrials", 8.4),
+            ("consumer_staples", 6.1),
+            ("energy", 3.8),
+            ("utilities", 2.5),
+            ("materials", 2.4),
+            ("real_estate", 2.0),
+        ),
+    },
+    "msci_em": {
+        "geographic": (
+            ("china", 28.5),
+            ("taiwan", 16.8),
+            ("india", 18.2),
+            ("south_korea", 11.4),
+            ("brazil", 5.1),
+            ("saudi_arabia", 3.8),
+            ("south_africa", 3.2),
+            ("mexico", 2.4),
+            ("thailand", 2.1),
+            ("others", 8.5),
+        ),
+        "sectors": (
+            ("technology", 21.4),
+            ("finance", 20.3),
+            ("consumer_cyclical", 13.8),
+            ("communication_services", 9.7),
+            ("materials", 8.2),
+            ("energy", 6.8),
+            ("industrials", 6.1),
+            ("consumer_staples", 5.9),
+            ("healthcare", 4.2),
+            ("utilities", 2.4),
+            ("others", 1.2),
+        ),
+    },
+    "msci_acwi": {
+        "geographic": (
+            ("usa", 62.3),
+            ("japan", 5.4),
+            ("united_kingdom", 3.6),
+            ("china", 3.2),
+            ("france", 3.0),
+            ("canada", 2.8),
+            ("india", 2.1),
+            ("taiwan", 1.9),
+            ("switzerland", 2.4),
+            ("others", 13.3),
+        ),
+        "sectors": (
+            ("technology", 23.8),
+            ("finance", 15.6),
+            ("healthcare", 11.9),
+            ("consumer_cyclical", 11.5),
+            ("industrials", 10.2),
+            ("consumer_staples", 7.4),
+            ("communication_services", 7.1),
+            ("energy", 4.7),
+            ("materials", 4.3),
+            ("others", 3.5),
+        ),
+    },
+    "ftse_all_world": {
+        "geographic": (
+            ("usa", 61.8),
+            ("japan", 5.6),
+            ("united_kingdom", 3.8),
+            ("china", 3.4),
+            ("canada", 3.1),
+            ("france", 2.9),
+            ("switzerland", 2.5),
+            ("germany", 2.3),
+            ("india", 2.2),
+            ("taiwan", 1.9),
+            ("others", 10.5),
+        ),
+        "sectors": (
+            ("technology", 24.1),
+            ("finance", 15.3),
+            ("consumer_cyclical", 11.8),
+            ("healthcare", 11.6),
+            ("industrials", 10.4),
+            ("consumer_staples", 7.2),
+            ("communication_services", 6.9),
+            ("energy", 4.6),
+            ("materials", 4.2),
+            ("others", 3.9),
+        ),
+    },
+    "solactive_str": {
+        "geographic": (
+            ("eurozone", 100.0),
+        ),
+        "sectors": (
+            ("overnight_rate_swaps", 70.0),
+            ("money_market", 20.0),
+            ("cash_collateral", 10.0),
+        ),
+    },
+    "msci_europe": {
+        "geographic": (
+            ("united_kingdom", 23.5),
+            ("france", 19.2),
+            ("switzerland", 16.8),
+            ("germany", 14.3),
+            ("netherlands", 7.2),
+            ("sweden", 5.8),
+            ("denmark", 4.1),
+            ("spain", 3.9),
+            ("italy", 3.2),
+            ("others", 2.0),
+        ),
+        "sectors": (
+            ("finance", 18.4),
+            ("healthcare", 16.2),
+            ("industrials", 14.8),
+            ("consumer_cyclical", 12.1),
+            ("consumer_staples", 10.9),
+            ("technology", 8.3),
+            ("energy", 6.7),
+            ("materials", 5.9),
+            ("utilities", 4.2),
+            ("others", 2.5),
+        ),
+    },
+    "msci_emu": {
+        "geographic": (
+            ("france", 35.8),
+            ("germany", 27.2),
+            ("netherlands", 13.4),
+            ("spain", 8.9),
+            ("italy", 7.6),
+            ("ireland", 3.2),
+            ("belgium", 2.1),
+            ("finland", 1.2),
+            ("others", 0.6),
+        ),
+        "sectors": (
+            ("finance", 17.8),
+            ("industrials", 16.4),
+            ("healthcare", 14.2),
+            ("consumer_cyclical", 13.6),
+            ("consumer_staples", 11.8),
+            ("technology", 9.3),
+            ("energy", 5.9),
+            ("materials", 5.7),
+            ("utilities", 3.8),
+            ("others", 1.5),
+        ),
+    },
+}
+
+# ============================================================================
+# STORE COLONNARE
+# ============================================================================
+
+def _readonly(array):
+    """Marca un array come immutabile, così può essere condiviso tra sessioni"""
+    array.flags.writeable = False
+    return array
+
+
+class CompositionStore:
+    """Composizioni di tutti gli indici in formato colonnare.
+
+    Per ogni dimensione le categorie sono internate in codici interi; le voci
+    di tutti gli indici sono concatenate in due array (`codes`, `weights`)
+    delimitati da `offsets`, come in una matrice sparsa CSR. Le etichette
+    tradotte sono tabelle separate per lingua, allineate ai codici e create
+    solo quando la lingua viene usata per la prima volta.
+    """
+
+    def __init__(self, compositions, label_loader=None):
+        self.index_ids = tuple(sys.intern(key) for key in compositions)
+        self._positions = {key: pos for pos, key in enumerate(self.index_ids)}
+        self._categories = {}
+        self._codes = {}
+        self._weights = {}
+        self._offsets = {}
+        self._matrices = {}
+        self._labels = {}
+        self._labels_lock = threading.Lock()
+        self._label_loader = label_loader or (
+            lambda lang: load_locale(lang)["categories"]
+        )
+
+        for dim in DIMENSIONS:
+            category_ids = {}
+            codes, weights, offsets = [], [], [0]
+            for key in self.index_ids:
+                for category, weight in compositions[key][dim]:
+                    code = category_ids.setdefault(sys.intern(category), len(category_ids))
+                    codes.append(code)
+                    weights.append(weight)
+                offsets.append(len(codes))
+
+            self._categories[dim] = tuple(category_ids)
+            self._codes[dim] = _readonly(np.array(codes, dtype=np.int32))
+            self._weights[dim] = _readonly(np.array(weights, dtype=np.float64))
+            self._offsets[dim] = _readonly(np.array(offsets, dtype=np.int32))
+
+            matrix = np.zeros((len(self.index_ids), len(category_ids)))
+            rows = np.repeat(np.arange(len(self.index_ids)), np.diff(offsets))
+            matrix[rows, self._codes[dim]] = self._weights[dim]
+            self._matrices[dim] = _readonly(matrix)
+
+    def _label_tables(self, lang):
+        """Tabelle delle etichette della lingua, create al primo accesso"""
+        tables = self._labels.get(lang)
+        if tables is None:
+            with self._labels_lock:
+                tables = self._labels.get(lang)
+                if tables is None:
+                    names = self._label_loader(lang)
+                    tables = {
+                        dim: _readonly(np.array(
+                            [names[dim][category] for category in self._categories[dim]],
+                            dtype=object
+                        ))
+                        for dim in DIMENSIONS
+                    }
+                    self._labels[lang] = tables
+        return tables
+
+    def categories(self, dimension):
+        """Codici di categoria della dimensione, nell'ordine dei codici interi"""
+        return self._categories[dimension]
+
+    def labels(self, lang, dimension):
+        """Tabella delle etichette tradotte, indicizzata per codice intero"""
+        return self._label_tables(lang)[dimension]
+
+    def position(self, index_key):
+        """Riga dell'indice nelle matrici di composizione"""
+        return self._positions[index_key]
+
+    def entries(self, index_key, dimension):
+        """Restituisce (codici, pesi) dell'indice come viste senza copia"""
+        pos = self._positions[index_key]
+        offsets = self._offsets[dimension]
+        window = slice(offsets[pos], offsets[pos + 1])
+        return self._codes[dimension][window], self._weights[dimension][window]
+
+    def breakdown(self, index_key, dimension, lang):
+        """Restituisce (etichette, pesi) dell'indice nella lingua richiesta"""
+        codes, weights = self.entries(index_key, dimension)
+        return self._label_tables(lang)[dimension][codes], weights
+
+    def matrix(self, dimension):
+        """Matrice densa dei pesi (indici x categorie), in sola lettura"""
+        return self._matrices[dimension]
+
+
+COMPOSITION_STORE = CompositionStore(COMPOSITIONS)
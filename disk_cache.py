@@ -0,0 +1,291 @@
+"""
+AssetExpl - Disk cache
+Content-addressed cache on the local disk, shared by every Streamlit process
+of a host. Each entry is a file named after the hash of its key, of the
+fingerprints of the source data it was computed from and of the application
+code, so a change to prices, holdings, texts or code never serves a stale
+entry. Files are written atomically (temporary file + rename) and the least
+recently used ones are evicted when the directory exceeds its size limit.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import time
+from functools import lru_cache
+
+import numpy as np
+
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+_DEFAULT_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "assetexpl"
+)
+
+# ASSETEXPL_DISK_CACHE indica la cartella della cache; "0" la disattiva
+CACHE_DIR = os.environ.get("ASSETEXPL_DISK_CACHE", _DEFAULT_DIR)
+DEFAULT_MAX_BYTES = 512 * 2**20
+# Dopo l'eviction la cartella scende a questa frazione del limite
+EVICT_TARGET = 0.8
+# File temporanei più vecchi di così sono scritture interrotte
+STALE_TMP_SECONDS = 3600
+_TMP_PREFIX = ".tmp-"
+
+
+# ============================================================================
+# IMPRONTE
+# ============================================================================
+
+_digests = {}
+_digests_lock = threading.Lock()
+
+
+def file_signature(path):
+    """(inode, data di modifica, dimensione) di un file, None se non esiste:
+    cambia a ogni riscrittura, anche con un rename atomico"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def file_digest(path):
+    """SHA-256 del contenuto di un file ("" se non esiste), ricalcolato solo
+    quando il file viene riscritto"""
+    signature = file_signature(path)
+    if signature is None:
+        return ""
+    with _digests_lock:
+        cached = _digests.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(2**20), b""):
+            digest.update(chunk)
+    digest = digest.hexdigest()
+    with _digests_lock:
+        _digests[path] = (signature, digest)
+    return digest
+
+
+def directory_digest(directory):
+    """Impronta di tutti i file di una cartella ("" se non esiste)"""
+    if not os.path.isdir(directory):
+        return ""
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        if os.path.isfile(path):
+            digest.update(f"{name}:{file_digest(path)}\n".encode())
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def code_fingerprint():
+    """Impronta del codice dell'app (moduli e bundle di lingua) e delle
+    versioni di Python e numpy: un deploy invalida tutte le voci"""
+    digest = hashlib.sha256(f"{sys.version_info[:2]} {np.__version__}".encode())
+    for directory in (SOURCE_DIR, os.path.join(SOURCE_DIR, "locales")):
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".py"):
+                digest.update(f"{name}:{file_digest(os.path.join(directory, name))}\n".encode())
+    return digest.hexdigest()
+
+
+# ============================================================================
+# FORMATI
+# ============================================================================
+
+class PickleCodec:
+    """Risultati numerici (dict, tuple, array numpy)"""
+    suffix = ".pkl"
+
+    @staticmethod
+    def dumps(value):
+        return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def loads(data):
+        return pickle.loads(data)
+
+
+class FigureCodec:
+    """Figure Plotly come JSON. La figura salvata era già validata, quindi
+    viene ricostruita senza rivalidarla: costa meno che crearla da zero"""
+    suffix = ".json"
+
+    @staticmethod
+    def dumps(fig):
+        return fig.to_json(validate=False).encode("utf-8")
+
+    @staticmethod
+    def loads(data):
+        from figure_cache import graph_objects
+        return graph_objects().Figure(json.loads(data), _validate=False)
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+class DiskCache:
+    """Cache su disco condivisa dai processi dell'host, con scritture atomiche.
+
+    La chiave deve avere una `repr` stabile tra processi (tuple di stringhe e
+    numeri); `sources` sono le impronte dei dati di origine. La cartella va
+    riservata all'app: le voci pickle vengono caricate senza altre verifiche.
+    Gli errori di I/O non vengono propagati: la cache è solo un acceleratore.
+    """
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = None if directory in ("", "0") else directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Il primo salvataggio del processo avvia subito un'eviction
+        self._written = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+
+    @property
+    def enabled(self):
+        return self.directory is not None
+
+    def path(self, key, sources=(), codec=PickleCodec):
+        """File della voce: hash di codice, chiave e impronte dei dati"""
+        digest = hashlib.sha256(
+            repr((code_fingerprint(), key, tuple(sources))).encode("utf-8")
+        ).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest + codec.suffix)
+
+    def get(self, key, sources=(), codec=PickleCodec):
+        """Valore salvato, o None se manca (o non è leggibile)"""
+        if not self.enabled:
+            return None
+        path = self.path(key, sources, codec)
+        try:
+            with open(path, "rb") as f:
+                value = codec.loads(f.read())
+            # La data di modifica fa da ultimo accesso per l'eviction LRU
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        except Exception:  # noqa: BLE001 - voce troncata o illeggibile
+            with self._lock:
+                self.misses += 1
+                self.errors += 1
+            self._remove(path)
+            return None
+        with self._lock:
+            self.hits += 1
+        return value
+
+    def put(self, key, sources, value, codec=PickleCodec):
+        """Salva il valore con scrittura atomica (temporaneo + rename)"""
+        if not self.enabled:
+            return
+        path = self.path(key, sources, codec)
+        try:
+            data = codec.dumps(value)
+            directory = os.path.dirname(path)
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=_TMP_PREFIX, dir=directory)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                self._remove(tmp_path)
+                raise
+        except OSError:
+            with self._lock:
+                self.errors += 1
+            return
+        with self._lock:
+            self.writes += 1
+            self._written += len(data)
+            evict = self._written >= self.max_bytes * (1 - EVICT_TARGET) / 2
+            if evict:
+                self._written = 0
+        if evict:
+            self.evict()
+
+    def get_or_compute(self, key, sources, compute, codec=PickleCodec):
+        """Valore dalla cache, oppure calcolato con `compute()` e salvato"""
+        value = self.get(key, sources, codec)
+        if value is None:
+            value = compute()
+            self.put(key, sources, value, codec)
+        return value
+
+    def entries(self):
+        """(ultimo accesso, byte, percorso) di ogni voce"""
+        entries = []
+        if not self.enabled or not os.path.isdir(self.directory):
+            return entries
+        now = time.time()
+        for shard in os.scandir(self.directory):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                if entry.name.startswith(_TMP_PREFIX):
+                    if now - stat.st_mtime > STALE_TMP_SECONDS:
+                        self._remove(entry.path)
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def evict(self):
+        """Elimina le voci usate meno di recente finché la cartella supera il limite"""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return 0
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes * EVICT_TARGET:
+                break
+            if self._remove(path):
+                total -= size
+                removed += 1
+        return removed
+
+    def stats(self):
+        """Hit, miss, scritture ed errori del processo"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "errors": self.errors,
+            }
+
+    def clear(self):
+        """Elimina tutte le voci"""
+        for _, _, path in self.entries():
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
+
+
+# Istanza unica per processo; la cartella è condivisa dai processi dell'host
+DISK_CACHE = DiskCache()
@@ -0,0 +1,253 @@
+"""
+AssetExpl - Figure cache
+Process-wide LRU cache for Plotly figures, shared by every Streamlit session.
+Cached figures are frozen: every session references the same read-only object.
+"""
+
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from disk_cache import DISK_CACHE, FigureCodec
+
+# Numero massimo di figure in cache: il warm-up ne prepara 2 lingue x 8 indici
+# x 5 (composizioni, storico, PAC, proiezione) più le heatmap del confronto;
+# il resto è per i parametri scelti dagli utenti
+DEFAULT_MAXSIZE = 256
+
+# Grafici storici: ogni utente sceglie il proprio intervallo, quindi hanno una
+# cache a parte, per non far uscire dalla cache condivisa le altre figure; il
+# warm-up ne prepara 2 lingue x 8 indici sull'intervallo completo
+HISTORY_MAXSIZE = 64
+
+
+_plotly_lock = threading.Lock()
+_graph_objects = None
+
+
+def graph_objects():
+    """plotly.graph_objects, importato una sola volta per processo sotto lock.
+
+    Durante la validazione Plotly cerca pandas in sys.modules senza importarlo:
+    se un'altra sessione lo sta ancora importando trova un modulo inizializzato
+    a metà e fallisce. Il primo grafico del processo importa quindi Plotly e
+    pandas per intero, e le sessioni concorrenti aspettano sul lock.
+    """
+    global _graph_objects
+    if _graph_objects is None:
+        with _plotly_lock:
+            if _graph_objects is None:
+                import plotly.graph_objects as go
+                try:
+                    import pandas  # noqa: F401 - solo per completarne l'import
+                except ImportError:
+                    pass
+                _graph_objects = go
+    return _graph_objects
+
+
+class FrozenFigureError(TypeError):
+    """Tentativo di modificare una figura condivisa"""
+
+
+def _refuse(self, *args, **kwargs):
+    raise FrozenFigureError(
+        "Figura condivisa in sola lettura: modificare una copia (go.Figure(fig))"
+    )
+
+
+@lru_cache(maxsize=None)
+def _frozen_class():
+    """Sottoclasse di go.Figure che rifiuta ogni modifica (creata al primo uso
+    per non importare Plotly all'avvio)"""
+    go = graph_objects()
+
+    # Metodi della figura che modificano dati o layout; update, update_layout
+    # e update_traces passano da batch_update
+    namespace = {
+        name: _refuse for name in (
+            "_restyle_child", "_relayout_child", "add_traces", "plotly_update",
+            "plotly_restyle", "plotly_relayout", "__setitem__", "batch_update",
+            "batch_animate",
+        )
+    }
+    for name in ("data", "layout", "frames"):
+        namespace[name] = property(getattr(go.Figure, name).fget, _refuse)
+    return type("FrozenFigure", (go.Figure,), namespace)
+
+
+@lru_cache(maxsize=None)
+def _frozen_object_class(cls):
+    """Sottoclasse di una traccia o di un oggetto del layout che rifiuta ogni
+    modifica prima di toccare i dati.
+
+    Le proprietà, `update` e `pop` passano tutte da __setitem__; Plotly
+    scrive invece nei dati condivisi prima di notificare la figura, quindi il
+    rifiuto deve arrivare qui e non solo a livello di figura.
+    """
+    def __getitem__(self, prop):
+        # I figli non ancora usati (ad esempio layout.title) vengono creati
+        # da Plotly al primo accesso: si congelano anche quelli
+        value = cls.__getitem__(self, prop)
+        if isinstance(value, tuple):
+            for child in value:
+                _freeze_object(child)
+        else:
+            _freeze_object(value)
+        return value
+
+    return type(f"Frozen{cls.__name__}", (cls,), {
+        "__setitem__": _refuse, "__getitem__": __getitem__,
+    })
+
+
+def _freeze_object(obj):
+    """Congela un oggetto Plotly e tutti i figli già creati"""
+    from plotly.basedatatypes import BasePlotlyType
+
+    pending = [obj]
+    while pending:
+        current = pending.pop()
+        if not isinstance(current, BasePlotlyType) or type(current).__name__.startswith("Frozen"):
+            continue
+        current.__class__ = _frozen_object_class(type(current))
+        pending.extend(current._compound_props.values())
+        for children in current._compound_array_props.values():
+            pending.extend(children)
+
+
+def freeze(fig):
+    """Rende la figura di sola lettura senza copiarla (cambia solo le classi
+    della figura, delle tracce e degli oggetti del layout)"""
+    for obj in (*fig._data_objs, fig._layout_obj, *fig._frame_objs):
+        _freeze_object(obj)
+    fig.__class__ = _frozen_class()
+    return fig
+
+
+class FigureCache:
+    """Cache LRU thread-safe delle figure Plotly, condivisa tra tutte le sessioni.
+
+    Le figure in cache sono condivise e congelate con `freeze`: ogni tentativo
+    di modificarle solleva FrozenFigureError.
+    Si memorizza la figura già costruita e non il JSON, perché ricostruire una
+    figura dal JSON costa più che crearla da zero (la validazione Plotly viene
+    rieseguita), mentre `st.plotly_chart` serializza un `go.Figure` senza
+    rivalidarlo.
+
+    Con `sources` (impronte dei dati di origine) la figura passa anche per la
+    cache su disco, condivisa con gli altri processi dell'host: da lì viene
+    ricaricata senza validazione, già verificata da chi l'ha salvata.
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, disk=DISK_CACHE):
+        if maxsize < 1:
+            raise ValueError("maxsize deve essere almeno 1")
+        self.maxsize = maxsize
+        self.disk = disk
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key, builder, sources=None):
+        """Restituisce la figura per `key`, costruendola con `builder()` se assente"""
+        disk_key, key = key, self._memory_key(key, sources)
+        with self._lock:
+            fig = self._entries.get(key)
+            if fig is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return fig
+            self.misses += 1
+
+        # Costruzione fuori dal lock: due sessioni concorrenti possono al più
+        # costruire la stessa figura due volte, senza bloccarsi a vicenda
+        fig = self._load(disk_key, sources)
+        if fig is None:
+            fig = builder()
+            self._store(disk_key, sources, fig)
+        fig = freeze(fig)
+
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None:
+                self._entries.move_to_end(key)
+                return existing
+            self._entries[key] = fig
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return fig
+
+    def get(self, key, sources=None):
+        """Restituisce la figura per `key`, o None se non è in cache"""
+        disk_key, key = key, self._memory_key(key, sources)
+        with self._lock:
+            fig = self._entries.get(key)
+            if fig is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return fig
+            self.misses += 1
+        fig = self._load(disk_key, sources)
+        if fig is not None:
+            self._insert(key, freeze(fig))
+        return fig
+
+    def put(self, key, fig, sources=None):
+        """Inserisce una figura costruita altrove (ad esempio a batch progressivi)"""
+        self._store(key, sources, fig)
+        self._insert(self._memory_key(key, sources), freeze(fig))
+
+    @staticmethod
+    def _memory_key(key, sources):
+        # Anche in memoria le impronte fanno parte della chiave: se i dati
+        # cambiano, la figura precedente non viene più restituita
+        return key if sources is None else (key, tuple(sources))
+
+    def _load(self, key, sources):
+        """Figura dalla cache su disco (solo per le chiavi con impronte dei dati)"""
+        if self.disk is None or sources is None:
+            return None
+        return self.disk.get(("figure", key), sources, FigureCodec)
+
+    def _store(self, key, sources, fig):
+        if self.disk is not None and sources is not None:
+            self.disk.put(("figure", key), sources, fig, FigureCodec)
+
+    def _insert(self, key, fig):
+        with self._lock:
+            self._entries[key] = fig
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def figures(self):
+        """Figure attualmente in cache (per il conteggio della memoria condivisa)"""
+        with self._lock:
+            return list(self._entries.values())
+
+    def stats(self):
+        """Restituisce hit, miss, percentuale di hit e occupazione della cache"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self):
+        """Svuota la cache e azzera i contatori"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Istanza unica per processo: questo modulo resta in sys.modules tra i rerun
+# di Streamlit, a differenza delle variabili globali di app.py
+FIGURE_CACHE = FigureCache()
+HISTORY_CACHE = FigureCache(maxsize=HISTORY_MAXSIZE)
@@ -0,0 +1,263 @@
+"""
+AssetExpl - Holdings engine
+Ingests constituent files (CSV or Parquet) into memory-mapped columnar arrays
+and computes country and sector breakdowns by grouped aggregation over
+integer category codes.
+
+Usage:
+    python holdings.py <index_id> <constituents.csv|.parquet>
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+
+import numpy as np
+
+from composition_store import COMPOSITION_STORE, DIMENSIONS
+from disk_cache import directory_digest, file_signature
+
+HOLDINGS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "holdings")
+
+# Colonne attese nei file dei costituenti, per dimensione
+SOURCE_COLUMNS = {"geographic": "country", "sectors": "sector"}
+CATEGORIES_FILE = "categories.json"
+# Nome della versione corrente dei costituenti, sostituito atomicamente a ogni import
+CURRENT_FILE = "current"
+# Una versione letta dal puntatore sparisce solo se nel frattempo arrivano
+# altri import: qualche nuovo tentativo basta a trovarne una completa
+OPEN_ATTEMPTS = 3
+
+# Nomi frequenti nei file dei provider (paesi, settori GICS) che differiscono
+# dai codici di categoria dello store
+CATEGORY_ALIASES = {
+    "united_states": "usa",
+    "us": "usa",
+    "uk": "united_kingdom",
+    "korea": "south_korea",
+    "information_technology": "technology",
+    "financials": "finance",
+    "health_care": "healthcare",
+    "consumer_discretionary": "consumer_cyclical",
+}
+
+
+def category_id(value):
+    """Normalizza un paese o settore nel codice usato dallo store ("United Kingdom" -> "united_kingdom")"""
+    code = re.sub(r"[^a-z0-9]+", "_", str(value).strip().lower()).strip("_")
+    return CATEGORY_ALIASES.get(code, code)
+
+
+def _read_csv(path):
+    """Legge le colonne dei costituenti da un CSV"""
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    return {
+        "ticker": [row["ticker"] for row in rows],
+        "weight": [float(row["weight"]) for row in rows],
+        "country": [row["country"] for row in rows],
+        "sector": [row["sector"] for row in rows],
+    }
+
+
+def _read_parquet(path):
+    """Legge le colonne dei costituenti da un file Parquet (richiede pyarrow)"""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("La lettura dei file Parquet richiede pyarrow: pip install pyarrow") from e
+    table = pq.read_table(path, columns=["ticker", "weight", "country", "sector"])
+    return table.to_pydict()
+
+
+def _current(directory):
+    """(cartella della versione corrente, firma del file che la indica).
+
+    La firma è quella del puntatore `current` oppure, per i costituenti
+    importati senza versioni, della tabella delle categorie (scritta per ultima).
+    """
+    pointer = os.path.join(directory, CURRENT_FILE)
+    signature = file_signature(pointer)
+    if signature is None:
+        return directory, file_signature(os.path.join(directory, CATEGORIES_FILE))
+    with open(pointer, encoding="utf-8") as f:
+        return os.path.join(directory, f.read().strip()), signature
+
+
+def _remove_old_versions(directory, oldest):
+    """Elimina le versioni precedenti a `oldest` e i file del formato senza
+    versioni (array e categorie direttamente nella cartella dell'indice)"""
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        if name.startswith("v") and name < oldest and os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+        elif name == CATEGORIES_FILE or name.endswith(".npy"):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+
+def ingest(index_key, source_path, holdings_dir=HOLDINGS_DIR):
+    """Converte un file di costituenti in array colonnari .npy pronti per il memory-mapping.
+
+    Gli array sono salvati in una nuova cartella `v<ns>`, resa corrente
+    sostituendo il file `current` con un solo rename: un lettore vede sempre
+    tutti gli array dello stesso import.
+    """
+    if source_path.endswith(".parquet"):
+        columns = _read_parquet(source_path)
+    else:
+        columns = _read_csv(source_path)
+
+    directory = os.path.join(holdings_dir, index_key)
+    version = f"v{time.time_ns()}"
+    version_dir = os.path.join(directory, version)
+    os.makedirs(version_dir)
+
+    categories = {}
+    for dim, column in SOURCE_COLUMNS.items():
+        ids = {}
+        codes = np.fromiter(
+            (ids.setdefault(category_id(value), len(ids)) for value in columns[column]),
+            dtype=np.int32,
+            count=len(columns[column])
+        )
+        categories[dim] = list(ids)
+        np.save(os.path.join(version_dir, f"{dim}.npy"), codes)
+
+    np.save(os.path.join(version_dir, "weight.npy"), np.asarray(columns["weight"], dtype=np.float64))
+    np.save(os.path.join(version_dir, "ticker.npy"), np.asarray(columns["ticker"], dtype=np.str_))
+    with open(os.path.join(version_dir, CATEGORIES_FILE), "w", encoding="utf-8") as f:
+        json.dump(categories, f)
+
+    previous = _current(directory)[0]
+    tmp_path = os.path.join(directory, f".{CURRENT_FILE}.{version}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(version)
+    os.replace(tmp_path, os.path.join(directory, CURRENT_FILE))
+    # La versione precedente resta a chi ha appena letto il vecchio puntatore
+    oldest = version if previous == directory else min(version, os.path.basename(previous))
+    _remove_old_versions(directory, oldest)
+    return len(columns["weight"])
+
+
+class Holdings:
+    """Costituenti di un indice come array in memory-mapping (sola lettura)"""
+
+    def __init__(self, directory):
+        with open(os.path.join(directory, CATEGORIES_FILE), encoding="utf-8") as f:
+            self.categories = {dim: tuple(ids) for dim, ids in json.load(f).items()}
+        self.weight = np.load(os.path.join(directory, "weight.npy"), mmap_mode="r")
+        self.ticker = np.load(os.path.join(directory, "ticker.npy"), mmap_mode="r")
+        self.codes = {
+            dim: np.load(os.path.join(directory, f"{dim}.npy"), mmap_mode="r")
+            for dim in DIMENSIONS
+        }
+
+    def __len__(self):
+        return len(self.weight)
+
+    def breakdown(self, dimension):
+        """Peso percentuale per categoria, aggregato per codice con np.bincount"""
+        totals = np.bincount(
+            self.codes[dimension],
+            weights=self.weight,
+            minlength=len(self.categories[dimension])
+        )
+        return self.categories[dimension], totals * (100.0 / self.weight.sum())
+
+
+class HoldingsStore:
+    """Apre i costituenti di ogni indice una sola volta per versione.
+
+    Le pagine dei file sono condivise dal sistema operativo tra sessioni e
+    processi: nessuna sessione copia i dati in memoria.
+    """
+
+    def __init__(self, holdings_dir=HOLDINGS_DIR):
+        self.holdings_dir = holdings_dir
+        self._open = {}
+        self._lock = threading.Lock()
+
+    def available(self):
+        """Indici per cui sono stati importati i costituenti"""
+        if not os.path.isdir(self.holdings_dir):
+            return []
+        return sorted(
+            name for name in os.listdir(self.holdings_dir)
+            if os.path.exists(os.path.join(self.holdings_dir, name, CURRENT_FILE))
+            or os.path.exists(os.path.join(self.holdings_dir, name, CATEGORIES_FILE))
+        )
+
+    def get(self, index_key):
+        """Restituisce i costituenti dell'indice, aprendoli al primo accesso.
+
+        Un nuovo import, anche da un altro processo, sostituisce il puntatore
+        alla versione corrente: quando la sua firma cambia gli array vengono
+        riaperti, così i dati seguono sempre `fingerprint`.
+        """
+        with self._lock:
+            for attempt in range(OPEN_ATTEMPTS):
+                directory, signature = _current(os.path.join(self.holdings_dir, index_key))
+                cached = self._open.get(index_key)
+                if cached is not None and cached[0] == signature:
+                    return cached[1]
+                try:
+                    holdings = Holdings(directory)
+                except FileNotFoundError:
+                    # Versione rimossa da import successivi alla lettura del
+                    # puntatore: si rilegge quello nuovo
+                    if attempt == OPEN_ATTEMPTS - 1:
+                        raise
+                    continue
+                self._open[index_key] = (signature, holdings)
+                return holdings
+
+    def invalidate(self, index_key):
+        """Dimentica i costituenti aperti, ad esempio dopo un nuovo import"""
+        with self._lock:
+            self._open.pop(index_key, None)
+
+    def fingerprint(self, index_key):
+        """Impronta dei file della versione corrente dei costituenti ("" se non ce ne sono)"""
+        return directory_digest(_current(os.path.join(self.holdings_dir, index_key))[0])
+
+    def breakdown(self, index_key, dimension, lang=None):
+        """Restituisce (categorie, pesi) dai costituenti, con etichette tradotte se richiesto"""
+        categories, weights = self.get(index_key).breakdown(dimension)
+        order = np.argsort(weights, kind="stable")[::-1]
+        order = order[weights[order] > 0]
+        categories = [categories[code] for code in order]
+        if lang is not None:
+            known = dict(zip(
+                COMPOSITION_STORE.categories(dimension),
+                COMPOSITION_STORE.labels(lang, dimension)
+            ))
+            categories = [known.get(category, category) for category in categories]
+        return np.array(categories, dtype=object), weights[order]
+
+
+HOLDINGS_STORE = HoldingsStore()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("index_id")
+    parser.add_argument("source", help="file CSV o Parquet con colonne ticker, weight, country, sector")
+    parser.add_argument("--holdings-dir", default=HOLDINGS_DIR)
+    args = parser.parse_args()
+
+    count = ingest(args.index_id, args.source, args.holdings_dir)
+    print(f"{args.index_id}: {count} costituenti importati in {args.holdings_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
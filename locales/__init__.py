@@ -0,0 +1,52 @@
+"""
+AssetExpl - Locale bundles
+Every module in this package holds the translatable text of one language
+(`CONTENT` dict) and is imported only the first time that language is used
+"""
+
+import importlib
+import pkgutil
+import sys
+
+DEFAULT_LANGUAGE = "it"
+
+# Nomi visualizzati nel selettore lingua, senza dover caricare i bundle
+LANGUAGE_NAMES = {
+    "it": "🇮🇹 Italiano",
+    "en": "🇬🇧 English",
+}
+
+
+def available_languages():
+    """Elenca i bundle presenti su disco senza importarli (lingua predefinita per prima)"""
+    languages = sorted(
+        module.name for module in pkgutil.iter_modules(__path__)
+        if not module.name.startswith("_")
+    )
+    if DEFAULT_LANGUAGE in languages:
+        languages.remove(DEFAULT_LANGUAGE)
+        languages.insert(0, DEFAULT_LANGUAGE)
+    return languages
+
+
+def language_name(lang):
+    """Nome visualizzato della lingua, con il codice come ripiego"""
+    return LANGUAGE_NAMES.get(lang, lang.upper())
+
+
+def load_locale(lang):
+    """Restituisce i testi della lingua, importando il bundle al primo utilizzo.
+
+    La cache è sys.modules: il bundle viene letto una sola volta per processo
+    ed è condiviso da tutte le sessioni; l'import lock di Python garantisce
+    che sessioni concorrenti non lo carichino due volte.
+    """
+    # Un bundle già importato è già stato validato: niente lettura della
+    # cartella. Un modulo senza CONTENT è un import ancora in corso in un altro
+    # thread, e import_module ne attende la fine
+    content = getattr(sys.modules.get(f"{__name__}.{lang}"), "CONTENT", None)
+    if content is not None:
+        return content
+    if lang not in available_languages():
+        raise KeyError(f"Lingua non disponibile: {lang!r}")
+    return importlib.import_module(f"{__name__}.{lang}").CONTENT
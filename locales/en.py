@@ -0,0 +1,658 @@
+"""
+AssetExpl - English locale bundle
+"""
+
+CONTENT = {
+    "app_title": "📊 AssetExpl - ETF Explorer",
+    "app_subtitle": "Explore major global ETF indices with interactive data",
+    "sidebar_title": "⚙️ Settings",
+    "language_label": "Language",
+    "select_index": "Select Index",
+    "tabs": {
+        "description": "📄 Description",
+        "statistics": "📈 Statistics",
+        "strategy": "🎯 Usage Strategy",
+        "history": "📉 History",
+        "comparison": "⚖️ Comparison",
+        "portfolio": "🧮 Portfolio",
+        "projection": "🔮 Projections"
+    },
+    "indices": {
+        "msci_world": {
+            "name": "MSCI World",
+            "description": """
+            ### MSCI World Index
+            
+            The **MSCI World Index** is a global equity index representing large and mid-cap 
+            stocks from 23 developed countries. It covers approximately 85% of the free 
+            float-adjusted market capitalization in each country.
+            
+            #### Key Features:
+            - **Coverage**: 23 developed markets
+            - **Number of stocks**: ~1,500 companies
+            - **Capitalization**: Large and Mid-cap
+            - **Benchmark**: Standard for global diversified portfolios
+            
+            #### Why choose it:
+            MSCI World is ideal for investors seeking diversified exposure to global developed 
+            markets, with strong US market presence (~70%) but also significant exposure to 
+            Europe and Asia-Pacific.
+            """,
+            "risk_profile": {
+                "risk_level": "Medium-High",
+                "volatility": "15-20% annual",
+                "time_horizon": "7-10+ years",
+                "return_potential": "7-9% historical annual"
+            },
+            "strategy": """
+            ### How to Use MSCI World in Your Portfolio
+            
+            #### 🎯 Core Strategy
+            - **Base Portfolio**: Use MSCI World as main asset (50-70% of portfolio)
+            - **Rebalancing**: Annual or semi-annual
+            - **Accumulation**: Monthly investment plan (DCA) to reduce timing risk
+            
+            #### ⚖️ Effective Combinations
+            - **MSCI World (70%) + Bonds (30%)**: Moderate balanced portfolio
+            - **MSCI World (60%) + Emerging Markets (20%) + Bonds (20%)**: Growth with diversification
+            - **MSCI World (80%) + Small Cap (20%)**: Aggressive equity-oriented
+            
+            #### ⚠️ Considerations
+            - High US exposure (~70%) - consider additional geographic diversification
+            - Excludes emerging markets - evaluate integration with MSCI EM
+            - Excludes small-cap - superior return opportunities excluded
+            """
+        },
+        "sp500": {
+            "name": "S&P 500",
+            "description": """
+            ### S&P 500 Index
+            
+            The **S&P 500** is the world's most followed index, representing the 500 largest 
+            publicly traded companies in the United States. It's considered the best indicator 
+            of US stock market performance.
+            
+            #### Key Features:
+            - **Coverage**: US Market
+            - **Number of stocks**: 500 companies
+            - **Capitalization**: Large-cap
+            - **Benchmark**: Standard for US equity market
+            
+            #### Why choose it:
+            The S&P 500 offers exposure to the largest and most established American companies, 
+            including tech giants like Apple, Microsoft, Amazon. Historically has provided 
+            average returns of 10% annually over the long term.
+            """,
+            "risk_profile": {
+                "risk_level": "Medium-High",
+                "volatility": "15-18% annual",
+                "time_horizon": "5-10+ years",
+                "return_potential": "9-11% historical annual"
+            },
+            "strategy": """
+            ### How to Use S&P 500 in Your Portfolio
+            
+            #### 🎯 Core USA Strategy
+            - **US Exposure**: Ideal for those bullish on American market
+            - **Long-Term Investment**: Buy and hold for 10+ years
+            - **Dollar Cost Averaging**: Monthly investments to average prices
+            
+            #### ⚖️ Effective Combinations
+            - **S&P 500 (60%) + International (30%) + Bonds (10%)**: Global with US focus
+            - **S&P 500 (50%) + Nasdaq 100 (20%) + Bonds (30%)**: Moderate tech-heavy
+            - **S&P 500 (70%) + REIT (15%) + Gold (15%)**: Asset class diversification
+            
+            #### ⚠️ Considerations
+            - 100% US geographic concentration - country risk
+            - High tech exposure (~30%) - volatile but high potential
+            - Mega-cap dominance - few small/mid cap opportunities
+            - Sensitive to Fed rates and US policies
+            """
+        },
+        "msci_em": {
+            "name": "MSCI Emerging Markets",
+            "description": """
+            ### MSCI Emerging Markets Index
+            
+            The **MSCI Emerging Markets Index** captures large and mid-cap representation 
+            across 24 emerging market countries, representing approximately 85% of the 
+            free float-adjusted market capitalization in each country.
+            
+            #### Key Features:
+            - **Coverage**: 24 emerging markets
+            - **Number of stocks**: ~1,400 companies
+            - **Capitalization**: Large and Mid-cap
+            - **Benchmark**: Standard for emerging markets
+            
+            #### Why choose it:
+            Offers exposure to rapidly growing economies like China, India, Taiwan, Brazil. 
+            Higher growth potential than developed markets but with higher volatility. 
+            Essential for geographic diversification.
+            """,
+            "risk_profile": {
+                "risk_level": "High",
+                "volatility": "20-25% annual",
+                "time_horizon": "10+ years",
+                "return_potential": "8-12% historical annual (high variability)"
+            },
+            "strategy": """
+            ### How to Use MSCI EM in Your Portfolio
+            
+            #### 🎯 Satellite Strategy
+            - **Allocation**: 10-30% of equity portfolio
+            - **Complement**: Pair with MSCI World or S&P 500
+            - **Patience**: Requires long time horizon (10+ years)
+            
+            #### ⚖️ Effective Combinations
+            - **MSCI World (70%) + MSCI EM (20%) + Bonds (10%)**: Complete global
+            - **S&P 500 (60%) + MSCI EM (30%) + REIT (10%)**: Aggressive growth
+            - **MSCI World (50%) + MSCI EM (25%) + Bonds (25%)**: Balanced global
+            
+            #### ⚠️ Considerations
+            - **High volatility**: Swings can exceed 30% annually
+            - **Political risk**: Instability in some emerging countries
+            - **Currency risk**: Exposure to volatile currencies
+            - **Asia concentration**: ~75% in Asian markets
+            - **Opportunities**: Demographic growth and middle class expansion
+            """
+        },
+        "msci_acwi": {
+            "name": "MSCI ACWI",
+            "description": """
+            ### MSCI All Country World Index (ACWI)
+            
+            The **MSCI ACWI** is the most comprehensive global equity index, combining developed 
+            and emerging markets. It represents 99% of the global investable equity opportunity.
+            
+            #### Key Features:
+            - **Coverage**: 23 developed + 24 emerging markets
+            - **Number of stocks**: ~3,000 companies
+            - **Capitalization**: Large and Mid-cap
+            - **Benchmark**: Most complete global equity index
+            
+            #### Why choose it:
+            MSCI ACWI is the "one-stop-shop" solution for global equity. With a single position 
+            you get balanced exposure to developed (~85%) and emerging (~15%) markets, 
+            eliminating the need to combine multiple indices.
+            """,
+            "risk_profile": {
+                "risk_level": "Medium-High",
+                "volatility": "16-21% annual",
+                "time_horizon": "7-10+ years",
+                "return_potential": "7-10% historical annual"
+            },
+            "strategy": """
+            ### How to Use MSCI ACWI in Your Portfolio
+            
+            #### 🎯 "All-in-One" Strategy
+            - **Simplified Portfolio**: MSCI ACWI as single equity ETF (60-100%)
+            - **Passive Management**: Perfect for "set and forget" approach
+            - **Automatic Rebalancing**: Index auto-adjusts between DM and EM
+            
+            #### ⚖️ Effective Combinations
+            - **MSCI ACWI (80%) + Bonds (20%)**: Simple global portfolio
+            - **MSCI ACWI (70%) + Bonds (25%) + Gold (5%)**: Inflation protection
+            - **MSCI ACWI (90%) + Small Cap (10%)**: Maximum equity exposure
+            
+            #### ⚠️ Considerations
+            - **Main advantage**: Maximum diversification in one ETF
+            - **US exposure**: Still dominant (~62%)
+            - **EM included**: No need to combine with MSCI EM
+            - **Slightly higher TER**: Compared to MSCI World due to EM inclusion
+            - **Ideal for beginners**: Maximum management simplicity
+            """
+        },
+        "ftse_all_world": {
+            "name": "FTSE All-World",
+            "description": """
+            ### FTSE All-World Index
+            
+            The **FTSE All-World Index** is FTSE's alternative to MSCI ACWI, offering 
+            comprehensive exposure to developed and emerging markets with even broader coverage.
+            
+            #### Key Features:
+            - **Coverage**: 49 countries (25 developed + 24 emerging)
+            - **Number of stocks**: ~4,000 companies
+            - **Capitalization**: Large, Mid and Small-cap
+            - **Benchmark**: Comprehensive alternative to MSCI ACWI
+            
+            #### Why choose it:
+            FTSE All-World also includes small-caps, providing coverage of 98% of the global 
+            investable equity market. The preferred choice for those seeking maximum 
+            diversification in a single instrument.
+            """,
+            "risk_profile": {
+                "risk_level": "Medium-High",
+                "volatility": "16-22% annual",
+                "time_horizon": "7-10+ years",
+                "return_potential": "7-10% historical annual"
+            },
+            "strategy": """
+            ### How to Use FTSE All-World in Your Portfolio
+            
+            #### 🎯 Maximum Diversification Strategy
+            - **Complete Portfolio**: FTSE All-World as only equity ETF needed
+            - **Small-Cap Inclusion**: Captures opportunities in smaller companies too
+            - **Buy & Hold**: Ideal for long-term passive investors
+            
+            #### ⚖️ Effective Combinations
+            - **FTSE All-World (80%) + Global Bonds (20%)**: Maximum simplicity
+            - **FTSE All-World (70%) + Bonds (20%) + Gold (10%)**: Resilient portfolio
+            - **FTSE All-World (100%)**: 100% equity option for aggressive profiles
+            
+            #### ⚠️ Considerations
+            - **Superior coverage**: Includes small-cap (vs MSCI ACWI)
+            - **4,000+ holdings**: Maximum available diversification
+            - **MSCI alternative**: Slightly different methodology but similar results
+            - **ETF liquidity**: Check bid-ask spreads
+            - **Perfect for "Lazy Portfolio"**: Complete solution in one ETF
+            """
+        },
+        "solactive_str": {
+            "name": "Solactive €STR +8.5bp Daily",
+            "description": """
+            ### Solactive €STR +8.5 basis points Daily Index
+            
+            The **Solactive €STR +8.5bp Daily** is a benchmark index for money market ETFs 
+            that replicate the Eurozone overnight rate (€STR) with a small positive spread. 
+            Used in ETFs like **Xtrackers EUR Overnight Rate Swap (XEON)**.
+            
+            #### Key Features:
+            - **Benchmark**: €STR + 8.5 basis points (0.085%)
+            - **Type**: Overnight money market index
+            - **Use**: Money market ETFs for cash management
+            - **Liquidity**: Daily (T+2)
+            
+            #### Why choose it:
+            Ideal for parking short-term liquidity with returns higher than traditional 
+            current accounts. ETFs tracking this index (like XEON) offer an efficient 
+            alternative to deposit accounts with greater flexibility and low costs 
+            (typical TER: 0.10-0.15%).
+            
+            #### Popular ETFs:
+            - **XEON** - Xtrackers EUR Overnight Rate Swap UCITS ETF
+            - Ideal for corporate treasury and personal cash management
+            """,
+            "risk_profile": {
+                "risk_level": "Very Low",
+                "volatility": "Almost none (<0.5% annual)",
+                "time_horizon": "Short term (days/months)",
+                "return_potential": "€STR + 0.085% (≈3.2-3.3% with €STR ≈3.15%)"
+            },
+            "strategy": """
+            ### How to Use €STR ETFs in Your Portfolio
+            
+            #### 🎯 Efficient Cash Management
+            - **Parking liquidity**: Alternative to current/deposit accounts
+            - **Flexibility**: Liquidatable in T+2 (vs deposit lock-ins)
+            - **Return**: €STR + spread (currently ≈3.2-3.3%)
+            
+            #### 💰 Comparison with Alternatives (December 2024)
+            
+            **Overnight ETFs (e.g. XEON)**:
+            - Return: ≈3.2-3.3% gross
+            - TER: 0.10-0.15%
+            - Liquidity: T+2
+            - Flexibility: High
+            
+            **Term Deposit Account**:
+            - Return: 3.0-3.8% gross
+            - Costs: 0%
+            - Liquidity: Locked (3-12 months)
+            - Flexibility: Low
+            
+            **Current Account**:
+            - Return: 0-0.5%
+            - Costs: Often monthly fees
+            - Liquidity: Immediate
+            - Flexibility: Maximum
+            
+            #### ⚖️ When to Use €STR ETFs
+            
+            ✅ **IDEAL for**:
+            - Operating liquidity (3-12 months) you want to remunerate
+            - Corporate treasury
+            - Emergency fund with return
+            - Transition between investments
+            - Alternative to non-term deposits
+            
+            ❌ **NOT ideal for**:
+            - Long-term investments (use equity/bonds)
+            - Liquidity <1 month (too short)
+            - Maximum return seekers (term deposits yield more)
+            
+            #### 📊 Practical Strategy
+            
+            **Balanced Portfolio with Cash Buffer**:
+            - 60% MSCI World
+            - 30% Bonds
+            - **10% €STR ETF** (remunerated emergency liquidity)
+            
+            **Personal Liquidity Management**:
+            - Current expenses (1-2 months): Current account
+            - **Emergency fund (3-6 months): €STR ETF**
+            - LT investments: Equity/Bond ETFs
+            
+            #### 💡 Advantages vs Disadvantages
+            
+            **Advantages**:
+            - ✅ Competitive return vs current accounts
+            - ✅ Flexibility (no time constraints)
+            - ✅ Low costs (TER 0.10-0.15%)
+            - ✅ High liquidity (T+2)
+            - ✅ Automatically follows ECB rates
+            
+            **Disadvantages**:
+            - ⚠️ Lower return than long-term deposits
+            - ⚠️ Not immediate like current account (T+2)
+            - ⚠️ Requires broker/securities account
+            - ⚠️ 26% capital gains tax
+            
+            #### 🎓 Conclusion
+            
+            Overnight €STR ETFs are **legitimate and efficient** cash management tools. 
+            With TER of 0.10-0.15%, they offer a good compromise between return, 
+            flexibility and costs for those wanting to remunerate liquidity without 
+            rigid time constraints.
+            """
+        },
+        "msci_europe": {
+            "name": "MSCI Europe",
+            "description": """
+            ### MSCI Europe Index
+            
+            The **MSCI Europe Index** represents large and mid-cap stocks from 15 developed 
+            European countries, offering concentrated exposure to the European equity market.
+            
+            #### Key Features:
+            - **Coverage**: 15 developed European countries
+            - **Number of stocks**: ~430 companies
+            - **Capitalization**: Large and Mid-cap
+            - **Benchmark**: Standard for European equity
+            
+            #### Why choose it:
+            MSCI Europe is ideal for those seeking exposure to developed Europe, including both 
+            Eurozone countries and UK, Switzerland, and Nordic countries. Provides access to 
+            global leaders in sectors like luxury, pharmaceuticals, automotive, and finance.
+            """,
+            "risk_profile": {
+                "risk_level": "Medium",
+                "volatility": "14-19% annual",
+                "time_horizon": "7-10+ years",
+                "return_potential": "6-8% historical annual"
+            },
+            "strategy": """
+            ### How to Use MSCI Europe in Your Portfolio
+            
+            #### 🎯 Regional Focus Strategy
+            - **Europe Exposure**: Ideal for reducing US dependency
+            - **Geographic Diversification**: Complements S&P 500 or Nasdaq
+            - **Attractive Valuations**: Historically cheaper than US
+            
+            #### ⚖️ Effective Combinations
+            - **S&P 500 (50%) + MSCI Europe (30%) + MSCI EM (20%)**: Balanced global
+            - **MSCI Europe (60%) + MSCI USA (30%) + Bonds (10%)**: Reduce US home bias
+            - **MSCI Europe (40%) + MSCI World (40%) + Bonds (20%)**: European tilt
+            
+            #### ⚠️ Considerations
+            - **Lower growth than US**: Historically lower returns
+            - **Includes UK**: About 24% in British companies
+            - **Value focus**: Less tech, more finance and industrials
+            - **Currency diversification**: Exposure to GBP, CHF, EUR
+            - **Opportunity**: Lower valuations may offer upside potential
+            """
+        },
+        "msci_emu": {
+            "name": "MSCI EMU",
+            "description": """
+            ### MSCI EMU Index (European Monetary Union)
+            
+            The **MSCI EMU Index** represents large and mid-cap stocks from Eurozone countries, 
+            offering pure exposure to markets using the Euro as currency.
+            
+            #### Key Features:
+            - **Coverage**: 10 Eurozone countries
+            - **Number of stocks**: ~240 companies
+            - **Capitalization**: Large and Mid-cap
+            - **Benchmark**: Standard for Eurozone equity
+            
+            #### Why choose it:
+            MSCI EMU eliminates currency risk for European investors, focusing exclusively on 
+            countries using the Euro. Ideal for those wanting Eurozone exposure without the 
+            influence of UK and Switzerland.
+            """,
+            "risk_profile": {
+                "risk_level": "Medium",
+                "volatility": "15-20% annual",
+                "time_horizon": "7-10+ years",
+                "return_potential": "5-8% historical annual"
+            },
+            "strategy": """
+            ### How to Use MSCI EMU in Your Portfolio
+            
+            #### 🎯 Eurozone Strategy
+            - **No Currency Risk**: Ideal for Italian/European investors
+            - **Home Region Bias**: Invest in your own geographic area
+            - **EUR Accumulation**: 100% Euro exposure
+            
+            #### ⚖️ Effective Combinations
+            - **MSCI EMU (40%) + S&P 500 (40%) + EUR Bonds (20%)**: Balanced EUR-USA
+            - **MSCI EMU (60%) + MSCI World ex-EMU (30%) + Bonds (10%)**: Eurozone tilt
+            - **MSCI EMU (50%) + MSCI EM (20%) + Bonds (30%)**: Complete diversification
+            
+            #### ⚠️ Considerations
+            - **Excludes UK and Switzerland**: Removes 2 of Europe's largest markets
+            - **France-Germany concentration**: ~63% of total weight
+            - **Less tech**: Underweight in technology vs global indices
+            - **EU political risk**: Exposed to Eurozone political dynamics
+            - **For EUR investors**: Eliminates currency risk but reduces diversification
+            - **Valuations**: Generally more attractive than US markets
+            """
+        }
+    },
+    "metrics_labels": {
+        "risk": "Risk Level",
+        "volatility": "Volatility",
+        "horizon": "Time Horizon",
+        "returns": "Expected Returns",
+        "cagr": "Annual Return (CAGR)",
+        "max_drawdown": "Max Drawdown",
+        "sharpe": "Sharpe Ratio",
+        "sortino": "Sortino Ratio",
+        "computed_period": "Volatility and returns computed from prices between {start} and {end} (risk-free rate {rf:.1%})."
+    },
+    "chart_titles": {
+        "geographic": "Geographic Composition",
+        "sectors": "Sector Composition"
+    },
+    "risk_profile_title": "Risk/Return Profile",
+    "disclaimer": "The data shown is for educational purposes only. For real investments, consult a financial advisor.",
+    "market_data": {
+        "last_price": "Last price",
+        "unavailable": "Real-time quote not available."
+    },
+    "history": {
+        "title": "Historical Performance",
+        "range": "Visible period",
+        "points": "{shown} points shown out of {total} daily prices",
+        "missing": "No price history is available for this index. Import it with `python prices.py ingest <index> <file.csv>`."
+    },
+    "projection": {
+        "title": "Monte Carlo Wealth Projection",
+        "horizon": "Horizon (years)",
+        "method": "Model",
+        "methods": {
+            "parametric": "Parametric (normal returns)",
+            "bootstrap": "Block bootstrap of history"
+        },
+        "paths": "Simulated scenarios",
+        "progress": "{done:,} of {total:,} scenarios simulated",
+        "median": "Median",
+        "band_50": "25th-75th percentiles",
+        "band_90": "5th-95th percentiles",
+        "axis_years": "Years",
+        "axis_wealth": "Value of 100 invested",
+        "help": "Each scenario simulates monthly returns: the parametric model uses the mean and volatility of the history (or the risk profile when no history is available), the bootstrap resamples actually observed 12-month blocks. The bands show the dispersion of outcomes, not a forecast."
+    },
+    "model_portfolios": {
+        "title": "📋 Model Portfolios",
+        "columns": {
+            "portfolio": "Portfolio",
+            "cagr": "Annual return",
+            "volatility": "Volatility",
+            "max_drawdown": "Max drawdown",
+            "sharpe": "Sharpe"
+        },
+        "period": "Backtest with monthly rebalancing, from {start} to {end}.",
+        "proxy": "Components approximated with a catalog index: {components}.",
+        "unlinked": "Not computable, because they include asset classes missing from the catalog: {components}.",
+        "missing": "The model portfolio backtest requires the index price histories."
+    },
+    "pac": {
+        "title": "📅 Monthly Savings Plan (DCA) Backtest",
+        "years": "Plan duration (years)",
+        "contribution": "Monthly contribution",
+        "invested": "Total invested",
+        "median": "Median final value",
+        "p5": "Final value (5th percentile)",
+        "median_irr": "Median IRR",
+        "loss_share": "Plans at a loss",
+        "worst": "Worst case: start {start}, final value {value:,.0f} (IRR {irr:.1%})",
+        "plans": "{plans} plans simulated, one for each start month of the price history",
+        "chart_title": "Final value by start month",
+        "missing": "The savings plan backtest requires the index price history."
+    },
+    "portfolio": {
+        "weights": "Portfolio weights (%)",
+        "help": "Weights are normalized to 100%: the portfolio exposure is the average of the index compositions, weighted by the weights.",
+        "total": "Total weight",
+        "empty": "Assign a weight to at least one index.",
+        "titles": {
+            "geographic": "Portfolio Geographic Exposure",
+            "sectors": "Portfolio Sector Exposure"
+        }
+    },
+    "optimizer": {
+        "title": "💡 Suggested Allocations",
+        "help": "Mean-variance efficient frontier (no short selling) and risk parity portfolio, where every index contributes equally to risk. Expected returns and covariances are estimated from the monthly history, with covariance shrinkage: they are estimates of the past, not forecasts.",
+        "point": "Frontier point (expected volatility)",
+        "frontier": "Efficient frontier",
+        "risk_parity": "Risk parity",
+        "your_portfolio": "Your portfolio",
+        "chart_title": "Expected return and volatility",
+        "axis_volatility": "Annual volatility",
+        "axis_return": "Expected annual return",
+        "columns": {
+            "index": "Index",
+            "frontier": "Frontier (%)",
+            "risk_parity": "Risk parity (%)"
+        },
+        "apply_frontier": "Use frontier weights",
+        "apply_parity": "Use risk parity weights",
+        "missing": "Suggested allocations require the index price histories."
+    },
+    "rebalancing": {
+        "title": "⚖️ Rebalancing Policy Comparison",
+        "cost": "Transaction cost (% of traded value)",
+        "help": "Each model portfolio (and yours) is simulated over the price history with every policy. Annual return net of costs, annual turnover (share of the portfolio traded), tracking error against the constant mix rebalanced monthly, and rebalances per year.",
+        "custom": "Your portfolio",
+        "missing": "The comparison requires the price history of the portfolio indices.",
+        "columns": {
+            "portfolio": "Portfolio",
+            "policy": "Policy",
+            "return": "Annual return",
+            "volatility": "Volatility",
+            "turnover": "Annual turnover",
+            "tracking_error": "Tracking error",
+            "rebalances": "Rebalances/year"
+        },
+        "policies": {
+            "monthly": "Monthly",
+            "semiannual": "Semiannual",
+            "annual": "Annual",
+            "band_5": "±5% band",
+            "band_10": "±10% band",
+            "never": "Never (buy & hold)"
+        }
+    },
+    "memory": {
+        "title": "🧠 Memory per session",
+        "process": "Process memory (RSS)",
+        "shared": "Shared structures",
+        "sessions": "Active sessions",
+        "average": "Average per session",
+        "columns": {"session": "Session", "size": "KiB retained", "keys": "Top keys"},
+        "shared_names": {"figures": "Figures", "markdown": "HTML texts", "locales": "Language bundles"},
+        "figure_caches": "Figure caches",
+        "cache_stats": "{name} {size}/{maxsize}, {hits} hits and {misses} misses ({hit_rate:.0%} hits)",
+        "cache_names": {"figures": "shared", "history": "history"}
+    },
+    "static": {
+        "note": "Static version of the app with the default parameters: open AssetExpl to change them.",
+        "parameters": "Parameters",
+        "allocation": "Proposed portfolio"
+    },
+    "report": {
+        "title": "ETF Index Report",
+        "generated": "Generated on {date}",
+        "contents": "Indices in this report",
+        "composition": "Composition"
+    },
+    "comparison": {
+        "select": "Indices to compare",
+        "help": "Overlap is the sum, category by category, of the smaller weight of two indices: 100% means identical compositions, 0% no common exposure.",
+        "min_selection": "Select at least two indices to compare.",
+        "titles": {
+            "geographic": "Geographic Overlap (%)",
+            "sectors": "Sector Overlap (%)"
+        }
+    },
+    "categories": {
+        "geographic": {
+            "usa": "USA",
+            "japan": "Japan",
+            "united_kingdom": "United Kingdom",
+            "france": "France",
+            "canada": "Canada",
+            "switzerland": "Switzerland",
+            "germany": "Germany",
+            "australia": "Australia",
+            "others": "Others",
+            "china": "China",
+            "taiwan": "Taiwan",
+            "india": "India",
+            "south_korea": "South Korea",
+            "brazil": "Brazil",
+            "saudi_arabia": "Saudi Arabia",
+            "south_africa": "South Africa",
+            "mexico": "Mexico",
+            "thailand": "Thailand",
+            "eurozone": "Eurozone",
+            "netherlands": "Netherlands",
+            "sweden": "Sweden",
+            "denmark": "Denmark",
+            "spain": "Spain",
+            "italy": "Italy",
+            "ireland": "Ireland",
+            "belgium": "Belgium",
+            "finland": "Finland"
+        },
+        "sectors": {
+            "technology": "Technology",
+            "finance": "Finance",
+            "healthcare": "Healthcare",
+            "consumer_cyclical": "Consumer Cyclical",
+            "industrials": "Industrials",
+            "consumer_staples": "Consumer Staples",
+            "energy": "Energy",
+            "utilities": "Utilities",
+            "materials": "Materials",
+            "others": "Others",
+            "communication_services": "Communication Services",
+            "real_estate": "Real Estate",
+            "overnight_rate_swaps": "Overnight Rate Swaps",
+            "money_market": "Money Market",
+            "cash_collateral": "Cash Collateral"
+        }
+    }
+}
@@ -0,0 +1,658 @@
+"""
+AssetExpl - Italian locale bundle
+"""
+
+CONTENT = {
+    "app_title": "📊 AssetExpl - Esploratore ETF",
+    "app_subtitle": "Esplora i principali indici ETF globali con dati interattivi",
+    "sidebar_title": "⚙️ Impostazioni",
+    "language_label": "Lingua",
+    "select_index": "Seleziona Indice",
+    "tabs": {
+        "description": "📄 Descrizione",
+        "statistics": "📈 Statistiche",
+        "strategy": "🎯 Strategia d'Uso",
+        "history": "📉 Storico",
+        "comparison": "⚖️ Confronto",
+        "portfolio": "🧮 Portafoglio",
+        "projection": "🔮 Proiezioni"
+    },
+    "indices": {
+        "msci_world": {
+            "name": "MSCI World",
+            "description": """
+            ### MSCI World Index
+            
+            L'**MSCI World Index** è un indice azionario globale che rappresenta le large e mid-cap 
+            di 23 paesi sviluppati. Copre circa l'85% del mercato azionario capitalizzato in ciascun paese.
+            
+            #### Caratteristiche Principali:
+            - **Copertura**: 23 mercati sviluppati
+            - **Numero titoli**: ~1,500 azioni
+            - **Capitalizzazione**: Large e Mid-cap
+            - **Benchmark**: Standard per portafogli globali diversificati
+            
+            #### Perché sceglierlo:
+            L'MSCI World è ideale per investitori che cercano un'esposizione diversificata ai mercati 
+            sviluppati globali, con una forte presenza del mercato statunitense (~70%) ma anche 
+            significativa esposizione a Europa e Asia-Pacifico.
+            """,
+            "risk_profile": {
+                "risk_level": "Medio-Alto",
+                "volatility": "15-20% annua",
+                "time_horizon": "7-10+ anni",
+                "return_potential": "7-9% annuo storico"
+            },
+            "strategy": """
+            ### Come Utilizzare MSCI World nel tuo Portfolio
+            
+            #### 🎯 Strategia Core
+            - **Portafoglio Base**: Usa MSCI World come asset principale (50-70% del portfolio)
+            - **Ribilanciamento**: Annuale o semestrale
+            - **Accumulo**: Piano di accumulo mensile (PAC) per ridurre il rischio timing
+            
+            #### ⚖️ Combinazioni Efficaci
+            - **MSCI World (70%) + Obbligazioni (30%)**: Portfolio bilanciato moderato
+            - **MSCI World (60%) + Emerging Markets (20%) + Obbligazioni (20%)**: Crescita con diversificazione
+            - **MSCI World (80%) + Small Cap (20%)**: Aggressivo orientato all'equity
+            
+            #### ⚠️ Considerazioni
+            - Alta esposizione USA (~70%) - considera diversificazione geografica aggiuntiva
+            - Non include mercati emergenti - valuta integrazione con MSCI EM
+            - Esclude small-cap - opportunità di rendimenti superiori escluse
+            """
+        },
+        "sp500": {
+            "name": "S&P 500",
+            "description": """
+            ### S&P 500 Index
+            
+            Lo **S&P 500** è l'indice più seguito al mondo, rappresentando le 500 maggiori aziende 
+            quotate negli Stati Uniti. È considerato il miglior indicatore della performance 
+            del mercato azionario americano.
+            
+            #### Caratteristiche Principali:
+            - **Copertura**: Mercato USA
+            - **Numero titoli**: 500 azioni
+            - **Capitalizzazione**: Large-cap
+            - **Benchmark**: Standard per il mercato azionario USA
+            
+            #### Perché sceglierlo:
+            L'S&P 500 offre esposizione alle più grandi e consolidate aziende americane, 
+            inclusi giganti tecnologici come Apple, Microsoft, Amazon. Storicamente ha 
+            fornito rendimenti medi del 10% annuo nel lungo periodo.
+            """,
+            "risk_profile": {
+                "risk_level": "Medio-Alto",
+                "volatility": "15-18% annua",
+                "time_horizon": "5-10+ anni",
+                "return_potential": "9-11% annuo storico"
+            },
+            "strategy": """
+            ### Come Utilizzare S&P 500 nel tuo Portfolio
+            
+            #### 🎯 Strategia Core USA
+            - **Esposizione USA**: Ideale per chi crede nel mercato americano
+            - **Investimento Long-Term**: Buy and hold per 10+ anni
+            - **Dollar Cost Averaging**: Investimenti mensili per mediare i prezzi
+            
+            #### ⚖️ Combinazioni Efficaci
+            - **S&P 500 (60%) + International (30%) + Bonds (10%)**: Globale con focus USA
+            - **S&P 500 (50%) + Nasdaq 100 (20%) + Bonds (30%)**: Tech-heavy moderato
+            - **S&P 500 (70%) + REIT (15%) + Gold (15%)**: Diversificazione asset class
+            
+            #### ⚠️ Considerazioni
+            - Concentrazione geografica al 100% USA - rischio paese
+            - Alta esposizione tech (~30%) - volatile ma ad alto potenziale
+            - Dominanza di mega-cap - poche opportunità small/mid cap
+            - Sensibile a tassi Fed e politiche USA
+            """
+        },
+        "msci_em": {
+            "name": "MSCI Emerging Markets",
+            "description": """
+            ### MSCI Emerging Markets Index
+            
+            L'**MSCI Emerging Markets Index** cattura le large e mid-cap di 24 paesi emergenti, 
+            rappresentando circa l'85% della capitalizzazione di mercato in ciascun paese.
+            
+            #### Caratteristiche Principali:
+            - **Copertura**: 24 mercati emergenti
+            - **Numero titoli**: ~1,400 azioni
+            - **Capitalizzazione**: Large e Mid-cap
+            - **Benchmark**: Standard per mercati emergenti
+            
+            #### Perché sceglierlo:
+            Offre esposizione a economie in rapida crescita come Cina, India, Taiwan, Brasile. 
+            Maggiore potenziale di crescita rispetto ai mercati sviluppati ma con volatilità 
+            più elevata. Essenziale per diversificazione geografica.
+            """,
+            "risk_profile": {
+                "risk_level": "Alto",
+                "volatility": "20-25% annua",
+                "time_horizon": "10+ anni",
+                "return_potential": "8-12% annuo storico (alta variabilità)"
+            },
+            "strategy": """
+            ### Come Utilizzare MSCI EM nel tuo Portfolio
+            
+            #### 🎯 Strategia Satellite
+            - **Allocazione**: 10-30% del portfolio equity
+            - **Complemento**: Affianca MSCI World o S&P 500
+            - **Pazienza**: Richiede orizzonte temporale lungo (10+ anni)
+            
+            #### ⚖️ Combinazioni Efficaci
+            - **MSCI World (70%) + MSCI EM (20%) + Bonds (10%)**: Globale completo
+            - **S&P 500 (60%) + MSCI EM (30%) + REIT (10%)**: Crescita aggressiva
+            - **MSCI World (50%) + MSCI EM (25%) + Bonds (25%)**: Bilanciato globale
+            
+            #### ⚠️ Considerazioni
+            - **Alta volatilità**: Oscillazioni anche >30% annue
+            - **Rischio politico**: Instabilità in alcuni paesi emergenti
+            - **Rischio valutario**: Esposizione a monete volatili
+            - **Concentrazione Asia**: ~75% in mercati asiatici
+            - **Opportunità**: Crescita demografica e espansione classe media
+            """
+        },
+        "msci_acwi": {
+            "name": "MSCI ACWI",
+            "description": """
+            ### MSCI All Country World Index (ACWI)
+            
+            L'**MSCI ACWI** è l'indice più completo per l'equity globale, combinando mercati 
+            sviluppati ed emergenti. Rappresenta il 99% dell'opportunità di investimento 
+            azionario globale.
+            
+            #### Caratteristiche Principali:
+            - **Copertura**: 23 mercati sviluppati + 24 mercati emergenti
+            - **Numero titoli**: ~3,000 azioni
+            - **Capitalizzazione**: Large e Mid-cap
+            - **Benchmark**: Il più completo indice azionario globale
+            
+            #### Perché sceglierlo:
+            L'MSCI ACWI è la soluzione "one-stop-shop" per l'equity globale. Con una singola 
+            posizione ottieni esposizione bilanciata a mercati sviluppati (~85%) ed emergenti 
+            (~15%), eliminando la necessità di combinare più indici.
+            """,
+            "risk_profile": {
+                "risk_level": "Medio-Alto",
+                "volatility": "16-21% annua",
+                "time_horizon": "7-10+ anni",
+                "return_potential": "7-10% annuo storico"
+            },
+            "strategy": """
+            ### Come Utilizzare MSCI ACWI nel tuo Portfolio
+            
+            #### 🎯 Strategia "All-in-One"
+            - **Portafoglio Semplificato**: MSCI ACWI come unico ETF equity (60-100%)
+            - **Gestione Passiva**: Perfetto per approccio "set and forget"
+            - **Ribilanciamento Automatico**: L'indice si aggiusta automaticamente tra DM e EM
+            
+            #### ⚖️ Combinazioni Efficaci
+            - **MSCI ACWI (80%) + Obbligazioni (20%)**: Portfolio globale semplice
+            - **MSCI ACWI (70%) + Obbligazioni (25%) + Oro (5%)**: Protezione inflazione
+            - **MSCI ACWI (90%) + Small Cap (10%)**: Massima equity exposure
+            
+            #### ⚠️ Considerazioni
+            - **Vantaggio principale**: Massima diversificazione in un solo ETF
+            - **Esposizione USA**: Ancora dominante (~62%)
+            - **EM inclusi**: Non serve combinare con MSCI EM
+            - **TER leggermente superiore**: Rispetto a MSCI World per via degli EM
+            - **Ideale per principianti**: Semplicità gestionale massima
+            """
+        },
+        "ftse_all_world": {
+            "name": "FTSE All-World",
+            "description": """
+            ### FTSE All-World Index
+            
+            Il **FTSE All-World Index** è l'alternativa di FTSE all'MSCI ACWI, offrendo 
+            esposizione completa a mercati sviluppati ed emergenti con una copertura ancora 
+            più ampia.
+            
+            #### Caratteristiche Principali:
+            - **Copertura**: 49 paesi (25 sviluppati + 24 emergenti)
+            - **Numero titoli**: ~4,000 azioni
+            - **Capitalizzazione**: Large, Mid e Small-cap
+            - **Benchmark**: Alternativa completa all'MSCI ACWI
+            
+            #### Perché sceglierlo:
+            FTSE All-World include anche le small-cap, offrendo una copertura del 98% del 
+            mercato azionario globale investibile. È la scelta preferita per chi cerca la 
+            massima diversificazione possibile in un singolo strumento.
+            """,
+            "risk_profile": {
+                "risk_level": "Medio-Alto",
+                "volatility": "16-22% annua",
+                "time_horizon": "7-10+ anni",
+                "return_potential": "7-10% annuo storico"
+            },
+            "strategy": """
+            ### Come Utilizzare FTSE All-World nel tuo Portfolio
+            
+            #### 🎯 Strategia Massima Diversificazione
+            - **Portfolio Completo**: FTSE All-World come unico ETF equity necessario
+            - **Inclusione Small-Cap**: Cattura opportunità anche in aziende più piccole
+            - **Buy & Hold**: Ideale per investitori passivi a lungo termine
+            
+            #### ⚖️ Combinazioni Efficaci
+            - **FTSE All-World (80%) + Obbligazioni Globali (20%)**: Semplicità massima
+            - **FTSE All-World (70%) + Bonds (20%) + Oro (10%)**: Portfolio resiliente
+            - **FTSE All-World (100%)**: Opzione 100% equity per profili aggressivi
+            
+            #### ⚠️ Considerazioni
+            - **Copertura superiore**: Include small-cap (vs MSCI ACWI)
+            - **4,000+ titoli**: Massima diversificazione disponibile
+            - **Alternativa MSCI**: Metodologia leggermente diversa ma risultati simili
+            - **Liquidità ETF**: Verificare gli spread bid-ask
+            - **Perfetto per "Lazy Portfolio"**: Soluzione completa in un solo ETF
+            """
+        },
+        "solactive_str": {
+            "name": "Solactive €STR +8.5bp Daily",
+            "description": """
+            ### Solactive €STR +8.5 basis points Daily Index
+            
+            Il **Solactive €STR +8.5bp Daily** è un indice benchmark per ETF monetari che 
+            replicano il tasso overnight dell'Eurozona (€STR) con un piccolo spread positivo. 
+            Utilizzato in ETF come **Xtrackers EUR Overnight Rate Swap (XEON)**.
+            
+            #### Caratteristiche Principali:
+            - **Benchmark**: €STR + 8.5 basis points (0.085%)
+            - **Tipo**: Indice money market overnight
+            - **Uso**: ETF monetari per cash management
+            - **Liquidità**: Giornaliera (T+2)
+            
+            #### Perché sceglierlo:
+            Ideale per parcheggiare liquidità a breve termine con rendimenti superiori al 
+            conto corrente tradizionale. Gli ETF che seguono questo indice (come XEON) offrono 
+            un'alternativa efficiente ai conti deposito con maggiore flessibilità e costi 
+            contenuti (TER tipico: 0.10-0.15%).
+            
+            #### ETF Popolari:
+            - **XEON** - Xtrackers EUR Overnight Rate Swap UCITS ETF
+            - Ideale per tesoreria aziendale e gestione liquidità personale
+            """,
+            "risk_profile": {
+                "risk_level": "Molto Basso",
+                "volatility": "Quasi nulla (<0.5% annua)",
+                "time_horizon": "Breve termine (giorni/mesi)",
+                "return_potential": "€STR + 0.085% (≈3.2-3.3% con €STR ≈3.15%)"
+            },
+            "strategy": """
+            ### Come Utilizzare ETF €STR nel Portfolio
+            
+            #### 🎯 Cash Management Efficiente
+            - **Parcheggio liquidità**: Alternativa a conti correnti/deposito
+            - **Flessibilità**: Liquidabile in T+2 (vs vincoli depositi)
+            - **Rendimento**: €STR + spread (attualmente ≈3.2-3.3%)
+            
+            #### 💰 Confronto con Alternative (Dicembre 2024)
+            
+            **ETF Overnight (es. XEON)**:
+            - Rendimento: ≈3.2-3.3% lordo
+            - TER: 0.10-0.15%
+            - Liquidità: T+2
+            - Flessibilità: Alta
+            
+            **Conto Deposito Vincolato**:
+            - Rendimento: 3.0-3.8% lordo
+            - Costi: 0%
+            - Liquidità: Vincolato (3-12 mesi)
+            - Flessibilità: Bassa
+            
+            **Conto Corrente**:
+            - Rendimento: 0-0.5%
+            - Costi: Spesso canone mensile
+            - Liquidità: Immediata
+            - Flessibilità: Massima
+            
+            #### ⚖️ Quando Usare ETF €STR
+            
+            ✅ **IDEALE per**:
+            - Liquidità operativa (3-12 mesi) che vuoi remunerare
+            - Tesoreria aziendale
+            - Emergency fund con rendimento
+            - Transizione tra investimenti
+            - Alternativa a depositi non vincolati
+            
+            ❌ **NON ideale per**:
+            - Investimenti long-term (usa equity/obbligazioni)
+            - Liquidità <1 mese (troppo breve)
+            - Chi cerca massimo rendimento (vincolato rende di più)
+            
+            #### 📊 Strategia Pratica
+            
+            **Portfolio Bilanciato con Cash Buffer**:
+            - 60% MSCI World
+            - 30% Obbligazioni
+            - **10% ETF €STR** (liquidità di emergenza remunerata)
+            
+            **Gestione Liquidità Personale**:
+            - Spese correnti (1-2 mesi): Conto corrente
+            - **Emergency fund (3-6 mesi): ETF €STR**
+            - Investimenti LT: Equity/Bond ETF
+            
+            #### 💡 Vantaggi vs Svantaggi
+            
+            **Vantaggi**:
+            - ✅ Rendimento competitivo vs conti correnti
+            - ✅ Flessibilità (no vincoli temporali)
+            - ✅ Costi bassi (TER 0.10-0.15%)
+            - ✅ Liquidità alta (T+2)
+            - ✅ Segue automaticamente i tassi BCE
+            
+            **Svantaggi**:
+            - ⚠️ Rendimento inferiore a depositi vincolati lunghi
+            - ⚠️ Non immediato come conto corrente (T+2)
+            - ⚠️ Richiede broker/conto titoli
+            - ⚠️ Tassazione 26% su capital gains
+            
+            #### 🎓 Conclusione
+            
+            Gli ETF overnight €STR sono strumenti **legittimi ed efficienti** per cash 
+            management. Con TER dello 0.10-0.15%, offrono un buon compromesso tra 
+            rendimento, flessibilità e costi per chi vuole remunerare la liquidità 
+            senza vincoli temporali rigidi.
+            """
+        },
+        "msci_europe": {
+            "name": "MSCI Europe",
+            "description": """
+            ### MSCI Europe Index
+            
+            L'**MSCI Europe Index** rappresenta le large e mid-cap di 15 paesi europei 
+            sviluppati, offrendo esposizione concentrata al mercato azionario europeo.
+            
+            #### Caratteristiche Principali:
+            - **Copertura**: 15 paesi europei sviluppati
+            - **Numero titoli**: ~430 azioni
+            - **Capitalizzazione**: Large e Mid-cap
+            - **Benchmark**: Standard per equity europea
+            
+            #### Perché sceglierlo:
+            MSCI Europe è ideale per chi vuole esposizione all'Europa sviluppata, includendo 
+            sia paesi dell'Eurozona che UK, Svizzera, e paesi nordici. Offre accesso a 
+            leader globali in settori come lusso, farmaceutico, automotive e finanziario.
+            """,
+            "risk_profile": {
+                "risk_level": "Medio",
+                "volatility": "14-19% annua",
+                "time_horizon": "7-10+ anni",
+                "return_potential": "6-8% annuo storico"
+            },
+            "strategy": """
+            ### Come Utilizzare MSCI Europe nel tuo Portfolio
+            
+            #### 🎯 Strategia Regional Focus
+            - **Esposizione Europa**: Ideale per ridurre dipendenza USA
+            - **Diversificazione Geografica**: Complementa S&P 500 o Nasdaq
+            - **Valutazioni Attraenti**: Storicamente più economico rispetto a USA
+            
+            #### ⚖️ Combinazioni Efficaci
+            - **S&P 500 (50%) + MSCI Europe (30%) + MSCI EM (20%)**: Globale bilanciato
+            - **MSCI Europe (60%) + MSCI USA (30%) + Bonds (10%)**: Riduzione home bias USA
+            - **MSCI Europe (40%) + MSCI World (40%) + Bonds (20%)**: Tilt europeo
+            
+            #### ⚠️ Considerazioni
+            - **Crescita inferiore a USA**: Storicamente rendimenti più bassi
+            - **Include UK**: Circa 24% in aziende britanniche
+            - **Focus Value**: Meno tech, più finanza e industria
+            - **Diversificazione valutaria**: Esposizione GBP, CHF, EUR
+            - **Opportunità**: Valutazioni più basse possono offrire potenziale upside
+            """
+        },
+        "msci_emu": {
+            "name": "MSCI EMU",
+            "description": """
+            ### MSCI EMU Index (European Monetary Union)
+            
+            L'**MSCI EMU Index** rappresenta le large e mid-cap dei paesi dell'Eurozona, 
+            offrendo esposizione pura ai mercati che utilizzano l'Euro come valuta.
+            
+            #### Caratteristiche Principali:
+            - **Copertura**: 10 paesi dell'Eurozona
+            - **Numero titoli**: ~240 azioni
+            - **Capitalizzazione**: Large e Mid-cap
+            - **Benchmark**: Standard per equity Eurozona
+            
+            #### Perché sceglierlo:
+            MSCI EMU elimina il rischio valutario per investitori europei, concentrandosi 
+            esclusivamente su paesi che usano l'Euro. Ideale per chi vuole esposizione 
+            all'Eurozona senza l'influenza di UK e Svizzera.
+            """,
+            "risk_profile": {
+                "risk_level": "Medio",
+                "volatility": "15-20% annua",
+                "time_horizon": "7-10+ anni",
+                "return_potential": "5-8% annuo storico"
+            },
+            "strategy": """
+            ### Come Utilizzare MSCI EMU nel tuo Portfolio
+            
+            #### 🎯 Strategia Eurozona
+            - **No Rischio Cambio**: Ideale per investitori italiani/europei
+            - **Home Region Bias**: Investire nella propria area geografica
+            - **Accumulo EUR**: Esposizione 100% in Euro
+            
+            #### ⚖️ Combinazioni Efficaci
+            - **MSCI EMU (40%) + S&P 500 (40%) + Bonds EUR (20%)**: Bilanciato EUR-USA
+            - **MSCI EMU (60%) + MSCI World ex-EMU (30%) + Bonds (10%)**: Tilt Eurozona
+            - **MSCI EMU (50%) + MSCI EM (20%) + Bonds (30%)**: Diversificazione completa
+            
+            #### ⚠️ Considerazioni
+            - **Esclude UK e Svizzera**: Elimina 2 dei maggiori mercati europei
+            - **Concentrazione Francia-Germania**: ~63% del peso totale
+            - **Meno tech**: Sottopesato in tecnologia rispetto a indici globali
+            - **Rischio politico UE**: Esposto a dinamiche politiche dell'Eurozona
+            - **Per investitori EUR**: Elimina rischio cambio ma riduce diversificazione
+            - **Valutazioni**: Generalmente più convenienti rispetto a mercati USA
+            """
+        }
+    },
+    "metrics_labels": {
+        "risk": "Livello di Rischio",
+        "volatility": "Volatilità",
+        "horizon": "Orizzonte Temporale",
+        "returns": "Rendimento Atteso",
+        "cagr": "Rendimento Annuo (CAGR)",
+        "max_drawdown": "Max Drawdown",
+        "sharpe": "Sharpe Ratio",
+        "sortino": "Sortino Ratio",
+        "computed_period": "Volatilità e rendimento calcolati sui prezzi dal {start} al {end} (tasso privo di rischio {rf:.1%})."
+    },
+    "chart_titles": {
+        "geographic": "Composizione Geografica",
+        "sectors": "Composizione Settoriale"
+    },
+    "risk_profile_title": "Profilo Rischio/Rendimento",
+    "disclaimer": "I dati mostrati sono a scopo puramente didattico. Per investimenti reali, consulta un consulente finanziario.",
+    "market_data": {
+        "last_price": "Ultimo prezzo",
+        "unavailable": "Quotazione in tempo reale non disponibile."
+    },
+    "history": {
+        "title": "Andamento Storico",
+        "range": "Periodo visualizzato",
+        "points": "{shown} punti mostrati su {total} prezzi giornalieri",
+        "missing": "Nessuna serie storica disponibile per questo indice. Importala con `python prices.py ingest <indice> <file.csv>`."
+    },
+    "projection": {
+        "title": "Proiezione Monte Carlo del Capitale",
+        "horizon": "Orizzonte (anni)",
+        "method": "Modello",
+        "methods": {
+            "parametric": "Parametrico (rendimenti normali)",
+            "bootstrap": "Bootstrap a blocchi dello storico"
+        },
+        "paths": "Scenari simulati",
+        "progress": "{done:,} scenari su {total:,} simulati",
+        "median": "Mediana",
+        "band_50": "Percentili 25-75",
+        "band_90": "Percentili 5-95",
+        "axis_years": "Anni",
+        "axis_wealth": "Valore di 100 investiti",
+        "help": "Ogni scenario simula rendimenti mensili: il modello parametrico usa media e volatilità dello storico (o il profilo di rischio se lo storico manca), il bootstrap ricampiona blocchi di 12 mesi realmente osservati. Le bande mostrano la dispersione dei risultati, non una previsione."
+    },
+    "model_portfolios": {
+        "title": "📋 Portafogli Modello",
+        "columns": {
+            "portfolio": "Portafoglio",
+            "cagr": "Rendimento annuo",
+            "volatility": "Volatilità",
+            "max_drawdown": "Max drawdown",
+            "sharpe": "Sharpe"
+        },
+        "period": "Backtest con ribilanciamento mensile, dal {start} al {end}.",
+        "proxy": "Componenti approssimate con un indice del catalogo: {components}.",
+        "unlinked": "Non calcolabili, perché includono asset class assenti dal catalogo: {components}.",
+        "missing": "Il backtest dei portafogli modello richiede le serie storiche degli indici."
+    },
+    "pac": {
+        "title": "📅 Backtest del Piano di Accumulo (PAC)",
+        "years": "Durata del piano (anni)",
+        "contribution": "Versamento mensile",
+        "invested": "Totale versato",
+        "median": "Valore finale mediano",
+        "p5": "Valore finale (5° percentile)",
+        "median_irr": "IRR mediano",
+        "loss_share": "Piani in perdita",
+        "worst": "Caso peggiore: partenza {start}, valore finale {value:,.0f} (IRR {irr:.1%})",
+        "plans": "{plans} piani simulati, uno per ogni mese di partenza della serie storica",
+        "chart_title": "Valore finale per mese di partenza",
+        "missing": "Il backtest del PAC richiede la serie storica dell'indice."
+    },
+    "portfolio": {
+        "weights": "Pesi del portafoglio (%)",
+        "help": "I pesi vengono normalizzati a 100%: l'esposizione del portafoglio è la media delle composizioni degli indici, ponderata per i pesi.",
+        "total": "Totale pesi",
+        "empty": "Assegna un peso ad almeno un indice.",
+        "titles": {
+            "geographic": "Esposizione Geografica del Portafoglio",
+            "sectors": "Esposizione Settoriale del Portafoglio"
+        }
+    },
+    "optimizer": {
+        "title": "💡 Allocazioni Suggerite",
+        "help": "Frontiera efficiente media-varianza (senza vendite allo scoperto) e portafoglio risk parity, in cui ogni indice contribuisce in egual misura al rischio. Rendimenti attesi e covarianze sono stimati dallo storico mensile, con shrinkage della covarianza: sono stime del passato, non previsioni.",
+        "point": "Punto della frontiera (volatilità attesa)",
+        "frontier": "Frontiera efficiente",
+        "risk_parity": "Risk parity",
+        "your_portfolio": "Il tuo portafoglio",
+        "chart_title": "Rendimento atteso e volatilità",
+        "axis_volatility": "Volatilità annua",
+        "axis_return": "Rendimento atteso annuo",
+        "columns": {
+            "index": "Indice",
+            "frontier": "Frontiera (%)",
+            "risk_parity": "Risk parity (%)"
+        },
+        "apply_frontier": "Usa i pesi della frontiera",
+        "apply_parity": "Usa i pesi risk parity",
+        "missing": "Le allocazioni suggerite richiedono le serie storiche degli indici."
+    },
+    "rebalancing": {
+        "title": "⚖️ Confronto delle Politiche di Ribilanciamento",
+        "cost": "Costo di transazione (% del controvalore scambiato)",
+        "help": "Ogni portafoglio modello (e il tuo) viene simulato sullo storico con ogni politica. Rendimento annuo al netto dei costi, turnover annuo (quota del portafoglio scambiata), tracking error rispetto al mix costante ribilanciato ogni mese e ribilanciamenti all'anno.",
+        "custom": "Il tuo portafoglio",
+        "missing": "Il confronto richiede la serie storica degli indici dei portafogli.",
+        "columns": {
+            "portfolio": "Portafoglio",
+            "policy": "Politica",
+            "return": "Rendimento annuo",
+            "volatility": "Volatilità",
+            "turnover": "Turnover annuo",
+            "tracking_error": "Tracking error",
+            "rebalances": "Ribilanciamenti/anno"
+        },
+        "policies": {
+            "monthly": "Mensile",
+            "semiannual": "Semestrale",
+            "annual": "Annuale",
+            "band_5": "Banda ±5%",
+            "band_10": "Banda ±10%",
+            "never": "Mai (buy & hold)"
+        }
+    },
+    "memory": {
+        "title": "🧠 Memoria per sessione",
+        "process": "Memoria del processo (RSS)",
+        "shared": "Strutture condivise",
+        "sessions": "Sessioni attive",
+        "average": "Media per sessione",
+        "columns": {"session": "Sessione", "size": "KiB trattenuti", "keys": "Chiavi principali"},
+        "shared_names": {"figures": "Figure", "markdown": "Testi HTML", "locales": "Bundle di lingua"},
+        "figure_caches": "Cache delle figure",
+        "cache_stats": "{name} {size}/{maxsize}, {hits} hit e {misses} miss ({hit_rate:.0%} hit)",
+        "cache_names": {"figures": "condivisa", "history": "storico"}
+    },
+    "static": {
+        "note": "Versione statica dell'app con i parametri predefiniti: per modificarli apri AssetExpl.",
+        "parameters": "Parametri",
+        "allocation": "Portafoglio proposto"
+    },
+    "report": {
+        "title": "Report indici ETF",
+        "generated": "Generato il {date}",
+        "contents": "Indici del report",
+        "composition": "Composizione"
+    },
+    "comparison": {
+        "select": "Indici da confrontare",
+        "help": "La sovrapposizione è la somma, categoria per categoria, del peso minore tra due indici: 100% indica composizioni identiche, 0% nessuna esposizione in comune.",
+        "min_selection": "Seleziona almeno due indici per il confronto.",
+        "titles": {
+            "geographic": "Sovrapposizione Geografica (%)",
+            "sectors": "Sovrapposizione Settoriale (%)"
+        }
+    },
+    "categories": {
+        "geographic": {
+            "usa": "USA",
+            "japan": "Giappone",
+            "united_kingdom": "Regno Unito",
+            "france": "Francia",
+            "canada": "Canada",
+            "switzerland": "Svizzera",
+            "germany": "Germania",
+            "australia": "Australia",
+            "others": "Altri",
+            "china": "Cina",
+            "taiwan": "Taiwan",
+            "india": "India",
+            "south_korea": "Corea del Sud",
+            "brazil": "Brasile",
+            "saudi_arabia": "Arabia Saudita",
+            "south_africa": "Sud Africa",
+            "mexico": "Messico",
+            "thailand": "Tailandia",
+            "eurozone": "Eurozona",
+            "netherlands": "Paesi Bassi",
+            "sweden": "Svezia",
+            "denmark": "Danimarca",
+            "spain": "Spagna",
+            "italy": "Italia",
+            "ireland": "Irlanda",
+            "belgium": "Belgio",
+            "finland": "Finlandia"
+        },
+        "sectors": {
+            "technology": "Tecnologia",
+            "finance": "Finanza",
+            "healthcare": "Salute",
+            "consumer_cyclical": "Beni Ciclici",
+            "industrials": "Industria",
+            "consumer_staples": "Beni di Consumo",
+            "energy": "Energia",
+            "utilities": "Utilities",
+            "materials": "Materiali",
+            "others": "Altri",
+            "communication_services": "Servizi Comunicazione",
+            "real_estate": "Immobiliare",
+            "overnight_rate_swaps": "Overnight Rate Swaps",
+            "money_market": "Money Market",
+            "cash_collateral": "Cash Collateral"
+        }
+    }
+}
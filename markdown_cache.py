@@ -0,0 +1,127 @@
+"""
+AssetExpl - Pre-rendered markdown
+Description and strategy texts converted once per (language, index) into
+sanitized HTML and shared by every Streamlit session. An entry is rendered
+again only when its source text changes (for example after a hot reload of a
+locale bundle), so the other entries stay valid.
+"""
+
+import html
+import re
+import textwrap
+import threading
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*)$")
+_BULLET = re.compile(r"^[-*+]\s+(.*)$")
+_NUMBERED = re.compile(r"^\d+[.)]\s+(.*)$")
+_BOLD = re.compile(r"\*\*(.+?)\*\*")
+_ITALIC = re.compile(r"(?<![*\w])\*(?!\s)(.+?)(?<!\s)\*(?![*\w])")
+_CODE = re.compile(r"`([^`]+)`")
+_LINK = re.compile(r"\[([^\]]+)\]\((https?://[^\s)]+)\)")
+
+
+def _inline(text):
+    """Converte la formattazione in linea di un testo già escapato"""
+    text = _CODE.sub(r"<code>\1</code>", text)
+    text = _BOLD.sub(r"<strong>\1</strong>", text)
+    text = _ITALIC.sub(r"<em>\1</em>", text)
+    return _LINK.sub(r'<a href="\2" target="_blank" rel="noopener noreferrer">\1</a>', text)
+
+
+def render_markdown(text):
+    """Converte in HTML il sottoinsieme di markdown usato nei testi.
+
+    Titoli, elenchi puntati e numerati, paragrafi, grassetto, corsivo, codice
+    e link http(s). Tutto il testo viene escapato prima della conversione,
+    quindi l'HTML eventualmente presente nel sorgente viene mostrato come testo.
+    """
+    blocks = []
+    paragraph = []
+    list_tag = None
+
+    def close_paragraph():
+        if paragraph:
+            blocks.append(f"<p>{_inline(' '.join(paragraph))}</p>")
+            paragraph.clear()
+
+    def close_list():
+        nonlocal list_tag
+        if list_tag:
+            blocks.append(f"</{list_tag}>")
+            list_tag = None
+
+    for line in textwrap.dedent(text).splitlines():
+        line = html.escape(line.strip())
+        if not line:
+            close_paragraph()
+            close_list()
+            continue
+
+        heading = _HEADING.match(line)
+        item = _BULLET.match(line)
+        numbered = None if item else _NUMBERED.match(line)
+        if heading:
+            close_paragraph()
+            close_list()
+            level = len(heading.group(1))
+            blocks.append(f"<h{level}>{_inline(heading.group(2))}</h{level}>")
+        elif item or numbered:
+            close_paragraph()
+            tag = "ul" if item else "ol"
+            if list_tag != tag:
+                close_list()
+                blocks.append(f"<{tag}>")
+                list_tag = tag
+            blocks.append(f"<li>{_inline((item or numbered).group(1))}</li>")
+        else:
+            close_list()
+            paragraph.append(line)
+
+    close_paragraph()
+    close_list()
+    return "\n".join(blocks)
+
+
+class MarkdownCache:
+    """HTML dei testi per (lingua, indice, campo), condiviso tra le sessioni.
+
+    Ogni voce conserva il testo sorgente da cui è stata generata: se il bundle
+    viene ricaricato con un testo diverso, solo quella voce viene rigenerata.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.renders = 0
+
+    def get(self, lang, index_key, field, source):
+        """HTML di `source`, generato solo se la voce manca o il testo è cambiato"""
+        key = (lang, index_key, field)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[0] is source or entry[0] == source):
+                self.hits += 1
+                return entry[1]
+
+        rendered = render_markdown(source)
+        with self._lock:
+            self._entries[key] = (source, rendered)
+            self.renders += 1
+        return rendered
+
+    def invalidate(self, lang=None, index_key=None):
+        """Scarta le voci della lingua e/o dell'indice indicati (tutte se nessuno)"""
+        with self._lock:
+            for key in list(self._entries):
+                if lang in (None, key[0]) and index_key in (None, key[1]):
+                    del self._entries[key]
+
+    def stats(self):
+        """Restituisce hit, rigenerazioni e numero di voci"""
+        with self._lock:
+            return {"hits": self.hits, "renders": self.renders, "size": len(self._entries)}
+
+
+# Istanza unica per processo, condivisa da tutte le sessioni
+MARKDOWN_CACHE = MarkdownCache()
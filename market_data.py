@@ -0,0 +1,230 @@
+"""
+AssetExpl - Market data
+Pluggable quote providers fetched with asyncio, behind a TTL cache shared by
+every Streamlit session: concurrent requests for the same ticker wait on a
+single upstream call.
+
+Configuration (environment):
+    ASSETEXPL_MARKET_DATA=yahoo          quotes from Yahoo Finance (needs aiohttp)
+    ASSETEXPL_MARKET_DATA=file:<path>    quotes from a local JSON file
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from typing import NamedTuple
+
+# Ticker di un ETF o indice di riferimento per ogni indice del catalogo
+INDEX_TICKERS = {
+    "msci_world": "URTH",
+    "sp500": "^GSPC",
+    "msci_em": "EEM",
+    "msci_acwi": "ACWI",
+    "ftse_all_world": "VWRL.L",
+    "solactive_str": "XEON.DE",
+    "msci_europe": "IEUR",
+    "msci_emu": "EZU",
+}
+
+DEFAULT_TTL = 60.0
+DEFAULT_TIMEOUT = 10.0
+
+
+class Quote(NamedTuple):
+    """Ultima quotazione di un ticker"""
+    ticker: str
+    price: float
+    currency: str
+    timestamp: float
+
+
+# ============================================================================
+# PROVIDER
+# ============================================================================
+
+class MarketDataProvider:
+    """Interfaccia dei provider: una richiesta asincrona per un gruppo di ticker"""
+
+    async def fetch_many(self, tickers):
+        """Restituisce {ticker: Quote}; i ticker sconosciuti vengono omessi"""
+        raise NotImplementedError
+
+
+class FileProvider(MarketDataProvider):
+    """Provider locale per uso offline e test: legge un file JSON
+
+    Formato: {"URTH": {"price": 150.2, "currency": "USD", "timestamp": 1700000000}}
+    """
+
+    def __init__(self, path, delay=0.0):
+        self.path = path
+        self.delay = delay
+
+    async def fetch_many(self, tickers):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        return {
+            ticker: Quote(
+                ticker,
+                float(data[ticker]["price"]),
+                data[ticker].get("currency", ""),
+                float(data[ticker].get("timestamp", time.time()))
+            )
+            for ticker in tickers if ticker in data
+        }
+
+
+class YahooProvider(MarketDataProvider):
+    """Quotazioni da Yahoo Finance, scaricate in parallelo su una sessione HTTP condivisa"""
+
+    URL = "https://query1.finance.yahoo.com/v8/finance/chart/{ticker}?range=1d&interval=1d"
+
+    def __init__(self, max_connections=20, timeout=DEFAULT_TIMEOUT):
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self._session = None
+
+    async def _get_session(self):
+        """Sessione aiohttp con pool di connessioni, creata nel loop del servizio"""
+        if self._session is None:
+            try:
+                import aiohttp
+            except ImportError as e:
+                raise ImportError("Il provider Yahoo richiede aiohttp: pip install aiohttp") from e
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={"User-Agent": "AssetExpl"}
+            )
+        return self._session
+
+    async def _fetch_one(self, session, ticker):
+        async with session.get(self.URL.format(ticker=ticker)) as response:
+            response.raise_for_status()
+            payload = await response.json()
+        meta = payload["chart"]["result"][0]["meta"]
+        return Quote(
+            ticker,
+            float(meta["regularMarketPrice"]),
+            meta.get("currency", ""),
+            float(meta.get("regularMarketTime", time.time()))
+        )
+
+    async def fetch_many(self, tickers):
+        session = await self._get_session()
+        results = await asyncio.gather(
+            *(self._fetch_one(session, ticker) for ticker in tickers),
+            return_exceptions=True
+        )
+        return {
+            quote.ticker: quote for quote in results if isinstance(quote, Quote)
+        }
+
+
+# ============================================================================
+# SERVIZIO CON CACHE CONDIVISA
+# ============================================================================
+
+class MarketDataService:
+    """Cache TTL delle quotazioni condivisa tra le sessioni.
+
+    Le sessioni Streamlit girano in thread diversi: le richieste vengono
+    eseguite su un unico event loop in background, dove i ticker già in
+    corso di download sono condivisi (single flight) invece di essere
+    richiesti di nuovo al provider.
+    """
+
+    def __init__(self, provider, ttl=DEFAULT_TTL):
+        self.provider = provider
+        self.ttl = ttl
+        self.upstream_requests = 0
+        self._cache = {}
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._loop = None
+
+    def _get_loop(self):
+        """Avvia al primo utilizzo il thread con l'event loop del servizio"""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever, name="market-data", daemon=True
+                ).start()
+            return self._loop
+
+    def _cached(self, tickers):
+        """Quotazioni ancora valide in cache (None per i ticker sconosciuti al provider)"""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                ticker: entry[1] for ticker, entry in (
+                    (ticker, self._cache.get(ticker)) for ticker in tickers
+                )
+                if entry is not None and entry[0] > now
+            }
+
+    async def _fetch(self, tickers):
+        """Scarica i ticker mancanti, riusando i download già in corso"""
+        loop = asyncio.get_running_loop()
+        waiting = {t: self._inflight[t] for t in tickers if t in self._inflight}
+        missing = [t for t in tickers if t not in waiting]
+
+        if missing:
+            futures = {t: loop.create_future() for t in missing}
+            self._inflight.update(futures)
+            self.upstream_requests += 1
+            try:
+                quotes = await self.provider.fetch_many(missing)
+                expires = time.monotonic() + self.ttl
+                with self._lock:
+                    # Anche i ticker assenti vengono memorizzati, per non
+                    # richiederli di nuovo al provider a ogni rerun
+                    for ticker in missing:
+                        self._cache[ticker] = (expires, quotes.get(ticker))
+                for ticker, future in futures.items():
+                    future.set_result(quotes.get(ticker))
+            except Exception as e:
+                for future in futures.values():
+                    future.set_exception(e)
+                    # Segna l'eccezione come letta: viene rilanciata qui sotto
+                    future.exception()
+                raise
+            finally:
+                for ticker in missing:
+                    self._inflight.pop(ticker, None)
+            waiting.update(futures)
+
+        return {ticker: await future for ticker, future in waiting.items()}
+
+    def get_quotes(self, tickers, timeout=DEFAULT_TIMEOUT):
+        """Restituisce {ticker: Quote}, interrogando il provider solo per i dati scaduti"""
+        tickers = list(dict.fromkeys(tickers))
+        quotes = self._cached(tickers)
+        missing = [ticker for ticker in tickers if ticker not in quotes]
+        if missing:
+            future = asyncio.run_coroutine_threadsafe(self._fetch(missing), self._get_loop())
+            quotes.update(future.result(timeout))
+        return {ticker: quote for ticker, quote in quotes.items() if quote is not None}
+
+    def get_quote(self, ticker, timeout=DEFAULT_TIMEOUT):
+        """Restituisce la quotazione di un ticker, o None se non disponibile"""
+        return self.get_quotes([ticker], timeout).get(ticker)
+
+
+def service_from_env():
+    """Crea il servizio configurato da ASSETEXPL_MARKET_DATA, o None se assente"""
+    setting = os.environ.get("ASSETEXPL_MARKET_DATA", "")
+    if setting == "yahoo":
+        return MarketDataService(YahooProvider())
+    if setting.startswith("file:"):
+        return MarketDataService(FileProvider(setting[len("file:"):]))
+    return None
+
+
+# Istanza unica per processo, condivisa da tutte le sessioni
+MARKET_DATA = service_from_env()
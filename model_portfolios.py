@@ -0,0 +1,225 @@
+"""
+AssetExpl - Model portfolios
+Structured records for the "Combinazioni Efficaci" bullets of every strategy
+text, linked to the index ids of the catalog, and a batch backtest that
+evaluates all of them with one product over a shared monthly return matrix.
+The backtest runs in the background at startup and again, on the next
+request, whenever the price series change.
+"""
+
+import re
+import threading
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from composition_store import COMPOSITION_STORE
+from locales import DEFAULT_LANGUAGE, load_locale
+from pac import monthly_matrix
+from prices import PRICE_STORE
+from risk_metrics import RISK_FREE_RATE
+
+# Nomi usati nei testi per gli indici del catalogo
+INDEX_ALIASES = {
+    "msci world": "msci_world",
+    "s&p 500": "sp500",
+    "msci em": "msci_em",
+    "emerging markets": "msci_em",
+    "msci acwi": "msci_acwi",
+    "ftse all-world": "ftse_all_world",
+    "msci europe": "msci_europe",
+    "msci emu": "msci_emu",
+}
+
+# Asset class assenti dal catalogo approssimate con un indice disponibile
+PROXY_ALIASES = {
+    "msci usa": "sp500",
+    "obbligazioni": "solactive_str",
+    "obbligazioni globali": "solactive_str",
+    "bonds": "solactive_str",
+    "bonds eur": "solactive_str",
+    "global bonds": "solactive_str",
+    "eur bonds": "solactive_str",
+}
+
+_BULLET = re.compile(r"^\s*- \*\*(.+?)\*\*:\s*(.+?)\s*$")
+_COMPONENT = re.compile(r"([^+()]+?)\s*\((\d+(?:\.\d+)?)%\)")
+
+
+class Component(NamedTuple):
+    """Componente di un portafoglio modello"""
+    label: str
+    weight: float
+    index_id: Optional[str]  # None se l'asset class non è nel catalogo
+    proxy: bool
+
+
+class ModelPortfolio(NamedTuple):
+    """Portafoglio modello proposto nella strategia di un indice"""
+    portfolio_id: str
+    source_index: str
+    title: str
+    description: str
+    components: tuple
+
+    @property
+    def allocation(self):
+        """Pesi per indice del catalogo, o None se una componente non è collegata"""
+        if any(c.index_id is None for c in self.components):
+            return None
+        allocation = {}
+        for component in self.components:
+            allocation[component.index_id] = allocation.get(component.index_id, 0.0) + component.weight
+        return allocation
+
+
+def parse_combinations(markdown):
+    """Estrae (titolo, descrizione, componenti) dai punti della sezione ⚖️ di un testo"""
+    combinations = []
+    in_section = False
+    for line in markdown.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("#"):
+            in_section = "⚖️" in stripped
+            continue
+        match = _BULLET.match(line) if in_section else None
+        if match is None:
+            continue
+        title, description = match.groups()
+        components = []
+        for label, weight in _COMPONENT.findall(title):
+            name = label.strip().lower()
+            index_id = INDEX_ALIASES.get(name) or PROXY_ALIASES.get(name)
+            components.append(Component(
+                label.strip(), float(weight), index_id, name in PROXY_ALIASES
+            ))
+        if components:
+            combinations.append((title, description, tuple(components)))
+    return combinations
+
+
+@lru_cache(maxsize=None)
+def model_portfolios(lang=DEFAULT_LANGUAGE):
+    """Portafogli modello di tutti gli indici, con testi nella lingua richiesta"""
+    content = load_locale(lang)
+    portfolios = []
+    for index_key in COMPOSITION_STORE.index_ids:
+        combinations = parse_combinations(content["indices"][index_key]["strategy"])
+        for position, (title, description, components) in enumerate(combinations, 1):
+            portfolios.append(ModelPortfolio(
+                f"{index_key}_{position}", index_key, title, description, components
+            ))
+    return tuple(portfolios)
+
+
+def resolved_allocations(lang=DEFAULT_LANGUAGE):
+    """{id: pesi per indice} dei portafogli interamente collegati al catalogo"""
+    return {
+        portfolio.portfolio_id: portfolio.allocation
+        for portfolio in model_portfolios(lang)
+        if portfolio.allocation is not None
+    }
+
+
+# ============================================================================
+# BACKTEST IN LOTTO
+# ============================================================================
+
+def backtest(allocations, store=PRICE_STORE, risk_free_rate=RISK_FREE_RATE):
+    """Metriche di tutti i portafogli (mix costante ribilanciato ogni mese).
+
+    I rendimenti mensili dei portafogli sono un unico prodotto tra la matrice
+    dei pesi (portafogli x indici) e quella condivisa dei rendimenti (indici x
+    mesi), sui mesi in cui tutti gli indici coinvolti hanno un prezzo.
+    """
+    available = set(store.available())
+    allocations = {
+        portfolio_id: allocation for portfolio_id, allocation in allocations.items()
+        if set(allocation) <= available
+    }
+    if not allocations:
+        return {}
+
+    index_keys = sorted({key for allocation in allocations.values() for key in allocation})
+    months, prices = monthly_matrix(index_keys, store)
+    common = np.all(np.isfinite(prices), axis=0)
+    months, prices = months[common], prices[:, common]
+    if prices.shape[1] < 13:
+        return {}
+    returns = prices[:, 1:] / prices[:, :-1] - 1
+
+    column = {key: position for position, key in enumerate(index_keys)}
+    weights = np.zeros((len(allocations), len(index_keys)))
+    for row, allocation in enumerate(allocations.values()):
+        for key, weight in allocation.items():
+            weights[row, column[key]] = weight
+    weights /= weights.sum(axis=1, keepdims=True)
+
+    monthly = weights @ returns
+    wealth = np.cumprod(1 + monthly, axis=1)
+    years = monthly.shape[1] / 12
+    volatility = monthly.std(axis=1, ddof=1) * np.sqrt(12)
+    cagr = wealth[:, -1] ** (1 / years) - 1
+    drawdown = (wealth / np.maximum.accumulate(wealth, axis=1) - 1).min(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sharpe = (monthly.mean(axis=1) * 12 - risk_free_rate) / volatility
+
+    return {
+        portfolio_id: {
+            "cagr": float(cagr[row]),
+            "volatility": float(volatility[row]),
+            "max_drawdown": float(drawdown[row]),
+            "sharpe": float(sharpe[row]),
+            "start": months[0],
+            "end": months[-1],
+        }
+        for row, portfolio_id in enumerate(allocations)
+    }
+
+
+class _BacktestRun:
+    """Un calcolo del backtest, legato alla versione delle serie storiche da
+    cui parte: ogni calcolo scrive solo nel proprio oggetto"""
+
+    def __init__(self, fingerprint):
+        self.fingerprint = fingerprint
+        self.results = None
+        self.ready = threading.Event()
+
+    def run(self):
+        try:
+            self.results = backtest(resolved_allocations())
+        finally:
+            self.ready.set()
+
+
+_run = None
+_run_lock = threading.Lock()
+
+
+def precompute():
+    """Avvia il backtest in un thread in background, se non è già stato
+    avviato per la versione corrente delle serie storiche"""
+    global _run
+    fingerprint = PRICE_STORE.fingerprint()
+    with _run_lock:
+        if _run is None or _run.fingerprint != fingerprint:
+            _run = _BacktestRun(fingerprint)
+            threading.Thread(target=_run.run, name="model-portfolios", daemon=True).start()
+        return _run
+
+
+def get_model_backtest(timeout=None):
+    """Risultati del backtest {id: metriche}, attendendo il calcolo se in corso;
+    dopo l'import di nuove serie storiche il calcolo riparte da solo"""
+    run = precompute()
+    run.ready.wait(timeout)
+    return run.results or {}
+
+
+def reset_model_backtest():
+    """Scarta i risultati: la prossima richiesta ricalcola il backtest"""
+    global _run
+    with _run_lock:
+        _run = None
@@ -0,0 +1,176 @@
+"""
+AssetExpl - Monte Carlo projections
+Simulates 100k+ monthly wealth paths per index, either parametric (normal log
+returns) or by block bootstrap of historical monthly returns, in batches.
+Percentiles are streamed through per-step histograms, so memory does not grow
+with the number of paths; large runs can be spread over a process pool.
+"""
+
+import re
+
+import numpy as np
+
+from disk_cache import DISK_CACHE
+from prices import PRICE_STORE, SIMULATION_PARAMS, month_end
+from process_pool import cpu_count, pool_map
+
+PERCENTILES = (5, 25, 50, 75, 95)
+DEFAULT_PATHS = 100_000
+BATCH_PATHS = 10_000
+BOOTSTRAP_BLOCK_MONTHS = 12
+HISTOGRAM_BINS = 1024
+# Ampiezza dell'istogramma di ogni passo, in deviazioni standard cumulative
+HISTOGRAM_SIGMAS = 10.0
+# Oltre questo numero di percorsi, e con più di una CPU, i batch vengono
+# distribuiti sul pool di processi condiviso
+POOL_THRESHOLD = 500_000
+DEFAULT_SEED = 42
+
+
+# ============================================================================
+# PARAMETRI
+# ============================================================================
+
+def horizon_years(time_horizon, default=1):
+    """Anni di proiezione dal testo del profilo di rischio ("7-10+ anni" -> 10)"""
+    numbers = [int(n) for n in re.findall(r"\d+", time_horizon)]
+    return max(numbers) if numbers else default
+
+
+def monthly_log_returns(dates, close):
+    """Rendimenti logaritmici mensili, dall'ultimo prezzo di ogni mese"""
+    return np.diff(np.log(month_end(dates, close)[1]))
+
+
+def model_params(index_key):
+    """Media e deviazione standard dei rendimenti log mensili, dai prezzi se disponibili"""
+    if index_key in PRICE_STORE.available():
+        returns = monthly_log_returns(*PRICE_STORE.get(index_key))
+        if len(returns) >= 2 * BOOTSTRAP_BLOCK_MONTHS:
+            return returns.mean(), returns.std(ddof=1), returns
+    annual_return, annual_vol = SIMULATION_PARAMS.get(index_key, (0.07, 0.16))
+    return np.log1p(annual_return) / 12, annual_vol / np.sqrt(12), None
+
+
+# ============================================================================
+# SIMULAZIONE
+# ============================================================================
+
+def parametric_paths(rng, n_paths, steps, mu, sigma):
+    """Ricchezza log cumulativa (percorsi x mesi) con rendimenti normali"""
+    return np.cumsum(rng.normal(mu, sigma, (n_paths, steps)), axis=1)
+
+
+def bootstrap_paths(rng, n_paths, steps, history, block=BOOTSTRAP_BLOCK_MONTHS):
+    """Ricchezza log cumulativa ricampionando blocchi consecutivi di mesi storici"""
+    n_blocks = -(-steps // block)
+    starts = rng.integers(0, len(history) - block + 1, (n_paths, n_blocks))
+    offsets = (starts[:, :, None] + np.arange(block)).reshape(n_paths, -1)[:, :steps]
+    return np.cumsum(history[offsets], axis=1)
+
+
+def _histogram(log_wealth, lo, width, bins):
+    """Conteggi per passo e bin di un batch di percorsi, con np.bincount"""
+    steps = log_wealth.shape[1]
+    index = ((log_wealth - lo) / width).astype(np.int64)
+    np.clip(index, 0, bins - 1, out=index)
+    index += np.arange(steps) * bins
+    return np.bincount(index.ravel(), minlength=steps * bins).reshape(steps, bins)
+
+
+class StreamingPercentiles:
+    """Istogramma per passo temporale della ricchezza log: i percentili si
+    aggiornano batch dopo batch senza conservare i percorsi"""
+
+    def __init__(self, steps, mu, sigma, bins=HISTOGRAM_BINS):
+        t = np.arange(1, steps + 1)
+        half_width = HISTOGRAM_SIGMAS * sigma * np.sqrt(t) + 1e-9
+        self.lo = mu * t - half_width
+        self.width = 2 * half_width / bins
+        self.bins = bins
+        self.steps = steps
+        self.counts = np.zeros((steps, bins), dtype=np.int64)
+        self.n_paths = 0
+
+    def add_counts(self, counts, n_paths):
+        self.counts += counts
+        self.n_paths += n_paths
+
+    def percentiles(self, percentiles=PERCENTILES):
+        """Multipli della ricchezza iniziale per percentile (righe) e mese (colonne)"""
+        cumulative = np.cumsum(self.counts, axis=1)
+        result = np.empty((len(percentiles), self.steps + 1))
+        result[:, 0] = 1.0
+        for row, p in enumerate(percentiles):
+            target = p / 100 * self.n_paths
+            bin_index = np.argmax(cumulative >= target, axis=1)
+            steps = np.arange(self.steps)
+            below = np.where(bin_index > 0, cumulative[steps, bin_index - 1], 0)
+            inside = np.maximum(self.counts[steps, bin_index], 1)
+            fraction = np.clip((target - below) / inside, 0, 1)
+            result[row, 1:] = np.exp(self.lo + (bin_index + fraction) * self.width)
+        return result
+
+
+def _simulate_batch(args):
+    """Simula un batch e ne restituisce solo l'istogramma (eseguibile in un altro processo)"""
+    seed, n_paths, steps, mu, sigma, history, lo, width, bins = args
+    rng = np.random.default_rng(seed)
+    if history is None:
+        log_wealth = parametric_paths(rng, n_paths, steps, mu, sigma)
+    else:
+        log_wealth = bootstrap_paths(rng, n_paths, steps, history)
+    return _histogram(log_wealth, lo, width, bins), n_paths
+
+
+def iter_projection(index_key, years, n_paths=DEFAULT_PATHS, method="parametric",
+                    workers=None, seed=DEFAULT_SEED, batch_paths=BATCH_PATHS):
+    """Esegue la proiezione a batch e restituisce (percorsi simulati, percentili)
+    dopo ogni batch completato.
+
+    `method` è "parametric" o "bootstrap" (richiede la serie storica).
+    `workers` None sceglie il pool di processi condiviso solo oltre
+    POOL_THRESHOLD percorsi e con più di una CPU; 1 simula tutto nel processo.
+    """
+    mu, sigma, history = model_params(index_key)
+    if method == "bootstrap":
+        if history is None:
+            raise ValueError(f"Nessuna serie storica per il bootstrap di {index_key!r}")
+    else:
+        history = None
+
+    steps = int(round(years * 12))
+    stream = StreamingPercentiles(steps, mu, sigma)
+    sizes = [min(batch_paths, n_paths - start) for start in range(0, n_paths, batch_paths)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [
+        (s, size, steps, mu, sigma, history, stream.lo, stream.width, stream.bins)
+        for s, size in zip(seeds, sizes)
+    ]
+
+    if workers is None:
+        workers = cpu_count() if n_paths > POOL_THRESHOLD else 1
+
+    batches = pool_map(_simulate_batch, tasks) if workers > 1 else map(_simulate_batch, tasks)
+    for counts, size in batches:
+        stream.add_counts(counts, size)
+        yield stream.n_paths, stream.percentiles()
+
+
+def project(index_key, years, n_paths=DEFAULT_PATHS, method="parametric",
+            workers=None, seed=DEFAULT_SEED, batch_paths=BATCH_PATHS, cache=DISK_CACHE):
+    """Percentili finali della proiezione (vedi iter_projection).
+
+    Il risultato dipende solo dai parametri e dalla serie storica dell'indice
+    (non da `workers`), quindi viene condiviso su disco tra i processi.
+    """
+    def compute():
+        result = None
+        for _, result in iter_projection(
+            index_key, years, n_paths, method, workers, seed, batch_paths
+        ):
+            pass
+        return result
+
+    key = ("monte_carlo.project", index_key, years, n_paths, method, seed, batch_paths)
+    return cache.get_or_compute(key, PRICE_STORE.fingerprint([index_key]), compute)
@@ -0,0 +1,284 @@
+"""
+AssetExpl - Portfolio optimizer
+Long-only mean-variance efficient frontier and risk-parity weights over the
+index catalog. The covariance matrix is kept as running sums, so new monthly
+returns update it in O(k p^2), and its correlations are shrunk towards zero
+with the Ledoit-Wolf intensity, keeping each index's own variance. Frontier
+points are solved by accelerated projected gradient, each warm-started from
+its neighbour, and cached for every session until the price series change;
+the new results then start from the previous weights.
+"""
+
+import threading
+
+import numpy as np
+
+from pac import monthly_matrix
+from prices import PRICE_STORE
+
+FRONTIER_POINTS = 40
+MAX_ITERATIONS = 5000
+TOLERANCE = 1e-10
+
+
+# ============================================================================
+# COVARIANZA
+# ============================================================================
+
+class CovarianceModel:
+    """Media e covarianza dei rendimenti mensili con shrinkage di Ledoit-Wolf.
+
+    Lo shrinkage riduce solo le covarianze, verso la diagonale della matrice
+    campionaria: ogni indice conserva la propria varianza. Lo stato contiene
+    solo somme di prodotti dei rendimenti (fino al quarto ordine), sufficienti
+    sia per la covarianza sia per l'intensità dello shrinkage: aggiungere k
+    mesi costa O(k p^2) senza rileggere lo storico.
+    """
+
+    def __init__(self, index_keys):
+        p = len(index_keys)
+        self.index_keys = tuple(index_keys)
+        self.n = 0
+        self.sum = np.zeros(p)
+        self.cross = np.zeros((p, p))
+        self.square_cross = np.zeros((p, p))   # sum x_i^2 x_j^2
+        self.square_linear = np.zeros((p, p))  # sum x_i^2 x_j
+        self.version = 0
+        self.shrinkage = None
+        self._cached = None
+        self._lock = threading.Lock()
+
+    def update(self, returns):
+        """Aggiunge rendimenti mensili (mesi x indici)"""
+        returns = np.atleast_2d(np.asarray(returns, dtype=np.float64))
+        squares = returns * returns
+        with self._lock:
+            self.n += len(returns)
+            self.sum += returns.sum(axis=0)
+            self.cross += returns.T @ returns
+            self.square_cross += squares.T @ squares
+            self.square_linear += squares.T @ returns
+            self.version += 1
+            self._cached = None
+
+    def mean(self):
+        """Rendimento medio annualizzato"""
+        return 12 * self.sum / self.n
+
+    def covariance(self):
+        """Covarianza annualizzata ristretta verso la propria diagonale.
+
+        L'intensità è quella di Ledoit-Wolf (2004) per il bersaglio diagonale:
+        varianza stimata delle covarianze campionarie divisa per la loro somma
+        dei quadrati, sui soli elementi fuori diagonale. Le varianze restano
+        quelle campionarie: un bersaglio come trace/p * I porterebbe la
+        volatilità degli indici meno rischiosi verso quella media.
+        """
+        with self._lock:
+            if self._cached is not None:
+                return self._cached
+            n = self.n
+            m = self.sum / n
+            sample = self.cross / n - np.outer(m, m)
+
+            # sum_t (x_ti - m_i)^2 (x_tj - m_j)^2 ricavata dalle somme,
+            # sviluppando (x - m)^2 = x^2 - 2 m x + m^2 per i e per j
+            m_sq = m * m
+            linear = self.square_linear * m[None, :]
+            squares = np.diag(self.cross)
+            fourth = (
+                self.square_cross
+                - 2 * (linear + linear.T)
+                + np.outer(squares, m_sq) + np.outer(m_sq, squares)
+                + 4 * np.outer(m, m) * self.cross
+                - 2 * (np.outer(m * self.sum, m_sq) + np.outer(m_sq, m * self.sum))
+                + n * np.outer(m_sq, m_sq)
+            )
+            off_diagonal = ~np.eye(len(m), dtype=bool)
+            distance = np.sum(sample[off_diagonal] ** 2)
+            spread = max(np.sum(fourth[off_diagonal]) / n - distance, 0.0) / n
+            shrinkage = min(spread, distance) / distance if distance > 0 else 1.0
+
+            self.shrinkage = shrinkage
+            self._cached = 12 * np.where(off_diagonal, (1 - shrinkage) * sample, sample)
+            self._cached.setflags(write=False)
+            return self._cached
+
+    @classmethod
+    def from_store(cls, store=PRICE_STORE):
+        """Modello dai rendimenti mensili comuni a tutti gli indici con serie storica"""
+        index_keys = store.available()
+        if not index_keys:
+            return None
+        _, prices = monthly_matrix(index_keys, store)
+        prices = prices[:, np.all(np.isfinite(prices), axis=0)]
+        if prices.shape[1] < 13:
+            return None
+        model = cls(index_keys)
+        model.update((prices[:, 1:] / prices[:, :-1] - 1).T)
+        return model
+
+
+# ============================================================================
+# OTTIMIZZAZIONE
+# ============================================================================
+
+def project_simplex(v):
+    """Proiezione euclidea sul simplesso {w >= 0, sum(w) = 1} (righe di una matrice)"""
+    v = np.atleast_2d(v)
+    u = -np.sort(-v, axis=1)
+    cumulative = np.cumsum(u, axis=1) - 1
+    k = np.arange(1, v.shape[1] + 1)
+    rho = np.sum(u - cumulative / k > 0, axis=1)
+    theta = cumulative[np.arange(len(v)), rho - 1] / rho
+    return np.maximum(v - theta[:, None], 0)
+
+
+def mean_variance(cov, mu, trade_off, start=None, lipschitz=None,
+                  max_iterations=MAX_ITERATIONS, tol=TOLERANCE):
+    """Pesi long-only che minimizzano w'Σw/2 - trade_off * mu'w (FISTA).
+
+    `start` è il punto di partenza (warm start): per punti vicini della
+    frontiera bastano poche iterazioni.
+    """
+    p = len(mu)
+    if lipschitz is None:
+        lipschitz = np.linalg.eigvalsh(cov)[-1]
+    step = 1 / lipschitz
+    w = project_simplex(np.full(p, 1 / p) if start is None else start)[0]
+    y, t = w, 1.0
+    for iteration in range(max_iterations):
+        w_next = project_simplex(y - step * (cov @ y - trade_off * mu))[0]
+        t_next = (1 + np.sqrt(1 + 4 * t * t)) / 2
+        y = w_next + (t - 1) / t_next * (w_next - w)
+        if np.sum((w_next - w) ** 2) < tol:
+            return w_next, iteration + 1
+        w, t = w_next, t_next
+    return w, max_iterations
+
+
+def efficient_frontier(cov, mu, points=FRONTIER_POINTS, start=None):
+    """Frontiera efficiente: pesi (punti x indici), rendimenti, volatilità e iterazioni.
+
+    Il coefficiente di avversione al rischio va da 0 (minima varianza) a un
+    valore oltre il quale resta solo l'indice con rendimento atteso massimo;
+    ogni punto parte dalla soluzione del precedente. `start` può contenere i
+    pesi di una frontiera precedente, usati come warm start punto per punto.
+    """
+    lipschitz = np.linalg.eigvalsh(cov)[-1]
+    spread = max(mu.max() - mu.min(), 1e-12)
+    trade_offs = np.concatenate(([0.0], np.geomspace(1e-3, 10, points - 1))) * lipschitz / spread
+    weights = np.empty((points, len(mu)))
+    iterations = 0
+    previous = None
+    for position, trade_off in enumerate(trade_offs):
+        guess = start[position] if start is not None else previous
+        previous, used = mean_variance(cov, mu, trade_off, guess, lipschitz)
+        weights[position] = previous
+        iterations += used
+    returns = weights @ mu
+    volatility = np.sqrt(np.einsum("ij,jk,ik->i", weights, cov, weights))
+    return weights, returns, volatility, iterations
+
+
+def risk_parity(cov, budget=None, start=None, max_sweeps=500, tol=1e-12):
+    """Pesi con contributi al rischio proporzionali a `budget` (uguali di default).
+
+    Discesa coordinata ciclica sulla formulazione convessa di Spinu:
+    min y'Σy/2 - sum(b log y), con w = y / sum(y).
+    """
+    p = cov.shape[0]
+    budget = np.full(p, 1 / p) if budget is None else np.asarray(budget) / np.sum(budget)
+    y = 1 / np.sqrt(np.diag(cov)) if start is None else np.array(start, dtype=np.float64)
+    diagonal = np.diag(cov)
+    for _ in range(max_sweeps):
+        previous = y.copy()
+        for i in range(p):
+            c = cov[i] @ y - diagonal[i] * y[i]
+            y[i] = (-c + np.sqrt(c * c + 4 * diagonal[i] * budget[i])) / (2 * diagonal[i])
+        if np.sum((y - previous) ** 2) < tol * np.sum(y ** 2):
+            break
+    return y / y.sum()
+
+
+def risk_contributions(weights, cov):
+    """Quota del rischio totale dovuta a ogni indice"""
+    marginal = cov @ weights
+    return weights * marginal / (weights @ marginal)
+
+
+# ============================================================================
+# RISULTATI CONDIVISI
+# ============================================================================
+
+class Optimizer:
+    """Frontiera e risk parity condivise tra le sessioni, ricalcolate (con warm
+    start dai risultati precedenti) solo quando la covarianza cambia"""
+
+    def __init__(self, model, previous=None):
+        self.model = model
+        self._lock = threading.Lock()
+        self._version = None
+        # Risultato di un modello precedente: solo punto di partenza
+        self._result = previous
+
+    def result(self):
+        """Frontiera e risk parity per la covarianza corrente"""
+        with self._lock:
+            if self._version == self.model.version:
+                return self._result
+            cov = self.model.covariance()
+            mu = self.model.mean()
+            previous = self._result
+            if previous is not None and previous["index_keys"] != self.model.index_keys:
+                previous = None
+            weights, returns, volatility, iterations = efficient_frontier(
+                cov, mu, start=previous["frontier_weights"] if previous else None
+            )
+            parity = risk_parity(
+                cov, start=previous["risk_parity"] if previous else None
+            )
+            self._result = {
+                "index_keys": self.model.index_keys,
+                "mu": mu,
+                "volatility": np.sqrt(np.diag(cov)),
+                "frontier_weights": weights,
+                "frontier_returns": returns,
+                "frontier_volatility": volatility,
+                "iterations": iterations,
+                "risk_parity": parity,
+                "risk_parity_return": float(parity @ mu),
+                "risk_parity_volatility": float(np.sqrt(parity @ cov @ parity)),
+            }
+            for value in self._result.values():
+                if isinstance(value, np.ndarray):
+                    value.setflags(write=False)
+            self._version = self.model.version
+            return self._result
+
+    def last_result(self):
+        """Ultimo risultato calcolato (anche per una covarianza precedente), o None"""
+        with self._lock:
+            return self._result
+
+
+_optimizer = None
+_optimizer_fingerprint = None
+_optimizer_lock = threading.Lock()
+
+
+def get_optimizer():
+    """Ottimizzatore condiviso dal processo, allineato alle serie dello store dei prezzi.
+
+    Quando l'impronta delle serie cambia la covarianza viene ricreata dallo
+    store, e frontiera e risk parity ripartono dai pesi precedenti.
+    """
+    global _optimizer, _optimizer_fingerprint
+    fingerprint = PRICE_STORE.fingerprint()
+    with _optimizer_lock:
+        if fingerprint != _optimizer_fingerprint:
+            model = CovarianceModel.from_store()
+            previous = _optimizer.last_result() if _optimizer is not None else None
+            _optimizer = Optimizer(model, previous) if model is not None else None
+            _optimizer_fingerprint = fingerprint
+        return _optimizer
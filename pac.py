@@ -0,0 +1,120 @@
+"""
+AssetExpl - PAC backtester
+Monthly contribution plans (PAC / dollar-cost averaging) evaluated for every
+possible start month of every index at once: cumulative sums of units bought
+replace a loop over start dates, and the IRR of all plans is solved together.
+"""
+
+import numpy as np
+
+from prices import PRICE_STORE, month_end
+
+DEFAULT_CONTRIBUTION = 100.0
+DEFAULT_YEARS = 10
+PERCENTILES = (5, 50, 95)
+
+
+def monthly_matrix(index_keys, store=PRICE_STORE):
+    """Prezzi di fine mese allineati per calendario: (mesi, matrice indici x mesi con NaN)"""
+    series = [month_end(*store.get(key)) for key in index_keys]
+    first = min(months[0] for months, _ in series)
+    last = max(months[-1] for months, _ in series)
+    months = np.arange(first, last + 1)
+    prices = np.full((len(series), len(months)), np.nan)
+    for row, (index_months, close) in enumerate(series):
+        prices[row, (index_months - first).astype(np.int64)] = close
+    return months, prices
+
+
+def annuity_irr(multiple, n_months, iterations=64):
+    """Tasso mensile r tale che n versamenti unitari a inizio mese valgano `multiple`
+    all'ultimo versamento: sum((1 + r) ** k, k < n) = multiple (bisezione vettoriale)"""
+    lo = np.full(np.shape(multiple), -0.5)
+    hi = np.full(np.shape(multiple), 0.5)
+    for _ in range(iterations):
+        mid = (lo + hi) / 2
+        growth = (1 + mid) ** n_months
+        with np.errstate(divide="ignore", invalid="ignore"):
+            factor = np.where(np.abs(mid) < 1e-12, n_months, (growth - 1) / mid)
+        too_high = factor > multiple
+        hi = np.where(too_high, mid, hi)
+        lo = np.where(too_high, lo, mid)
+    return (lo + hi) / 2
+
+
+def backtest(prices, n_months, contribution=DEFAULT_CONTRIBUTION):
+    """Valore finale e IRR annuo di un PAC di `n_months` rate per ogni mese di partenza.
+
+    `prices` è una matrice indici x mesi (NaN dove manca il prezzo). La colonna
+    s dei risultati è il piano che versa dal mese s al mese s + n_months - 1 e
+    viene valutato all'ultimo versamento; i piani con mesi mancanti sono NaN.
+    """
+    prices = np.atleast_2d(np.asarray(prices, dtype=np.float64))
+    n_starts = prices.shape[1] - n_months + 1
+    if n_starts < 1:
+        empty = np.empty((prices.shape[0], 0))
+        return {"final_value": empty, "irr": empty, "invested": contribution * n_months}
+
+    valid = np.isfinite(prices)
+    # Quote cumulative acquistate con un versamento unitario al mese
+    units = np.zeros((prices.shape[0], prices.shape[1] + 1))
+    np.cumsum(np.where(valid, 1 / np.where(valid, prices, 1), 0), axis=1, out=units[:, 1:])
+    counts = np.zeros_like(units)
+    np.cumsum(valid, axis=1, out=counts[:, 1:])
+
+    window_units = units[:, n_months:] - units[:, :n_starts]
+    complete = (counts[:, n_months:] - counts[:, :n_starts]) == n_months
+    final_value = np.where(
+        complete, contribution * window_units * prices[:, n_months - 1:], np.nan
+    )
+
+    multiple = final_value / contribution
+    monthly = annuity_irr(np.where(complete, multiple, n_months), n_months)
+    return {
+        "final_value": final_value,
+        "irr": np.where(complete, (1 + monthly) ** 12 - 1, np.nan),
+        "invested": contribution * n_months,
+    }
+
+
+def summarize(result, start_months):
+    """Distribuzione dei risultati di un indice (una riga di `backtest`)"""
+    final_value, irr = result["final_value"], result["irr"]
+    valid = np.isfinite(final_value)
+    if not valid.any():
+        return None
+    final_value, irr, start_months = final_value[valid], irr[valid], start_months[valid]
+    worst = int(np.argmin(final_value))
+    return {
+        "plans": int(valid.sum()),
+        "invested": result["invested"],
+        "final_percentiles": {
+            p: float(v) for p, v in zip(PERCENTILES, np.percentile(final_value, PERCENTILES))
+        },
+        "median_irr": float(np.median(irr)),
+        "worst_value": float(final_value[worst]),
+        "worst_irr": float(irr[worst]),
+        "worst_start": start_months[worst],
+        "loss_share": float(np.mean(final_value < result["invested"])),
+        "start_months": start_months,
+        "final_value": final_value,
+    }
+
+
+def backtest_all(years=DEFAULT_YEARS, contribution=DEFAULT_CONTRIBUTION, store=PRICE_STORE):
+    """Backtest PAC di tutti gli indici con serie storica: {indice: riepilogo o None}"""
+    index_keys = store.available()
+    if not index_keys:
+        return {}
+    months, prices = monthly_matrix(index_keys, store)
+    n_months = int(years * 12)
+    result = backtest(prices, n_months, contribution)
+    start_months = months[:result["final_value"].shape[1]]
+    return {
+        key: summarize(
+            {"final_value": result["final_value"][row], "irr": result["irr"][row],
+             "invested": result["invested"]},
+            start_months
+        )
+        for row, key in enumerate(index_keys)
+    }
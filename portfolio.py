@@ -0,0 +1,46 @@
+"""
+AssetExpl - Portfolio look-through
+Combined country and sector exposure of index blends, computed as a
+weights x composition-matrix product (one portfolio or thousands at once)
+"""
+
+import numpy as np
+
+from composition_store import COMPOSITION_STORE
+
+
+def allocation_vector(allocation):
+    """Converte {indice: peso} nel vettore dei pesi allineato alle righe dello store"""
+    vector = np.zeros(len(COMPOSITION_STORE.index_ids))
+    for index_key, weight in allocation.items():
+        vector[COMPOSITION_STORE.position(index_key)] = weight
+    return vector
+
+
+def normalize_weights(weights):
+    """Riporta ogni portafoglio (riga) a pesi che sommano a 1"""
+    weights = np.asarray(weights, dtype=np.float64)
+    if np.any(weights < 0):
+        raise ValueError("I pesi del portafoglio non possono essere negativi")
+    totals = weights.sum(axis=-1, keepdims=True)
+    if np.any(totals == 0):
+        raise ValueError("Ogni portafoglio deve avere almeno un peso positivo")
+    return weights / totals
+
+
+def look_through(weights, dimension):
+    """Esposizione percentuale per categoria di uno o più portafogli.
+
+    `weights` ha forma (indici,) per un portafoglio o (portafogli, indici)
+    per un lotto: il risultato ha forma (categorie,) o (portafogli, categorie)
+    ed è ottenuto con un unico prodotto matriciale.
+    """
+    return normalize_weights(weights) @ COMPOSITION_STORE.matrix(dimension)
+
+
+def exposure_breakdown(allocation, dimension, lang):
+    """Restituisce (etichette, pesi) delle categorie con esposizione non nulla"""
+    exposure = look_through(allocation_vector(allocation), dimension)
+    codes = np.flatnonzero(exposure)
+    codes = codes[np.argsort(exposure[codes], kind="stable")[::-1]]
+    return COMPOSITION_STORE.labels(lang, dimension)[codes], exposure[codes]
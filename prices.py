@@ -0,0 +1,314 @@
+"""
+AssetExpl - Price history store
+Daily price series per index, stored as memory-mapped .npy columns, with
+LTTB downsampling to a pixel-sized point budget before plotting.
+
+Usage:
+    python prices.py ingest <index_id> <prices.csv|.parquet>
+    python prices.py simulate [--years 50] [--seed 42]
+"""
+
+import argparse
+import csv
+import os
+import shutil
+import sys
+import threading
+import time
+
+import numpy as np
+
+from composition_store import COMPOSITION_STORE
+from disk_cache import directory_digest, file_signature
+
+PRICES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "prices")
+# Nome della versione corrente di una serie, sostituito atomicamente a ogni scrittura
+CURRENT_FILE = "current"
+# Una versione letta dal puntatore sparisce solo se nel frattempo arrivano
+# altre scritture: qualche nuovo tentativo basta a trovarne una completa
+OPEN_ATTEMPTS = 3
+
+# Punti per grafico: circa uno per pixel orizzontale di un grafico a tutta larghezza
+DEFAULT_POINT_BUDGET = 1000
+
+# Rendimento e volatilità annui (centro degli intervalli del profilo di rischio)
+# usati per generare serie simulate a scopo didattico e come parametri delle
+# proiezioni Monte Carlo degli indici senza serie storica
+SIMULATION_PARAMS = {
+    "msci_world": (0.080, 0.175),
+    "sp500": (0.100, 0.165),
+    "msci_em": (0.100, 0.225),
+    "msci_acwi": (0.085, 0.185),
+    "ftse_all_world": (0.085, 0.190),
+    "solactive_str": (0.032, 0.003),
+    "msci_europe": (0.070, 0.165),
+    "msci_emu": (0.065, 0.175),
+}
+
+TRADING_DAYS = 252
+
+
+# ============================================================================
+# DOWNSAMPLING
+# ============================================================================
+
+def lttb(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: restituisce gli indici dei punti da tenere.
+
+    Conserva primo e ultimo punto e, per ogni bucket intermedio, il punto che
+    forma il triangolo più ampio con il punto scelto prima e la media del
+    bucket successivo: picchi e minimi restano visibili anche con pochi punti.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x = x[edges[i + 1]:edges[i + 2]].mean()
+            next_y = y[edges[i + 1]:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        area = np.abs(
+            (x[a] - next_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (next_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def downsample(dates, values, point_budget=DEFAULT_POINT_BUDGET):
+    """Riduce una serie a `point_budget` punti per il grafico"""
+    keep = lttb(dates.astype("datetime64[D]").astype(np.int64), values, point_budget)
+    return dates[keep], values[keep]
+
+
+def month_end(dates, values):
+    """Ultimo valore di ogni mese: (mesi come datetime64[M], valori)"""
+    months = np.asarray(dates, dtype="datetime64[M]")
+    last_of_month = np.flatnonzero(np.append(months[1:] != months[:-1], True))
+    return months[last_of_month], np.asarray(values)[last_of_month]
+
+
+# ============================================================================
+# STORE
+# ============================================================================
+
+def _remove_old_versions(directory, oldest):
+    """Elimina le versioni precedenti a `oldest` e i file del formato senza
+    versioni (date e prezzi direttamente nella cartella dell'indice)"""
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        if name.startswith("v") and name < oldest and os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+    for name in ("dates.npy", "close.npy"):
+        try:
+            os.remove(os.path.join(directory, name))
+        except FileNotFoundError:
+            pass
+
+
+class PriceStore:
+    """Serie storiche per indice, aperte in memory-mapping una volta per versione.
+
+    Ogni scrittura salva date e prezzi in una nuova cartella `v<ns>` e la
+    rende corrente sostituendo il file `current` con un solo rename: un
+    lettore vede sempre una coppia completa, mai date nuove con prezzi vecchi.
+    """
+
+    def __init__(self, prices_dir=PRICES_DIR):
+        self.prices_dir = prices_dir
+        self._open = {}
+        self._lock = threading.Lock()
+
+    def available(self):
+        """Indici con una serie storica salvata"""
+        if not os.path.isdir(self.prices_dir):
+            return []
+        return sorted(
+            name for name in os.listdir(self.prices_dir)
+            if os.path.exists(os.path.join(self.prices_dir, name, CURRENT_FILE))
+            or os.path.exists(os.path.join(self.prices_dir, name, "close.npy"))
+        )
+
+    def _current(self, index_key):
+        """(cartella della versione corrente, firma del file che la indica).
+
+        La firma è quella del puntatore `current` oppure, per le serie salvate
+        senza versioni, di close.npy (scritto per ultimo).
+        """
+        directory = os.path.join(self.prices_dir, index_key)
+        pointer = os.path.join(directory, CURRENT_FILE)
+        signature = file_signature(pointer)
+        if signature is None:
+            return directory, file_signature(os.path.join(directory, "close.npy"))
+        with open(pointer, encoding="utf-8") as f:
+            return os.path.join(directory, f.read().strip()), signature
+
+    def get(self, index_key):
+        """Restituisce (date, prezzi) dell'indice come array in sola lettura.
+
+        Gli array restano aperti finché la versione corrente non cambia: una
+        nuova importazione, anche da un altro processo, è visibile dalla
+        chiamata successiva, come le impronte di `fingerprint`.
+        """
+        with self._lock:
+            for attempt in range(OPEN_ATTEMPTS):
+                directory, signature = self._current(index_key)
+                cached = self._open.get(index_key)
+                if cached is not None and cached[0] == signature:
+                    return cached[1]
+                try:
+                    series = (
+                        np.load(os.path.join(directory, "dates.npy"), mmap_mode="r"),
+                        np.load(os.path.join(directory, "close.npy"), mmap_mode="r"),
+                    )
+                except FileNotFoundError:
+                    # Versione rimossa da scritture successive alla lettura
+                    # del puntatore: si rilegge quello nuovo
+                    if attempt == OPEN_ATTEMPTS - 1:
+                        raise
+                    continue
+                self._open[index_key] = (signature, series)
+                return series
+
+    def write(self, index_key, dates, close):
+        """Salva l'intera serie dell'indice (le date devono essere crescenti)"""
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        close = np.asarray(close, dtype=np.float64)
+        if dates.shape != close.shape:
+            raise ValueError("Date e prezzi devono avere la stessa lunghezza")
+        if len(dates) > 1 and np.any(np.diff(dates) <= np.timedelta64(0, "D")):
+            raise ValueError("Le date devono essere strettamente crescenti")
+
+        directory = os.path.join(self.prices_dir, index_key)
+        version = f"v{time.time_ns()}"
+        os.makedirs(os.path.join(directory, version))
+        np.save(os.path.join(directory, version, "dates.npy"), dates)
+        np.save(os.path.join(directory, version, "close.npy"), close)
+
+        previous = self._current(index_key)[0]
+        tmp_path = os.path.join(directory, f".{CURRENT_FILE}.{version}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(version)
+        os.replace(tmp_path, os.path.join(directory, CURRENT_FILE))
+        # La versione precedente resta a chi ha appena letto il vecchio puntatore
+        oldest = version if previous == directory else min(version, os.path.basename(previous))
+        _remove_old_versions(directory, oldest)
+        with self._lock:
+            self._open.pop(index_key, None)
+
+    def append(self, index_key, dates, close):
+        """Aggiunge barre successive all'ultima data salvata"""
+        old_dates, old_close = self.get(index_key)
+        dates = np.asarray(dates, dtype="datetime64[D]")
+        if len(old_dates) and len(dates) and dates[0] <= old_dates[-1]:
+            raise ValueError("Le nuove barre devono seguire l'ultima data salvata")
+        self.write(
+            index_key,
+            np.concatenate((old_dates, dates)),
+            np.concatenate((old_close, np.asarray(close, dtype=np.float64)))
+        )
+
+    def window(self, index_key, start=None, end=None):
+        """Restituisce la parte di serie tra `start` ed `end` (estremi inclusi)"""
+        dates, close = self.get(index_key)
+        lo = 0 if start is None else np.searchsorted(dates, np.datetime64(start, "D"), "left")
+        hi = len(dates) if end is None else np.searchsorted(dates, np.datetime64(end, "D"), "right")
+        return dates[lo:hi], close[lo:hi]
+
+    def plot_series(self, index_key, start=None, end=None, point_budget=DEFAULT_POINT_BUDGET):
+        """Serie dell'intervallo visibile, ridotta al budget di punti del grafico.
+
+        Restringendo l'intervallo gli stessi punti coprono meno giorni, quindi
+        lo zoom mostra una risoluzione maggiore solo dove serve.
+        """
+        dates, close = self.window(index_key, start, end)
+        return downsample(dates, close, point_budget)
+
+    def fingerprint(self, index_keys=None):
+        """Impronta del contenuto della versione corrente delle serie indicate
+        (di default tutte le disponibili)"""
+        index_keys = self.available() if index_keys is None else index_keys
+        return tuple((key, directory_digest(self._current(key)[0])) for key in index_keys)
+
+
+PRICE_STORE = PriceStore()
+
+
+# ============================================================================
+# IMPORT E SIMULAZIONE
+# ============================================================================
+
+def read_prices(source_path):
+    """Legge (date, prezzi) da un CSV o Parquet con colonne date, close"""
+    if source_path.endswith(".parquet"):
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("La lettura dei file Parquet richiede pyarrow: pip install pyarrow") from e
+        columns = pq.read_table(source_path, columns=["date", "close"]).to_pydict()
+        dates, close = columns["date"], columns["close"]
+    else:
+        with open(source_path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        dates = [row["date"] for row in rows]
+        close = [float(row["close"]) for row in rows]
+    dates = np.asarray(dates, dtype="datetime64[D]")
+    order = np.argsort(dates, kind="stable")
+    return dates[order], np.asarray(close, dtype=np.float64)[order]
+
+
+def simulate(index_key, years, rng, end=None):
+    """Serie giornaliera simulata (moto browniano geometrico), a scopo didattico"""
+    annual_return, annual_vol = SIMULATION_PARAMS.get(index_key, (0.07, 0.16))
+    end = np.datetime64(end or "today", "D")
+    dates = np.arange(end - np.timedelta64(int(years * 365.25), "D"), end + 1)
+    dates = dates[np.is_busday(dates)]
+    daily_vol = annual_vol / np.sqrt(TRADING_DAYS)
+    log_returns = rng.normal(np.log1p(annual_return) / TRADING_DAYS, daily_vol, len(dates))
+    log_returns[0] = 0.0
+    return dates, 100.0 * np.exp(np.cumsum(log_returns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--prices-dir", default=PRICES_DIR)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    ingest_parser = commands.add_parser("ingest", help="importa una serie da CSV o Parquet")
+    ingest_parser.add_argument("index_id")
+    ingest_parser.add_argument("source", help="file con colonne date, close")
+
+    simulate_parser = commands.add_parser("simulate", help="genera serie simulate per tutti gli indici")
+    simulate_parser.add_argument("--years", type=float, default=50)
+    simulate_parser.add_argument("--seed", type=int, default=42)
+
+    args = parser.parse_args()
+    store = PriceStore(args.prices_dir)
+
+    if args.command == "ingest":
+        dates, close = read_prices(args.source)
+        store.write(args.index_id, dates, close)
+        print(f"{args.index_id}: {len(dates)} prezzi importati")
+    else:
+        rng = np.random.default_rng(args.seed)
+        for index_key in COMPOSITION_STORE.index_ids:
+            dates, close = simulate(index_key, args.years, rng)
+            store.write(index_key, dates, close)
+            print(f"{index_key}: {len(dates)} prezzi simulati")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
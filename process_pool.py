@@ -0,0 +1,52 @@
+"""
+AssetExpl - Shared process pool
+One long-lived pool of worker processes per server process, shared by the
+Monte Carlo projections and the rebalancing grid. Workers are started with
+"spawn": a fork of the multithreaded Streamlit server would inherit locks
+held by other threads at the time of the fork. The pool is started once, so
+the start-up of the workers (Python, numpy, the simulation modules) is not
+paid again by every request.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+_pool = None
+_lock = threading.Lock()
+
+
+def cpu_count():
+    """CPU utilizzabili dal processo (rispetta l'affinità impostata dai container)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def get_pool():
+    """Pool condiviso con un processo per CPU, avviato alla prima richiesta"""
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=cpu_count(), mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pool
+
+
+def pool_map(function, tasks):
+    """Risultati di `function` su ogni task, nell'ordine dei task, calcolati
+    nel pool condiviso. Se un processo del pool termina in modo anomalo il
+    pool viene sostituito alla richiesta successiva."""
+    global _pool
+    pool = get_pool()
+    try:
+        yield from pool.map(function, tasks)
+    except BrokenProcessPool:
+        with _lock:
+            if _pool is pool:
+                _pool = None
+        raise
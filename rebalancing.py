@@ -0,0 +1,194 @@
+"""
+AssetExpl - Rebalancing policies
+Calendar (monthly, semiannual, annual) and threshold-band rebalancing with
+transaction costs, simulated for a whole grid of policies x portfolios in one
+vectorized pass over monthly returns, optionally split across a process pool.
+Results are cached by a hash of the inputs, in memory and on disk for the
+other processes of the host.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from disk_cache import DISK_CACHE
+from model_portfolios import resolved_allocations
+from pac import monthly_matrix
+from prices import PRICE_STORE
+from process_pool import cpu_count, pool_map
+
+# Politiche: ("calendar", mesi tra i ribilanciamenti), ("band", scostamento
+# massimo dal peso obiettivo) oppure ("never", None) per il buy & hold
+POLICIES = {
+    "monthly": ("calendar", 1),
+    "semiannual": ("calendar", 6),
+    "annual": ("calendar", 12),
+    "band_5": ("band", 0.05),
+    "band_10": ("band", 0.10),
+    "never": ("never", None),
+}
+
+# Costo di transazione sul controvalore scambiato (acquisti + vendite)
+DEFAULT_COST = 0.001
+# Oltre questo numero di combinazioni, e con più di una CPU, la griglia viene
+# divisa sul pool di processi condiviso
+POOL_THRESHOLD = 512
+CACHE_SIZE = 32
+
+
+def simulate(returns, targets, periods, bands, cost=DEFAULT_COST):
+    """Simula ogni combinazione (riga di `targets`) sui rendimenti mensili.
+
+    `returns` è una matrice indici x mesi, `targets` combinazioni x indici con
+    pesi che sommano a 1. Una combinazione si ribilancia a fine mese quando il
+    mese è multiplo di `periods` (0 = mai) o quando un peso si scosta dal suo
+    obiettivo più di `bands` (inf = mai). Restituisce le metriche per riga.
+    """
+    n_combos = targets.shape[0]
+    n_months = returns.shape[1]
+    holdings = targets.copy()
+    value = np.ones(n_combos)
+    monthly = np.empty((n_combos, n_months))
+    traded = np.zeros(n_combos)
+    rebalances = np.zeros(n_combos)
+
+    for t in range(n_months):
+        holdings *= 1 + returns[:, t]
+        gross = holdings.sum(axis=1)
+        weights = holdings / gross[:, None]
+        drift = np.abs(weights - targets)
+        rebalance = (drift.max(axis=1) > bands) | (
+            (periods > 0) & ((t + 1) % np.maximum(periods, 1) == 0)
+        )
+        trade = np.where(rebalance, drift.sum(axis=1), 0.0)
+        net = gross * (1 - cost * trade)
+        holdings = np.where(rebalance[:, None], targets * net[:, None], holdings)
+        monthly[:, t] = net / value - 1
+        value = net
+        traded += trade / 2
+        rebalances += rebalance
+
+    # Riferimento: mix costante ribilanciato ogni mese senza costi
+    reference = targets @ returns
+    years = n_months / 12
+    return {
+        "return": value ** (1 / years) - 1,
+        "volatility": monthly.std(axis=1, ddof=1) * np.sqrt(12),
+        "turnover": traded / years,
+        "tracking_error": (monthly - reference).std(axis=1, ddof=1) * np.sqrt(12),
+        "rebalances": rebalances / years,
+    }
+
+
+def _simulate_chunk(args):
+    returns, targets, periods, bands, cost = args
+    return simulate(returns, targets, periods, bands, cost)
+
+
+def _grid(index_keys, portfolios, policies):
+    """Righe della griglia: (portafoglio, politica, pesi obiettivo, periodo, banda)"""
+    column = {key: position for position, key in enumerate(index_keys)}
+    rows = []
+    for portfolio_id, allocation in portfolios.items():
+        target = np.zeros(len(index_keys))
+        for index_key, weight in allocation.items():
+            target[column[index_key]] = weight
+        target /= target.sum()
+        for policy_id in policies:
+            kind, value = POLICIES[policy_id]
+            period = value if kind == "calendar" else 0
+            band = value if kind == "band" else np.inf
+            rows.append((portfolio_id, policy_id, target, period, band))
+    return rows
+
+
+def input_hash(returns, portfolios, policies, cost):
+    """Impronta degli input: rendimenti, pesi, politiche e costo"""
+    digest = hashlib.sha256(np.ascontiguousarray(returns).tobytes())
+    digest.update(repr((
+        sorted((p, sorted(a.items())) for p, a in portfolios.items()),
+        list(policies),
+        cost,
+    )).encode())
+    return digest.hexdigest()
+
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def grid_search(portfolios=None, policies=None, cost=DEFAULT_COST, workers=None,
+                store=PRICE_STORE):
+    """Classifica politiche x portafogli per rendimento netto, dal migliore.
+
+    Senza `portfolios` usa i portafogli modello delle strategie collegati al
+    catalogo. Usa i mesi in cui tutti gli indici coinvolti hanno un prezzo; i portafogli
+    con indici senza serie storica vengono esclusi. Restituisce una tupla di
+    righe (dict) con portafoglio, politica e metriche, condivisa tramite la
+    cache: chi la riceve non deve modificarla.
+    """
+    portfolios = resolved_allocations() if portfolios is None else portfolios
+    policies = tuple(POLICIES) if policies is None else tuple(policies)
+    available = set(store.available())
+    portfolios = {
+        portfolio_id: {key: weight for key, weight in allocation.items() if weight > 0}
+        for portfolio_id, allocation in portfolios.items()
+    }
+    portfolios = {
+        portfolio_id: allocation for portfolio_id, allocation in portfolios.items()
+        if allocation and set(allocation) <= available
+    }
+    if not portfolios:
+        return ()
+
+    index_keys = sorted({key for allocation in portfolios.values() for key in allocation})
+    _, prices = monthly_matrix(index_keys, store)
+    prices = prices[:, np.all(np.isfinite(prices), axis=0)]
+    if prices.shape[1] < 13:
+        return ()
+    returns = prices[:, 1:] / prices[:, :-1] - 1
+
+    key = input_hash(returns, portfolios, policies, cost)
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+    # L'impronta degli input comprende già i rendimenti: non servono altre fonti
+    table = DISK_CACHE.get_or_compute(
+        ("rebalancing.grid_search", key), (),
+        lambda: _rank(returns, index_keys, portfolios, policies, cost, workers)
+    )
+    with _cache_lock:
+        _cache[key] = table
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return table
+
+
+def _rank(returns, index_keys, portfolios, policies, cost, workers):
+    """Simula la griglia e ordina le righe per rendimento netto"""
+    rows = _grid(index_keys, portfolios, policies)
+    targets = np.array([row[2] for row in rows])
+    periods = np.array([row[3] for row in rows])
+    bands = np.array([row[4] for row in rows], dtype=np.float64)
+
+    if workers is None:
+        workers = cpu_count() if len(rows) > POOL_THRESHOLD else 1
+    if workers > 1:
+        chunks = np.array_split(np.arange(len(rows)), workers)
+        parts = list(pool_map(_simulate_chunk, [
+            (returns, targets[c], periods[c], bands[c], cost) for c in chunks
+        ]))
+        metrics = {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+    else:
+        metrics = simulate(returns, targets, periods, bands, cost)
+
+    table = sorted((
+        {"portfolio": portfolio_id, "policy": policy_id,
+         **{name: float(values[row]) for name, values in metrics.items()}}
+        for row, (portfolio_id, policy_id, *_) in enumerate(rows)
+    ), key=lambda row: row["return"], reverse=True)
+    return tuple(table)
@@ -0,0 +1,425 @@
+"""
+AssetExpl - Batch report export
+Client-ready reports with description, risk metrics, geographic and sector
+composition and usage strategy of a chosen set of indices, in one language
+per report. Reports are rendered by a process pool; the composition charts
+are drawn as SVG without a browser or network access and cached across
+reports (in memory and in the shared disk cache), so an index that appears in
+hundreds of reports has its charts drawn once. Output is print-ready HTML,
+or PDF when WeasyPrint is installed.
+
+Usage:
+    python report.py [--languages it en] [--indices sp500 msci_world] [--format html]
+    python report.py --batch clients.json --output reports --workers 4
+
+The batch file lists the reports to produce:
+    [{"name": "rossi", "language": "it", "indices": ["msci_world", "msci_em"]}, ...]
+"""
+
+import argparse
+import datetime
+import html
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+
+import numpy as np
+
+from composition_store import COMPOSITION_STORE, PIE_COLORS
+from disk_cache import DISK_CACHE
+from holdings import HOLDINGS_STORE
+from locales import available_languages, load_locale
+from markdown_cache import MARKDOWN_CACHE
+from prices import PRICE_STORE
+from risk_metrics import get_risk_engine, risk_metric_rows, risk_metrics_caption
+from static_site import write_if_changed
+
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "reports")
+FORMATS = ("html", "pdf")
+# Campi obbligatori di ogni voce del file batch
+BATCH_FIELDS = ("name", "language", "indices")
+
+# Scala Viridis di Plotly, la stessa delle barre dei grafici dell'app
+VIRIDIS = (
+    "#440154", "#482878", "#3e4989", "#31688e", "#26828e",
+    "#1f9e89", "#35b779", "#6ece58", "#b5de2b", "#fde725",
+)
+
+logger = logging.getLogger("assetexpl.report")
+
+STYLE = """
+@page { size: A4; margin: 18mm 16mm; }
+body { font-family: "DejaVu Sans", system-ui, sans-serif; color: #262730; font-size: 10.5pt; max-width: 190mm; margin: 0 auto; }
+h1 { font-size: 20pt; margin-bottom: 0; }
+h2 { font-size: 15pt; border-bottom: 2px solid #ff4b4b; padding-bottom: 2mm; }
+section.index { page-break-before: always; }
+.charts { display: flex; flex-wrap: wrap; gap: 4mm; page-break-inside: avoid; }
+.charts svg { max-width: 100%; height: auto; }
+table { border-collapse: collapse; margin: 3mm 0; }
+th, td { padding: 1.5mm 4mm; border-bottom: 1px solid #e6e9ef; text-align: left; }
+.caption { font-size: 8.5pt; color: #6c6f7a; }
+""".strip()
+
+
+# ============================================================================
+# GRAFICI SVG
+# ============================================================================
+
+def _svg_title(title, width):
+    return (
+        f'<text x="{width / 2:.0f}" y="22" text-anchor="middle" font-size="15" '
+        f'font-weight="bold">{html.escape(title)}</text>'
+    )
+
+
+def donut_svg(labels, values, title, colors):
+    """Grafico ad anello con legenda, come create_pie_chart.
+
+    Ogni fetta è un cerchio con tratto tratteggiato lungo quanto la sua quota
+    di circonferenza: funziona anche con una sola fetta al 100%.
+    """
+    values = np.asarray(values, dtype=float)
+    shares = values / values.sum()
+    width, height = 520, 60 + max(240, 20 * len(shares))
+    radius, thickness = 90, 60
+    cx, cy = 130, 40 + (height - 40) / 2
+    circumference = 2 * np.pi * radius
+
+    parts = [_svg_title(title, width)]
+    offset = 0.0
+    for position, share in enumerate(shares):
+        length = share * circumference
+        parts.append(
+            f'<circle cx="{cx:.1f}" cy="{cy:.1f}" r="{radius}" fill="none" '
+            f'stroke="{colors[position % len(colors)]}" stroke-width="{thickness}" '
+            f'stroke-dasharray="{length:.2f} {circumference - length:.2f}" '
+            f'stroke-dashoffset="{-offset:.2f}" transform="rotate(-90 {cx:.1f} {cy:.1f})"/>'
+        )
+        offset += length
+
+    top = cy - 10 * len(shares)
+    for position, (label, share) in enumerate(zip(labels, shares)):
+        y = top + 20 * position
+        parts.append(
+            f'<rect x="270" y="{y:.1f}" width="12" height="12" '
+            f'fill="{colors[position % len(colors)]}"/>'
+            f'<text x="290" y="{y + 10:.1f}" font-size="12">'
+            f'{html.escape(str(label))} · {share:.1%}</text>'
+        )
+    return _svg(width, height, parts)
+
+
+def _viridis(fraction):
+    """Colore della scala Viridis per una frazione in [0, 1]"""
+    position = fraction * (len(VIRIDIS) - 1)
+    low = int(np.floor(position))
+    high = min(low + 1, len(VIRIDIS) - 1)
+    weight = position - low
+    start = np.array([int(VIRIDIS[low][i:i + 2], 16) for i in (1, 3, 5)])
+    end = np.array([int(VIRIDIS[high][i:i + 2], 16) for i in (1, 3, 5)])
+    red, green, blue = np.rint(start + (end - start) * weight).astype(int)
+    return f"#{red:02x}{green:02x}{blue:02x}"
+
+
+def bar_svg(labels, values, title):
+    """Barre orizzontali dalla più grande, colorate con Viridis come create_bar_chart"""
+    values = np.asarray(values, dtype=float)
+    order = np.argsort(values, kind="stable")[::-1]
+    width, label_width, bar_width, row = 520, 150, 300, 22
+    height = 50 + row * len(order)
+    low, high = values.min(), values.max()
+    span = high - low or 1.0
+
+    parts = [_svg_title(title, width)]
+    for position, index in enumerate(order):
+        y = 40 + row * position
+        length = bar_width * values[index] / high if high > 0 else 0
+        parts.append(
+            f'<text x="{label_width - 8}" y="{y + 15}" text-anchor="end" font-size="12">'
+            f'{html.escape(str(labels[index]))}</text>'
+            f'<rect x="{label_width}" y="{y + 3}" width="{length:.1f}" height="{row - 6}" '
+            f'fill="{_viridis((values[index] - low) / span)}"/>'
+            f'<text x="{label_width + length + 6:.1f}" y="{y + 15}" font-size="12">'
+            f'{values[index]:.1f}%</text>'
+        )
+    return _svg(width, height, parts)
+
+
+def _svg(width, height, parts):
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height:.0f}" '
+        f'viewBox="0 0 {width} {height:.0f}" font-family="DejaVu Sans, sans-serif">'
+        + "".join(parts) + "</svg>"
+    )
+
+
+class ChartCache:
+    """SVG dei grafici di composizione condivisi tra i report.
+
+    Prima la memoria del processo, poi la cache su disco condivisa dai
+    processi del pool: ogni grafico viene disegnato una volta sola per
+    lingua, indice e costituenti importati.
+    """
+
+    def __init__(self, disk=DISK_CACHE):
+        self.disk = disk
+        self._charts = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, language, index_key, dimension, colors):
+        sources = (HOLDINGS_STORE.fingerprint(index_key),)
+        key = ("report.chart", language, index_key, dimension)
+        with self._lock:
+            cached = self._charts.get(key)
+            if cached is not None and cached[0] == sources:
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+
+        def draw():
+            # Stessa precedenza dei grafici dell'app: i costituenti
+            # importati prevalgono sui pesi pre-aggregati
+            if index_key in HOLDINGS_STORE.available():
+                labels, values = HOLDINGS_STORE.breakdown(index_key, dimension, language)
+            else:
+                labels, values = COMPOSITION_STORE.breakdown(index_key, dimension, language)
+            title = load_locale(language)["chart_titles"][dimension]
+            if dimension == "geographic":
+                return donut_svg(labels, values, title, colors)
+            return bar_svg(labels, values, title)
+
+        svg = self.disk.get_or_compute(key, sources, draw)
+        with self._lock:
+            self._charts[key] = (sources, svg)
+        return svg
+
+    def stats(self):
+        with self._lock:
+            return {"size": len(self._charts), "hits": self.hits, "misses": self.misses}
+
+
+CHART_CACHE = ChartCache()
+
+
+# ============================================================================
+# CONTENUTO DEL REPORT
+# ============================================================================
+
+def index_section(language, index_key):
+    """Sezione di un indice: descrizione, metriche di rischio, composizione e strategia"""
+    content = load_locale(language)
+    index_data = content["indices"][index_key]
+    labels = content["metrics_labels"]
+    risk_engine = get_risk_engine()
+    computed = risk_engine.metrics(index_key) if risk_engine else None
+
+    rows = [
+        pair
+        for row in risk_metric_rows(index_data["risk_profile"], labels, computed)
+        for pair in row
+    ]
+    metrics = "".join(
+        f"<tr><th>{html.escape(label)}</th><td>{html.escape(value)}</td></tr>"
+        for label, value in rows
+    )
+    caption = (
+        f'<p class="caption">{html.escape(risk_metrics_caption(labels, computed))}</p>'
+        if computed else ""
+    )
+    charts = "".join(
+        CHART_CACHE.get(language, index_key, dimension, PIE_COLORS)
+        for dimension in ("geographic", "sectors")
+    )
+    return (
+        f'<section class="index" id="{index_key}">'
+        f"<h2>{html.escape(index_data['name'])}</h2>"
+        + MARKDOWN_CACHE.get(language, index_key, "description", index_data["description"])
+        + f"<h3>📊 {html.escape(content['risk_profile_title'])}</h3>"
+        + f"<table>{metrics}</table>{caption}"
+        + f"<h3>{html.escape(content['report']['composition'])}</h3>"
+        + f'<div class="charts">{charts}</div>'
+        + MARKDOWN_CACHE.get(language, index_key, "strategy", index_data["strategy"])
+        + "</section>"
+    )
+
+
+def render_report(language, index_keys, date):
+    """Documento HTML autonomo del report (nessuna risorsa esterna)"""
+    content = load_locale(language)
+    labels = content["report"]
+    contents = "".join(
+        f'<li><a href="#{key}">{html.escape(content["indices"][key]["name"])}</a></li>'
+        for key in index_keys
+    )
+    sections = "".join(index_section(language, key) for key in index_keys)
+    return f"""<!DOCTYPE html>
+<html lang="{language}">
+<head>
+<meta charset="utf-8">
+<title>{html.escape(labels['title'])}</title>
+<style>{STYLE}</style>
+</head>
+<body>
+<h1>{html.escape(labels['title'])}</h1>
+<p class="caption">{html.escape(labels['generated'].format(date=date))}</p>
+<h3>{html.escape(labels['contents'])}</h3>
+<ul>{contents}</ul>
+{sections}
+<p class="caption">💡 {html.escape(content['disclaimer'])}</p>
+</body>
+</html>
+"""
+
+
+# ============================================================================
+# PROCESSI DI RENDERING
+# ============================================================================
+
+def _init_worker(prices_dir, holdings_dir):
+    """Ogni processo legge gli stessi dati del padre. L'app non viene
+    importata: configurerebbe la pagina Streamlit e avvierebbe il backtest
+    dei portafogli modello, che ai report non servono"""
+    PRICE_STORE.prices_dir = prices_dir
+    HOLDINGS_STORE.holdings_dir = holdings_dir
+
+
+def _write_report(path, language, index_keys, date, output_format):
+    """Genera e scrive un report; restituisce i byte scritti"""
+    document = render_report(language, index_keys, date)
+    if output_format == "pdf":
+        import weasyprint
+
+        data = weasyprint.HTML(string=document).write_pdf()
+    else:
+        data = document.encode("utf-8")
+    write_if_changed(path, data)
+    return len(data)
+
+
+def default_batch(languages=None, index_keys=None):
+    """Un report per lingua e indice"""
+    return [
+        {"name": f"{language}_{index_key}", "language": language, "indices": [index_key]}
+        for language, index_key in product(
+            languages or available_languages(), index_keys or COMPOSITION_STORE.index_ids
+        )
+    ]
+
+
+def validate_batch(batch):
+    """Controlla voci, lingue, indici e nomi prima di avviare il pool"""
+    languages = set(available_languages())
+    names = set()
+    for position, report in enumerate(batch):
+        missing = [
+            field for field in BATCH_FIELDS
+            if not isinstance(report, dict) or field not in report
+        ]
+        if missing:
+            raise ValueError(f"Voce {position} del batch senza {', '.join(missing)}")
+        if isinstance(report["indices"], str):
+            raise ValueError(f"Gli indici del report {report['name']!r} vanno elencati in una lista")
+        if report["language"] not in languages:
+            raise ValueError(f"Lingua non disponibile: {report['language']!r}")
+        unknown = set(report["indices"]) - set(COMPOSITION_STORE.index_ids)
+        if unknown or not report["indices"]:
+            raise ValueError(f"Indici non validi nel report {report['name']!r}: {sorted(unknown)}")
+        if report["name"] in names or os.sep in report["name"]:
+            raise ValueError(f"Nome di report non valido o duplicato: {report['name']!r}")
+        names.add(report["name"])
+
+
+def export_reports(batch, output=OUTPUT_DIR, output_format="html", workers=None, date=None):
+    """Genera i report del lotto in un pool di processi e restituisce un riepilogo"""
+    if output_format == "pdf":
+        try:
+            import weasyprint  # noqa: F401 - solo per verificarne la presenza
+        except ImportError as exc:
+            raise RuntimeError("Il formato pdf richiede WeasyPrint: pip install weasyprint") from exc
+    validate_batch(batch)
+    date = date or datetime.date.today().isoformat()
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    os.makedirs(output, exist_ok=True)
+
+    written = failed = 0
+    size = 0
+    # spawn: i processi non ereditano thread e stato del processo padre
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(batch)) or 1,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(PRICE_STORE.prices_dir, HOLDINGS_STORE.holdings_dir),
+    ) as pool:
+        futures = {
+            pool.submit(
+                _write_report,
+                os.path.join(output, f"{report['name']}.{output_format}"),
+                report["language"],
+                list(report["indices"]),
+                date,
+                output_format,
+            ): report["name"]
+            for report in batch
+        }
+        for future in as_completed(futures):
+            try:
+                size += future.result()
+                written += 1
+            except Exception:  # noqa: BLE001 - gli altri report proseguono
+                logger.exception("Report %s non generato", futures[future])
+                failed += 1
+
+    summary = {
+        "reports": len(batch),
+        "written": written,
+        "failed": failed,
+        "bytes": size,
+        "workers": workers,
+        "elapsed_s": time.perf_counter() - start,
+    }
+    logger.info(
+        "Report in %s: %d scritti, %d falliti, %.1f MiB in %.2f s con %d processi",
+        output, written, failed, size / 2**20, summary["elapsed_s"], workers
+    )
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--batch", help="file JSON con l'elenco dei report")
+    parser.add_argument("--languages", nargs="+", help="lingue (default: tutte)")
+    parser.add_argument("--indices", nargs="+", help="indici (default: tutti)")
+    parser.add_argument("--format", choices=FORMATS, default="html")
+    parser.add_argument("--output", default=OUTPUT_DIR, help="cartella dei report")
+    parser.add_argument("--workers", type=int, help="processi di rendering (default: CPU)")
+    parser.add_argument("--date", help="data riportata nei report (default: oggi)")
+    parser.add_argument("--prices-dir", default=PRICE_STORE.prices_dir)
+    parser.add_argument("--holdings-dir", default=HOLDINGS_STORE.holdings_dir)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    PRICE_STORE.prices_dir = args.prices_dir
+    HOLDINGS_STORE.holdings_dir = args.holdings_dir
+    if args.batch:
+        with open(args.batch, encoding="utf-8") as f:
+            batch = json.load(f)
+    else:
+        batch = default_batch(args.languages, args.indices)
+    try:
+        summary = export_reports(batch, args.output, args.format, args.workers, args.date)
+    except (ValueError, RuntimeError) as exc:
+        parser.error(str(exc))
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
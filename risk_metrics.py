@@ -0,0 +1,230 @@
+"""
+AssetExpl - Risk metrics engine
+Annualized volatility, CAGR, max drawdown, Sharpe and Sortino for every index
+at once, computed from the price store and kept up to date incrementally
+when new daily bars arrive.
+"""
+
+import threading
+
+import numpy as np
+
+from prices import PRICE_STORE, TRADING_DAYS
+
+# Tasso privo di rischio annuo usato per Sharpe e Sortino
+RISK_FREE_RATE = 0.02
+
+
+def _padded_matrix(series):
+    """Allinea serie di lunghezza diversa a destra in una matrice, con NaN in testa"""
+    width = max(len(close) for close in series)
+    matrix = np.full((len(series), width), np.nan)
+    for row, close in enumerate(series):
+        matrix[row, width - len(close):] = close
+    return matrix
+
+
+class RiskEngine:
+    """Statistiche cumulative dei rendimenti giornalieri, una riga per indice.
+
+    Lo stato contiene solo somme e contatori (metodo di Welford per la
+    varianza, picco e drawdown massimo correnti): aggiungere k nuove barre
+    costa O(k) senza rileggere lo storico.
+    """
+
+    def __init__(self, index_keys, dates, closes, risk_free_rate=RISK_FREE_RATE):
+        self.index_keys = tuple(index_keys)
+        self._rows = {key: row for row, key in enumerate(self.index_keys)}
+        self.risk_free_rate = risk_free_rate
+        self._daily_rf = (1 + risk_free_rate) ** (1 / TRADING_DAYS) - 1
+        self._lock = threading.Lock()
+
+        prices = _padded_matrix(closes)
+        returns = prices[:, 1:] / prices[:, :-1] - 1
+
+        self.count = np.sum(~np.isnan(returns), axis=1).astype(np.float64)
+        self.mean = np.nanmean(returns, axis=1)
+        self.m2 = np.nansum((returns - self.mean[:, None]) ** 2, axis=1)
+        self.downside_sq = np.nansum(
+            np.minimum(returns - self._daily_rf, 0.0) ** 2, axis=1
+        )
+        peak = np.fmax.accumulate(prices, axis=1)
+        self.max_drawdown = np.nanmin(prices / peak - 1, axis=1)
+        self.peak = peak[:, -1]
+        self.first_close = np.array([close[0] for close in closes], dtype=np.float64)
+        self.length = np.array([len(close) for close in closes])
+        self.last_close = prices[:, -1].copy()
+        self.first_date = np.array([d[0] for d in dates], dtype="datetime64[D]")
+        self.last_date = np.array([d[-1] for d in dates], dtype="datetime64[D]")
+
+    @classmethod
+    def from_store(cls, store=PRICE_STORE, risk_free_rate=RISK_FREE_RATE):
+        """Crea il motore dalle serie presenti nello store dei prezzi"""
+        index_keys = [key for key in store.available() if len(store.get(key)[1]) > 1]
+        series = [store.get(key) for key in index_keys]
+        if not series:
+            return None
+        return cls(
+            index_keys,
+            [dates for dates, _ in series],
+            [np.asarray(close) for _, close in series],
+            risk_free_rate
+        )
+
+    def update(self, index_key, dates, closes):
+        """Aggiunge nuove barre giornaliere all'indice in O(len(closes))"""
+        closes = np.asarray(closes, dtype=np.float64)
+        if len(closes) == 0:
+            return
+        row = self._rows[index_key]
+        with self._lock:
+            prices = np.concatenate(([self.last_close[row]], closes))
+            returns = prices[1:] / prices[:-1] - 1
+
+            # Unione delle statistiche di Welford di due gruppi di rendimenti
+            n_a, n_b = self.count[row], len(returns)
+            mean_b = returns.mean()
+            delta = mean_b - self.mean[row]
+            total = n_a + n_b
+            self.m2[row] += ((returns - mean_b) ** 2).sum() + delta ** 2 * n_a * n_b / total
+            self.mean[row] += delta * n_b / total
+            self.count[row] = total
+            self.downside_sq[row] += (np.minimum(returns - self._daily_rf, 0.0) ** 2).sum()
+
+            peak = np.maximum.accumulate(np.concatenate(([self.peak[row]], closes)))[1:]
+            self.max_drawdown[row] = min(self.max_drawdown[row], (closes / peak - 1).min())
+            self.peak[row] = peak[-1]
+            self.last_close[row] = closes[-1]
+            self.last_date[row] = np.datetime64(dates[-1], "D")
+            self.length[row] += len(closes)
+
+    def new_bars(self, index_key, dates, closes):
+        """Barre di una serie salvata successive all'ultima del motore, come
+        (date, prezzi); None se la serie non prosegue quella del motore
+        (indice sconosciuto o serie riscritta)"""
+        row = self._rows.get(index_key)
+        if row is None:
+            return None
+        with self._lock:
+            known = int(self.length[row])
+            if (
+                len(closes) < known
+                or dates[0] != self.first_date[row]
+                or closes[0] != self.first_close[row]
+                or dates[known - 1] != self.last_date[row]
+                or closes[known - 1] != self.last_close[row]
+            ):
+                return None
+        return dates[known:], closes[known:]
+
+    def compute(self):
+        """Metriche di tutti gli indici come array allineati a `index_keys`"""
+        with self._lock:
+            years = (self.last_date - self.first_date).astype(np.float64) / 365.25
+            volatility = np.sqrt(self.m2 / np.maximum(self.count - 1, 1) * TRADING_DAYS)
+            downside = np.sqrt(self.downside_sq / self.count * TRADING_DAYS)
+            excess = self.mean * TRADING_DAYS - self.risk_free_rate
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return {
+                    "volatility": volatility,
+                    "cagr": (self.last_close / self.first_close) ** (1 / years) - 1,
+                    "max_drawdown": self.max_drawdown.copy(),
+                    "sharpe": excess / volatility,
+                    "sortino": excess / downside,
+                    "start": self.first_date.copy(),
+                    "end": self.last_date.copy(),
+                }
+
+    def metrics(self, index_key):
+        """Metriche di un indice, o None se non ha una serie storica"""
+        row = self._rows.get(index_key)
+        if row is None:
+            return None
+        return {name: values[row] for name, values in self.compute().items()}
+
+
+_engine = None
+_engine_fingerprint = None
+_engine_lock = threading.Lock()
+
+
+def _append_new_bars(engine, previous, fingerprint, store=PRICE_STORE):
+    """Porta il motore alla nuova impronta con le sole barre aggiunte in coda;
+    False (motore invariato) se un indice è nuovo, rimosso o riscritto"""
+    if [key for key, _ in previous] != [key for key, _ in fingerprint]:
+        return False
+    changed = [key for (key, old), (_, new) in zip(previous, fingerprint) if old != new]
+    updates = []
+    for key in changed:
+        bars = engine.new_bars(key, *store.get(key))
+        if bars is None:
+            return False
+        updates.append((key, *bars))
+    for key, dates, closes in updates:
+        engine.update(key, dates, closes)
+    return True
+
+
+def get_risk_engine():
+    """Motore condiviso dal processo, allineato alle serie dello store dei prezzi.
+
+    Quando l'impronta delle serie cambia (import, simulazione, scritture di
+    un altro processo) le barre aggiunte in coda passano da RiskEngine.update
+    in O(k); un indice nuovo, rimosso o riscritto fa ricreare il motore.
+    """
+    global _engine, _engine_fingerprint
+    fingerprint = PRICE_STORE.fingerprint()
+    with _engine_lock:
+        if fingerprint != _engine_fingerprint:
+            if _engine is None or not _append_new_bars(_engine, _engine_fingerprint, fingerprint):
+                _engine = RiskEngine.from_store()
+            _engine_fingerprint = fingerprint
+        return _engine
+
+
+def append_bars(index_key, dates, closes):
+    """Salva nuove barre nello store e aggiorna le metriche senza ricalcolarle da capo"""
+    PRICE_STORE.append(index_key, dates, closes)
+    return get_risk_engine()
+
+
+def reset_risk_engine():
+    """Scarta il motore, che verrà ricreato dallo store alla prossima richiesta"""
+    global _engine, _engine_fingerprint
+    with _engine_lock:
+        _engine = None
+        _engine_fingerprint = None
+
+
+def risk_metric_rows(risk_data, labels, computed=None):
+    """Metriche di rischio come righe di coppie (etichetta, valore), per l'app,
+    il sito statico e i report.
+
+    Con `computed` (metriche calcolate dai prezzi) volatilità e rendimento
+    mostrano i valori storici reali invece degli intervalli indicativi, e una
+    seconda riga aggiunge drawdown massimo, Sharpe e Sortino.
+    """
+    rows = [[
+        (labels['risk'], risk_data['risk_level']),
+        (
+            labels['volatility'],
+            f"{computed['volatility']:.1%}" if computed else risk_data['volatility']
+        ),
+        (labels['horizon'], risk_data['time_horizon']),
+        (labels['cagr'], f"{computed['cagr']:.1%}") if computed
+        else (labels['returns'], risk_data['return_potential']),
+    ]]
+    if computed:
+        rows.append([
+            (labels['max_drawdown'], f"{computed['max_drawdown']:.1%}"),
+            (labels['sharpe'], f"{computed['sharpe']:.2f}"),
+            (labels['sortino'], f"{computed['sortino']:.2f}"),
+        ])
+    return rows
+
+
+def risk_metrics_caption(labels, computed):
+    """Periodo e tasso privo di rischio delle metriche calcolate dai prezzi"""
+    return labels['computed_period'].format(
+        start=computed['start'], end=computed['end'], rf=RISK_FREE_RATE
+    )
@@ -0,0 +1,14 @@
+"""
+AssetExpl - ASGI entry point
+Serves the Streamlit app and the read-only JSON API (api.py) from the same
+server and port.
+
+Usage:
+    streamlit run server.py [--server.port 8501]
+"""
+
+import streamlit as st
+
+from api import API
+
+app = st.App("app.py", routes=API.routes())
@@ -0,0 +1,124 @@
+"""
+AssetExpl - Session memory accounting
+Estimates how much memory every Streamlit session retains on its own, net of
+the objects shared by the whole process (cached figures, pre-rendered texts,
+locale bundles), to size the number of sessions a worker can hold.
+"""
+
+import gc
+import os
+import sys
+import types
+
+import numpy as np
+
+from figure_cache import FIGURE_CACHE, HISTORY_CACHE
+from locales import available_languages, load_locale
+from markdown_cache import MARKDOWN_CACHE
+
+# Oggetti che non appartengono alla sessione anche se raggiungibili dal suo
+# stato (callback dei widget, moduli, classi): non vengono attraversati
+_OPAQUE = (
+    type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType,
+    types.MethodType, types.CodeType, types.FrameType,
+)
+# Chiavi mostrate per ogni sessione, dalla più pesante
+TOP_KEYS = 5
+
+
+def deep_size(obj, shared=frozenset(), seen=None):
+    """Byte raggiungibili da `obj`, esclusi gli oggetti con id in `shared`.
+
+    Gli array numpy contano il proprio buffer solo se lo possiedono: viste e
+    memmap delle serie storiche non occupano memoria della sessione.
+    """
+    seen = set() if seen is None else seen
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        identity = id(current)
+        if identity in seen or identity in shared or isinstance(current, _OPAQUE):
+            continue
+        seen.add(identity)
+        total += sys.getsizeof(current, 0)
+
+        # getsizeof di un array include il buffer solo se l'array lo possiede
+        if isinstance(current, (np.ndarray, str, bytes, bytearray, int, float, complex)):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        else:
+            stack.extend(gc.get_referents(current))
+    return total
+
+
+def shared_objects():
+    """Id degli oggetti condivisi dal processo (e di tutto ciò che contengono)"""
+    roots = FIGURE_CACHE.figures() + HISTORY_CACHE.figures()
+    roots.append(MARKDOWN_CACHE)
+    roots.extend(load_locale(lang) for lang in available_languages())
+    seen = set()
+    for root in roots:
+        deep_size(root, seen=seen)
+    return frozenset(seen)
+
+
+def shared_report():
+    """Byte delle strutture condivise: {nome: byte}"""
+    seen = set()
+    return {
+        "figures": deep_size(FIGURE_CACHE.figures() + HISTORY_CACHE.figures(), seen=seen),
+        "markdown": deep_size(MARKDOWN_CACHE, seen=seen),
+        "locales": deep_size([load_locale(lang) for lang in available_languages()], seen=seen),
+    }
+
+
+def _session_states():
+    """(id sessione, SessionState) delle sessioni attive, o della sola sessione
+    corrente se non c'è un server vero (ad esempio nei test con AppTest)"""
+    from streamlit import runtime
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    manager = getattr(runtime.get_instance(), "_session_mgr", None) if runtime.exists() else None
+    if manager is not None:
+        return [
+            (info.session.id, info.session.session_state)
+            for info in manager.list_active_sessions()
+        ]
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return []
+    return [(ctx.session_id, ctx.session_state._state)]
+
+
+def session_report():
+    """Una riga per sessione: byte trattenuti e chiavi più pesanti, dalla più grande"""
+    shared = shared_objects()
+    rows = []
+    for session_id, state in _session_states():
+        # Conteggio per chiave su un insieme `seen` comune: un oggetto
+        # raggiungibile da più chiavi viene attribuito una sola volta
+        seen = set()
+        keys = {}
+        for key, value in state.filtered_state.items():
+            keys[key] = deep_size(value, shared, seen)
+        total = deep_size(state, shared, seen) + sum(keys.values())
+        rows.append({
+            "session": session_id,
+            "bytes": total,
+            "keys": sorted(keys.items(), key=lambda item: item[1], reverse=True)[:TOP_KEYS],
+        })
+    return sorted(rows, key=lambda row: row["bytes"], reverse=True)
+
+
+def process_rss():
+    """Memoria residente del processo in byte (None se non disponibile)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
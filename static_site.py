@@ -0,0 +1,560 @@
+"""
+AssetExpl - Static site export
+Renders every (language, index, tab) page of the app, with its texts, risk
+metrics and Plotly charts at the default parameters, into static HTML that
+can be served by any web server or opened from disk. Pages are rendered in
+parallel by a process pool, and only those whose source data (prices,
+holdings, application code) changed since the previous export are rendered
+and written again.
+
+Usage:
+    python static_site.py [--output site] [--workers 4] [--force] [--inline-plotlyjs]
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from importlib.metadata import version
+from itertools import product
+
+from composition_store import COMPOSITION_STORE
+from disk_cache import code_fingerprint
+from holdings import HOLDINGS_STORE
+from locales import DEFAULT_LANGUAGE, available_languages, load_locale
+from prices import PRICE_STORE
+
+OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "site")
+MANIFEST = ".manifest.json"
+PLOTLY_JS = "plotly.min.js"
+# Stesso ordine delle tab dell'app (app.TAB_IDS, non importato qui: app.py
+# configura la pagina Streamlit all'import)
+TAB_IDS = (
+    "description", "statistics", "strategy", "history", "comparison", "portfolio",
+    "projection"
+)
+
+logger = logging.getLogger("assetexpl.static_site")
+
+STYLE = """
+body { font-family: system-ui, sans-serif; margin: 0; color: #262730; }
+header, main, footer { max-width: 1200px; margin: 0 auto; padding: 0 1.5rem; }
+nav { display: flex; flex-wrap: wrap; gap: .4rem; margin: .6rem 0; }
+nav a { padding: .25rem .6rem; border-radius: .4rem; text-decoration: none; color: #262730; background: #f0f2f6; }
+nav a.active { background: #ff4b4b; color: white; }
+.columns { display: grid; grid-template-columns: repeat(auto-fit, minmax(420px, 1fr)); gap: 1rem; }
+.metrics { display: grid; grid-template-columns: repeat(auto-fit, minmax(180px, 1fr)); gap: 1rem; margin: 1rem 0; }
+.metric .label { font-size: .85rem; color: #555; }
+.metric .value { font-size: 1.8rem; }
+.caption { font-size: .85rem; color: #6c6f7a; }
+table { border-collapse: collapse; width: 100%; }
+th, td { padding: .3rem .6rem; border-bottom: 1px solid #e6e9ef; text-align: right; }
+th:first-child, td:first-child { text-align: left; }
+""".strip()
+
+
+# ============================================================================
+# IMPRONTE DELLE PAGINE
+# ============================================================================
+
+def page_path(language, index_key, tab_id):
+    """Percorso della pagina relativo alla cartella del sito"""
+    return f"{language}/{index_key}/{tab_id}.html"
+
+
+def tab_sources(index_key, tab_id):
+    """Impronte dei dati da cui dipende il contenuto di una tab.
+
+    Testi, composizioni e confronto dipendono solo dal codice (e quindi dai
+    bundle di lingua), già compreso nell'impronta di ogni pagina.
+    """
+    if tab_id == "statistics":
+        return (PRICE_STORE.fingerprint([index_key]), HOLDINGS_STORE.fingerprint(index_key))
+    if tab_id in ("strategy", "portfolio"):
+        # Portafogli modello e PAC usano tutte le serie; l'esposizione del
+        # portafoglio proposto i costituenti dei suoi indici
+        return (
+            PRICE_STORE.fingerprint(),
+            tuple((key, HOLDINGS_STORE.fingerprint(key)) for key in COMPOSITION_STORE.index_ids),
+        )
+    if tab_id in ("history", "projection"):
+        return (PRICE_STORE.fingerprint([index_key]),)
+    return ()
+
+
+def page_fingerprint(index_key, tab_id, inline_plotlyjs):
+    """Impronta di una pagina: codice, versione di Plotly e dati di origine"""
+    return hashlib.sha256(repr((
+        code_fingerprint(),
+        version("plotly"),
+        inline_plotlyjs,
+        tab_sources(index_key, tab_id),
+    )).encode("utf-8")).hexdigest()
+
+
+def write_if_changed(path, data):
+    """Scrive il file in modo atomico solo se il contenuto è diverso"""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return True
+
+
+# ============================================================================
+# CONTENUTO DELLE TAB
+# ============================================================================
+
+def _caption(text):
+    return f'<p class="caption">{html.escape(text)}</p>'
+
+
+def _metrics(pairs):
+    return '<div class="metrics">' + "".join(
+        f'<div class="metric"><div class="label">{html.escape(label)}</div>'
+        f'<div class="value">{html.escape(value)}</div></div>'
+        for label, value in pairs
+    ) + "</div>"
+
+
+def _table(header, rows):
+    head = "".join(f"<th>{html.escape(cell)}</th>" for cell in header)
+    body = "".join(
+        "<tr>" + "".join(f"<td>{html.escape(cell)}</td>" for cell in row) + "</tr>"
+        for row in rows
+    )
+    return f"<table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table>"
+
+
+def _columns(*blocks):
+    return '<div class="columns">' + "".join(f"<div>{block}</div>" for block in blocks) + "</div>"
+
+
+class PageWriter:
+    """Sezioni HTML di una pagina (lingua, indice, tab), costruite con le
+    stesse funzioni e cache dell'app e i valori iniziali dei widget"""
+
+    def __init__(self, app, language, index_key):
+        self.app = app
+        self.language = language
+        self.index_key = index_key
+        self.content = load_locale(language)
+        self.index_data = self.content["indices"][index_key]
+        self.index_names = {
+            key: self.content["indices"][key]["name"] for key in COMPOSITION_STORE.index_ids
+        }
+        self._charts = 0
+
+    def chart(self, fig):
+        """Grafico Plotly incorporato; gli id sono progressivi, così la stessa
+        figura produce sempre lo stesso HTML e la pagina non viene riscritta"""
+        import plotly.io as pio
+
+        self._charts += 1
+        return pio.to_html(
+            fig,
+            full_html=False,
+            include_plotlyjs=False,
+            div_id=f"chart-{self._charts}",
+            config={"displaylogo": False},
+        )
+
+    def parameters(self, pairs):
+        labels = self.content["static"]
+        return _caption(f"{labels['parameters']}: " + " · ".join(
+            f"{label}: {value}" for label, value in pairs
+        ))
+
+    def description(self):
+        return self.app.MARKDOWN_CACHE.get(
+            self.language, self.index_key, "description", self.index_data["description"]
+        )
+
+    def statistics(self):
+        app, content = self.app, self.content
+        risk_engine = app.get_risk_engine()
+        computed = risk_engine.metrics(self.index_key) if risk_engine else None
+        parts = [f"<h3>📊 {html.escape(content['risk_profile_title'])}</h3>"]
+        for row in app.risk_metric_rows(
+            self.index_data["risk_profile"], content["metrics_labels"], computed
+        ):
+            parts.append(_metrics(row))
+        if computed:
+            parts.append(_caption(app.risk_metrics_caption(content["metrics_labels"], computed)))
+
+        charts = []
+        for dimension, chart_builder in (
+            ("geographic", app.create_pie_chart),
+            ("sectors", app.create_bar_chart),
+        ):
+            title = content["chart_titles"][dimension]
+            fig = app.get_cached_chart(chart_builder, title, self.language, self.index_key, dimension)
+            charts.append(f"<h3>{html.escape(title)}</h3>" + self.chart(fig))
+        parts.append(_columns(*charts))
+        return "".join(parts)
+
+    def strategy(self):
+        strategy = self.app.MARKDOWN_CACHE.get(
+            self.language, self.index_key, "strategy", self.index_data["strategy"]
+        )
+        return _columns(strategy, self.model_portfolios()) + "<hr>" + self.pac_backtest()
+
+    def model_portfolios(self):
+        app, content = self.app, self.content
+        labels = content["model_portfolios"]
+        portfolios = [
+            portfolio for portfolio in app.model_portfolios(self.language)
+            if portfolio.source_index == self.index_key
+        ]
+        if not portfolios:
+            return ""
+
+        parts = [f"<h3>{html.escape(labels['title'])}</h3>"]
+        results = app.get_model_backtest()
+        computed = [p for p in portfolios if p.portfolio_id in results]
+        if computed:
+            columns = labels["columns"]
+            metrics = [results[p.portfolio_id] for p in computed]
+            parts.append(_table(
+                [columns[name] for name in ("portfolio", "cagr", "volatility", "max_drawdown", "sharpe")],
+                [
+                    [
+                        p.title,
+                        f"{100 * m['cagr']:.1f}%",
+                        f"{100 * m['volatility']:.1f}%",
+                        f"{100 * m['max_drawdown']:.1f}%",
+                        f"{m['sharpe']:.2f}",
+                    ]
+                    for p, m in zip(computed, metrics)
+                ]
+            ))
+            parts.append(_caption(labels["period"].format(
+                start=metrics[0]["start"], end=metrics[0]["end"]
+            )))
+            proxies = sorted({
+                f"{c.label} → {content['indices'][c.index_id]['name']}"
+                for p in computed for c in p.components if c.proxy
+            })
+            if proxies:
+                parts.append(_caption(labels["proxy"].format(components=", ".join(proxies))))
+        else:
+            parts.append(f"<p>{html.escape(labels['missing'])}</p>")
+
+        unlinked = sorted({
+            c.label for p in portfolios for c in p.components if c.index_id is None
+        })
+        if unlinked:
+            parts.append(_caption(labels["unlinked"].format(components=", ".join(unlinked))))
+        return "".join(parts)
+
+    def pac_backtest(self):
+        app = self.app
+        labels = self.content["pac"]
+        parts = [f"<h3>{html.escape(labels['title'])}</h3>"]
+        summary = None
+        if self.index_key in app.PRICE_STORE.available():
+            summary = app.backtest_all(app.DEFAULT_YEARS, app.DEFAULT_CONTRIBUTION).get(self.index_key)
+        if summary is None:
+            return parts[0] + f"<p>{html.escape(labels['missing'])}</p>"
+
+        parts.append(self.parameters((
+            (labels["years"], app.DEFAULT_YEARS),
+            (labels["contribution"], f"{app.DEFAULT_CONTRIBUTION:,.0f}"),
+        )))
+        parts.append(_metrics((
+            (labels["invested"], f"{summary['invested']:,.0f}"),
+            (labels["median"], f"{summary['final_percentiles'][50]:,.0f}"),
+            (labels["p5"], f"{summary['final_percentiles'][5]:,.0f}"),
+            (labels["median_irr"], f"{summary['median_irr']:.1%}"),
+            (labels["loss_share"], f"{summary['loss_share']:.0%}"),
+        )))
+        parts.append(_caption(labels["worst"].format(
+            start=summary["worst_start"],
+            value=summary["worst_value"],
+            irr=summary["worst_irr"]
+        )))
+        fig = app.get_cached_pac_chart(
+            labels, self.language, self.index_key, app.DEFAULT_YEARS, app.DEFAULT_CONTRIBUTION,
+            summary
+        )
+        parts.append(self.chart(fig))
+        parts.append(_caption(labels["plans"].format(plans=summary["plans"])))
+        return "".join(parts)
+
+    def history(self):
+        app = self.app
+        labels = self.content["history"]
+        if self.index_key not in app.PRICE_STORE.available():
+            return f"<p>{html.escape(labels['missing'])}</p>"
+        dates, _ = app.PRICE_STORE.get(self.index_key)
+        fig, shown, total = app.get_cached_history_chart(
+            self.content, self.language, self.index_key, dates[0].item(), dates[-1].item()
+        )
+        return self.chart(fig) + _caption(labels["points"].format(shown=shown, total=total))
+
+    def comparison(self):
+        labels = self.content["comparison"]
+        return _caption(labels["help"]) + _columns(*(
+            self.chart(self.app.get_cached_overlap_chart(
+                labels["titles"][dimension],
+                self.language,
+                list(self.index_names),
+                self.index_names,
+                dimension
+            ))
+            for dimension in ("geographic", "sectors")
+        ))
+
+    def portfolio(self):
+        app = self.app
+        labels = self.content["portfolio"]
+        allocation = app.DEFAULT_ALLOCATION
+        charts = []
+        for dimension, chart_builder in (
+            ("geographic", app.create_pie_chart),
+            ("sectors", app.create_bar_chart),
+        ):
+            exposure_labels, exposure = app.exposure_breakdown(allocation, dimension, self.language)
+            charts.append(self.chart(chart_builder(
+                exposure_labels, exposure, labels["titles"][dimension], self.language
+            )))
+        return (
+            f"<h3>{html.escape(self.content['static']['allocation'])}: "
+            f"{html.escape(app.portfolio_name(allocation, self.index_names))}</h3>"
+            + _columns(*charts)
+        )
+
+    def projection(self):
+        app = self.app
+        from monte_carlo import project
+
+        labels = self.content["projection"]
+        years = app.projection_years(self.index_data)
+        key = app.projection_key(self.language, self.index_key, years, "parametric", app.DEFAULT_PATHS)
+        sources = app.PRICE_STORE.fingerprint([self.index_key])
+        fig = app.FIGURE_CACHE.get(key, sources)
+        if fig is None:
+            percentiles = project(self.index_key, years, n_paths=app.DEFAULT_PATHS, method="parametric")
+            fig = app.create_fan_chart(
+                percentiles, labels, f"{self.index_data['name']} - {labels['title']}", self.language
+            )
+            app.FIGURE_CACHE.put(key, fig, sources)
+        return self.parameters((
+            (labels["horizon"], years),
+            (labels["method"], labels["methods"]["parametric"]),
+            (labels["paths"], f"{app.DEFAULT_PATHS:,}"),
+        )) + self.chart(fig)
+
+    def page(self, tab_id, plotlyjs):
+        """Documento HTML completo della tab, con i collegamenti alle altre pagine"""
+        content = self.content
+        body = getattr(self, tab_id)()
+
+        def link(href, text, active):
+            css = ' class="active"' if active else ""
+            return f'<a href="{html.escape(href)}"{css}>{html.escape(text)}</a>'
+
+        languages = "".join(
+            link(f"../../{page_path(lang, self.index_key, tab_id)}", lang.upper(), lang == self.language)
+            for lang in available_languages()
+        )
+        indices = "".join(
+            link(f"../{key}/{tab_id}.html", name, key == self.index_key)
+            for key, name in self.index_names.items()
+        )
+        tabs = "".join(
+            link(f"{tab}.html", content["tabs"][tab], tab == tab_id) for tab in TAB_IDS
+        )
+        title = f"{content['app_title']} - {self.index_data['name']} - {content['tabs'][tab_id]}"
+        return f"""<!DOCTYPE html>
+<html lang="{self.language}">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(title)}</title>
+<style>{STYLE}</style>
+{plotlyjs}
+</head>
+<body>
+<header>
+<h1>{html.escape(content['app_title'])}</h1>
+<p><em>{html.escape(content['app_subtitle'])}</em></p>
+<nav>{languages}</nav>
+<nav>{indices}</nav>
+<nav>{tabs}</nav>
+</header>
+<main>
+<h2>{html.escape(self.index_data['name'])}</h2>
+{body}
+</main>
+<footer>
+<hr>
+{_caption('💡 ' + content['disclaimer'])}
+{_caption(content['static']['note'])}
+</footer>
+</body>
+</html>
+"""
+
+
+# ============================================================================
+# PROCESSI DI RENDERING
+# ============================================================================
+
+_app = None
+_plotlyjs = None
+
+
+def _init_worker(prices_dir, holdings_dir, inline_plotlyjs):
+    """Ogni processo importa l'app una volta e legge gli stessi dati del padre;
+    le figure già calcolate arrivano dalla cache su disco condivisa"""
+    global _app, _plotlyjs
+    PRICE_STORE.prices_dir = prices_dir
+    HOLDINGS_STORE.holdings_dir = holdings_dir
+    logging.getLogger("streamlit").setLevel(logging.ERROR)
+    import app
+
+    _app = app
+    if inline_plotlyjs:
+        from plotly.offline import get_plotlyjs
+        _plotlyjs = f'<script type="text/javascript">{get_plotlyjs()}</script>'
+
+
+def _render_page(output, language, index_key, tab_id):
+    """Genera e scrive una pagina; True se il file è cambiato"""
+    path = page_path(language, index_key, tab_id)
+    plotlyjs = _plotlyjs or f'<script src="../../{PLOTLY_JS}"></script>'
+    document = PageWriter(_app, language, index_key).page(tab_id, plotlyjs)
+    return write_if_changed(os.path.join(output, path), document.encode("utf-8"))
+
+
+def export_site(output=OUTPUT_DIR, languages=None, index_keys=None, workers=None,
+                force=False, inline_plotlyjs=False):
+    """Esporta il sito e restituisce il numero di pagine rigenerate e scritte.
+
+    Le impronte delle pagine esportate sono salvate nel manifest del sito: al
+    giro successivo si rigenerano solo le pagine con un'impronta diversa o
+    mancanti, e si riscrivono solo quelle il cui HTML è cambiato davvero.
+    """
+    languages = list(languages or available_languages())
+    index_keys = list(index_keys or COMPOSITION_STORE.index_ids)
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+
+    manifest_path = os.path.join(output, MANIFEST)
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        manifest = {}
+
+    pages = {}
+    for language, index_key, tab_id in product(languages, index_keys, TAB_IDS):
+        path = page_path(language, index_key, tab_id)
+        pages[path] = (language, index_key, tab_id, page_fingerprint(index_key, tab_id, inline_plotlyjs))
+    stale = [
+        path for path, (*_, fingerprint) in pages.items()
+        if force or manifest.get(path) != fingerprint
+        or not os.path.exists(os.path.join(output, path))
+    ]
+
+    os.makedirs(output, exist_ok=True)
+    written = failed = 0
+    if not inline_plotlyjs:
+        from plotly.offline import get_plotlyjs
+        write_if_changed(os.path.join(output, PLOTLY_JS), get_plotlyjs().encode("utf-8"))
+    default = page_path(DEFAULT_LANGUAGE, index_keys[0], TAB_IDS[0])
+    write_if_changed(os.path.join(output, "index.html"), (
+        f'<!DOCTYPE html>\n<meta charset="utf-8">\n'
+        f'<meta http-equiv="refresh" content="0; url={default}">\n'
+        f'<a href="{default}">AssetExpl</a>\n'
+    ).encode("utf-8"))
+
+    if stale:
+        # spawn: i processi non ereditano thread e stato del processo padre
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(stale)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(PRICE_STORE.prices_dir, HOLDINGS_STORE.holdings_dir, inline_plotlyjs),
+        ) as pool:
+            futures = {
+                pool.submit(_render_page, output, *pages[path][:3]): path for path in stale
+            }
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    written += future.result()
+                except Exception:  # noqa: BLE001 - le altre pagine proseguono
+                    # Una pagina fallita resta fuori dal manifest e verrà rigenerata
+                    logger.exception("Pagina %s non generata", path)
+                    manifest.pop(path, None)
+                    failed += 1
+                    continue
+                manifest[path] = pages[path][3]
+
+    manifest = {path: fingerprint for path, fingerprint in manifest.items() if path in pages}
+    write_if_changed(
+        manifest_path, json.dumps(manifest, indent=1, sort_keys=True).encode("utf-8")
+    )
+
+    report = {
+        "pages": len(pages),
+        "rendered": len(stale),
+        "written": written,
+        "failed": failed,
+        "workers": workers,
+        "elapsed_s": time.perf_counter() - start,
+    }
+    logger.info(
+        "Sito statico in %s: %d pagine, %d rigenerate, %d scritte, %d fallite in %.2f s "
+        "con %d processi",
+        output, report["pages"], report["rendered"], report["written"], report["failed"],
+        report["elapsed_s"], workers
+    )
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--output", default=OUTPUT_DIR, help="cartella del sito")
+    parser.add_argument("--workers", type=int, help="processi di rendering (default: CPU)")
+    parser.add_argument("--force", action="store_true",
+                        help="rigenera tutte le pagine ignorando il manifest")
+    parser.add_argument("--inline-plotlyjs", action="store_true",
+                        help="include plotly.js in ogni pagina (file singoli, ~4 MB l'uno)")
+    parser.add_argument("--prices-dir", default=PRICE_STORE.prices_dir)
+    parser.add_argument("--holdings-dir", default=HOLDINGS_STORE.holdings_dir)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    PRICE_STORE.prices_dir = args.prices_dir
+    HOLDINGS_STORE.holdings_dir = args.holdings_dir
+    report = export_site(
+        args.output, workers=args.workers, force=args.force, inline_plotlyjs=args.inline_plotlyjs
+    )
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# I moduli dell'app sono nella cartella principale del progetto
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
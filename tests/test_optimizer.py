@@ -0,0 +1,56 @@
+import numpy as np
+
+from optimizer import CovarianceModel
+
+# Volatilità mensili molto diverse, come un indice azionario accanto a uno
+# monetario (solactive_str)
+MONTHLY_VOLATILITY = np.array([0.05, 0.0009, 0.04, 0.065])
+
+
+def simulated_returns(months=240, seed=7):
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.006, MONTHLY_VOLATILITY, (months, len(MONTHLY_VOLATILITY)))
+    returns[:, 2] += 0.6 * returns[:, 0]
+    return returns
+
+
+def sample_covariance(returns):
+    centered = returns - returns.mean(axis=0)
+    return centered.T @ centered / len(returns)
+
+
+def test_shrinkage_preserves_each_variance():
+    returns = simulated_returns()
+    model = CovarianceModel(["equity", "money_market", "europe", "emerging"])
+    model.update(returns)
+
+    covariance = model.covariance()
+
+    assert 0 < model.shrinkage < 1
+    np.testing.assert_allclose(np.diag(covariance), 12 * np.diag(sample_covariance(returns)))
+
+
+def test_shrinkage_only_scales_covariances():
+    returns = simulated_returns()
+    model = CovarianceModel(range(returns.shape[1]))
+    model.update(returns)
+
+    covariance = model.covariance()
+
+    off_diagonal = ~np.eye(returns.shape[1], dtype=bool)
+    np.testing.assert_allclose(
+        covariance[off_diagonal],
+        12 * (1 - model.shrinkage) * sample_covariance(returns)[off_diagonal]
+    )
+
+
+def test_incremental_updates_match_full_history():
+    returns = simulated_returns()
+    full = CovarianceModel(range(returns.shape[1]))
+    full.update(returns)
+    incremental = CovarianceModel(range(returns.shape[1]))
+    for chunk in np.array_split(returns, 7):
+        incremental.update(chunk)
+
+    np.testing.assert_allclose(incremental.covariance(), full.covariance())
+    assert np.isclose(incremental.shrinkage, full.shrinkage)
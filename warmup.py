@@ -0,0 +1,125 @@
+"""
+AssetExpl - Server-start warm-up
+Builds the shared figures, pre-rendered texts, JSON API responses and
+process-wide computations for every language and index in a thread pool, then
+starts the server (server.py: app and API) in the same process: the caches
+live in imported modules, so the sessions and the API find them already
+filled, and the health endpoint answers only once the warm-up is over.
+
+Usage:
+    python warmup.py [--workers 4] [--no-projections] [-- streamlit run options]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import product
+
+from api import API
+from composition_store import COMPOSITION_STORE
+from figure_cache import FIGURE_CACHE, HISTORY_CACHE
+from locales import available_languages, load_locale
+from markdown_cache import MARKDOWN_CACHE
+from monte_carlo import DEFAULT_PATHS, project
+from session_memory import process_rss
+
+# Il server parte da server.py, che monta sia l'app sia l'API JSON
+SERVER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "server.py")
+
+logger = logging.getLogger("assetexpl.warmup")
+
+
+def warm_up(languages=None, index_keys=None, workers=None, projections=True):
+    """Prepara le pagine (lingua x indice) e restituisce durata e memoria usata.
+
+    Prima i calcoli condivisi, le proiezioni Monte Carlo (una per indice e
+    orizzonte, uguale in tutte le lingue) e le risposte dell'API, poi le
+    pagine, tutto nello stesso pool di thread.
+    """
+    # app.py configura la pagina all'import: fuori da una sessione Streamlit
+    # emette solo un avviso, e i moduli importati sono gli stessi del server
+    import app
+
+    languages = list(languages or available_languages())
+    index_keys = list(index_keys or COMPOSITION_STORE.index_ids)
+    workers = workers or min(8, (os.cpu_count() or 1) + 1)
+    rss_start = process_rss()
+    start = time.perf_counter()
+
+    horizons = {
+        (index_key, app.projection_years(load_locale(language)["indices"][index_key]))
+        for language, index_key in product(languages, index_keys)
+    } if projections else set()
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="warmup") as pool:
+        shared = pool.submit(app.warm_up_shared)
+        api = pool.submit(API.warm_up, languages, index_keys)
+        percentiles = {
+            horizon: pool.submit(project, *horizon, n_paths=DEFAULT_PATHS, method="parametric")
+            for horizon in sorted(horizons)
+        }
+        pages = []
+        for language, index_key in product(languages, index_keys):
+            horizon = app.projection_years(load_locale(language)["indices"][index_key])
+            future = percentiles.get((index_key, horizon))
+            pages.append(pool.submit(
+                lambda language=language, index_key=index_key, future=future:
+                    app.warm_up_page(language, index_key, future.result() if future else None)
+            ))
+        shared.result()
+        api.result()
+        for page in pages:
+            page.result()
+
+    elapsed = time.perf_counter() - start
+    rss_end = process_rss()
+    report = {
+        "pages": len(pages),
+        "projections": len(percentiles),
+        "workers": workers,
+        "elapsed_s": elapsed,
+        "rss_start_bytes": rss_start,
+        "rss_end_bytes": rss_end,
+        "figures": FIGURE_CACHE.stats()["size"] + HISTORY_CACHE.stats()["size"],
+        "texts": MARKDOWN_CACHE.stats()["size"],
+        "api_responses": API.stats()["size"],
+    }
+    logger.info(
+        "Warm-up: %d pagine, %d proiezioni, %d figure, %d testi e %d risposte API in %.2f s "
+        "con %d thread, RSS %s",
+        report["pages"], report["projections"], report["figures"], report["texts"],
+        report["api_responses"], elapsed, workers,
+        f"{rss_start / 2**20:.0f} -> {rss_end / 2**20:.0f} MiB"
+        if rss_start is not None and rss_end is not None else "non disponibile"
+    )
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument("--workers", type=int, help="thread del pool (default: CPU + 1, max 8)")
+    parser.add_argument("--no-projections", action="store_true",
+                        help="non precalcolare le proiezioni Monte Carlo")
+    parser.add_argument("--warm-up-only", action="store_true",
+                        help="esegue il warm-up e termina senza avviare il server")
+    parser.add_argument("streamlit_args", nargs=argparse.REMAINDER,
+                        help="opzioni passate a `streamlit run` dopo --")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    warm_up(workers=args.workers, projections=not args.no_projections)
+    if args.warm_up_only:
+        return 0
+
+    # Il server parte nello stesso processo, con le cache già piene
+    from streamlit.web import cli
+
+    extra = [arg for arg in args.streamlit_args if arg != "--"]
+    return cli.main(["run", SERVER_PATH, *extra], prog_name="streamlit")
+
+
+if __name__ == "__main__":
+    sys.exit(main())